@@ -0,0 +1,53 @@
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.synthetic import synthetic_paths
+from dashboard.backends import make_backend
+from dashboard.stream import stream_avionics
+
+# =========================
+# BACKEND PANDAS vs DUCKDB (semua agregat halaman avionik per rerun)
+# =========================
+CHART_QUERIES = [
+    ("trade_summary", {}),
+    ("yearly_trades", {}),
+    ("tiv_yearly", {}),
+    ("top_counts", {"column": "recipient"}),
+    ("top_counts", {"column": "supplier"}),
+    ("top_counts", {"column": "weapon_description"}),
+    ("mean_age_by", {"column": "weapon_description"}),
+    ("mean_age_by", {"column": "recipient"}),
+]
+
+
+def rerun(backend, year_range, recipients):
+    for name, params in CHART_QUERIES:
+        backend.query(name, year_range, recipients, **params)
+
+
+def best_of(fn, repeat=5):
+    return min(timeit.repeat(fn, number=1, repeat=repeat))
+
+
+if __name__ == "__main__":
+    scales = [int(arg) for arg in sys.argv[1:]] or [1, 10, 100]
+    print(f"{'skala':<8}{'baris':>10}{'filter':>12}{'pandas (s)':>12}{'duckdb (s)':>12}{'speedup':>10}")
+    for scale in scales:
+        _, trade_path = synthetic_paths(scale)
+        df_av, _, _ = stream_avionics(trade_path)
+        pandas_backend = make_backend(df_av, "pandas")
+        duckdb_backend = make_backend(df_av, "duckdb")
+
+        recipients = df_av["recipient"].value_counts().index[:5].tolist()
+        for label, year_range, selected in [("semua", (1950, 2025), []), ("5 negara", (2000, 2020), recipients)]:
+            # Filter berganti tiap rerun: frame terfilter pandas tidak bisa dipakai ulang
+            def run_pandas():
+                pandas_backend._last = (None, None)
+                rerun(pandas_backend, year_range, selected)
+
+            t_pandas = best_of(run_pandas)
+            t_duckdb = best_of(lambda: rerun(duckdb_backend, year_range, selected))
+            print(f"{scale:<8}{len(df_av):>10}{label:>12}{t_pandas:>12.4f}{t_duckdb:>12.4f}{t_pandas / t_duckdb:>9.1f}x")
@@ -0,0 +1,242 @@
+import json
+import os
+import platform
+import sys
+import time
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+import plotly
+import plotly.express as px
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.synthetic import synthetic_paths
+from dashboard.cube import ExpenditureCube
+from dashboard.etl import SCORE_WEIGHTS
+from dashboard.mro import add_mro_estimate
+from dashboard.queries import (
+    expenditure_kpis, legend_order, ranking, heatmap,
+    trade_summary, yearly_trades, tiv_yearly, top_counts, mean_age_by,
+)
+from dashboard.render import adaptive_scatter
+from dashboard.scoring import ScoreEngine
+from dashboard.trade import (
+    AVIONICS_REF_PATH, build_avionics_frame, normalize_trade_register, read_avionics_reference,
+)
+
+# =========================
+# BENCHMARK PIPELINE (1× / 10× / 100×)
+# =========================
+# Setiap tahap kedua pipeline diukur terpisah pada dataset sintetis (lihat
+# benchmarks/synthetic.py). Hasil ditulis ke JSON dan dibandingkan dengan baseline
+# yang di-commit, sehingga regresi terlihat sebelum cakupan diperluas ke global.
+#
+#   python benchmarks/bench_pipeline.py                 # semua skala, bandingkan baseline
+#   python benchmarks/bench_pipeline.py 1 10            # skala tertentu
+#   python benchmarks/bench_pipeline.py --save-baseline # jadikan hasil ini baseline
+#   python benchmarks/bench_pipeline.py --check         # exit 1 jika ada regresi
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+BASELINE_PATH = os.path.join(RESULTS_DIR, "pipeline-baseline.json")
+LATEST_PATH = os.path.join(RESULTS_DIR, "pipeline-latest.json")
+
+SCALES = [1, 10, 100]
+REPEAT = 3
+REGRESSION_RATIO = 1.25
+# Tahap yang lebih cepat dari ini terlalu bising untuk dinilai regresi
+MIN_SECONDS = 0.005
+
+
+def best_of(fn, repeat=REPEAT):
+    # Waktu terbaik dari beberapa run + hasil run terakhir (input tahap berikutnya)
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def bench_figures(timings, prefix, figures):
+    build_total = 0.0
+    serialize_total = 0.0
+    for build in figures:
+        seconds, fig = best_of(build)
+        build_total += seconds
+        serialize_total += best_of(fig.to_json)[0]
+    timings[f"{prefix}.figure_build"] = build_total
+    timings[f"{prefix}.figure_serialize"] = serialize_total
+
+
+# =========================
+# PIPELINE BELANJA MILITER
+# =========================
+def bench_expenditure(path):
+    timings = {}
+
+    timings["expenditure.csv_load"], raw = best_of(lambda: pd.read_csv(path))
+    timings["expenditure.mro"], df = best_of(lambda: add_mro_estimate(raw))
+    timings["expenditure.cube_build"], cube = best_of(lambda: ExpenditureCube(df))
+
+    timings["expenditure.score_build"], engine = best_of(lambda: ScoreEngine(df))
+
+    year_range = (cube.year_min, cube.year_max)
+
+    def aggregates():
+        expenditure_kpis(cube, year_range)
+        for metric in ["Military_Expenditure_USD", "Estimated_MRO_USD", "Military_Expenditure_YoY"]:
+            legend_order(cube, metric, year_range)
+        ranking(cube, "Total_Score", year_range, scores=engine)
+        ranking(cube, "Estimated_MRO_USD", year_range)
+        return heatmap(cube, "Total_Score", year_range, scores=engine)
+
+    timings["expenditure.aggregates"], score_matrix = best_of(aggregates)
+
+    # Groupby/pivot langsung di pandas (jalur sebelum cube) sebagai pembanding
+    def pandas_aggregates():
+        df.groupby("Country_clean")["Total_Score"].mean().sort_values(ascending=False)
+        df.groupby("Country_clean")["Estimated_MRO_USD"].mean().sort_values(ascending=False)
+        return df.pivot_table(index="Country_clean", columns="Year", values="Total_Score", aggfunc="mean")
+
+    timings["expenditure.pandas_groupby_pivot"] = best_of(pandas_aggregates)[0]
+
+    # Total Score dinamis: ranking + heatmap bobot default, lalu 1000 vektor bobot sekaligus
+    def rescore():
+        engine.ranking(SCORE_WEIGHTS, year_range, renormalize=True)
+        return engine.heatmap(SCORE_WEIGHTS, year_range, renormalize=True)
+
+    timings["expenditure.rescore"] = best_of(rescore)[0]
+    weight_grid = np.random.default_rng(0).dirichlet(np.ones(len(SCORE_WEIGHTS)), 1000)
+    timings["expenditure.rescore_1000_weights"] = best_of(
+        lambda: engine.country_scores(weight_grid, year_range, renormalize=True)
+    )[0]
+
+    rank = ranking(cube, "Total_Score", year_range, scores=engine)
+    bench_figures(timings, "expenditure", [
+        lambda: px.line(df, x="Year", y="Military_Expenditure_USD", color="Country_clean", markers=True),
+        lambda: adaptive_scatter(df, x="GDP_per_Capita_USD", y="Military_Expenditure_USD",
+                                 hover_data=["Country_clean", "Year"], log_x=True, log_y=True),
+        lambda: px.bar(rank, x="Total_Score", y="Country_clean", orientation="h"),
+        lambda: px.imshow(score_matrix, aspect="auto"),
+    ])
+
+    return timings, {"expenditure_rows": len(df), "countries": len(cube.countries)}
+
+
+# =========================
+# PIPELINE PERDAGANGAN AVIONIK
+# =========================
+def bench_avionics(path):
+    timings = {}
+
+    # Sama dengan read_trade_register: baca (sniff separator) lalu normalisasi
+    timings["avionics.csv_load"], raw = best_of(
+        lambda: pd.read_csv(path, encoding="latin1", sep=None, engine="python"), repeat=1
+    )
+    timings["avionics.normalize"], df_trade = best_of(lambda: normalize_trade_register(raw.copy()))
+
+    df_av_ref = read_avionics_reference(AVIONICS_REF_PATH)
+    timings["avionics.whitelist_filter"], df_av = best_of(lambda: build_avionics_frame(df_trade, df_av_ref))
+
+    def aggregates():
+        trade_summary(df_av)
+        yearly_trades(df_av)
+        tiv_yearly(df_av)
+        for column in ["recipient", "supplier", "weapon_description"]:
+            top_counts(df_av, column)
+        mean_age_by(df_av, "weapon_description")
+        return mean_age_by(df_av, "recipient")
+
+    timings["avionics.aggregates"] = best_of(aggregates)[0]
+
+    yearly = yearly_trades(df_av)
+    suppliers = top_counts(df_av, "supplier").head(10)
+    bench_figures(timings, "avionics", [
+        lambda: px.line(yearly, x="year_of_order", y="transactions", markers=True),
+        lambda: px.bar(suppliers, x="supplier", y="transactions"),
+        lambda: px.histogram(df_av, x="weapon_age", nbins=20),
+        lambda: adaptive_scatter(df_av, x="number_ordered", y="number_delivered",
+                                 hover_data=["recipient", "weapon_designation"]),
+    ])
+
+    return timings, {"trade_rows": len(df_trade), "avionics_rows": len(df_av)}
+
+
+# =========================
+# HASIL & PERBANDINGAN
+# =========================
+def run(scales):
+    results = {
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "environment": {
+            "python": platform.python_version(),
+            "pandas": pd.__version__,
+            "numpy": np.__version__,
+            "plotly": plotly.__version__,
+            "machine": platform.machine(),
+        },
+        "scales": {},
+    }
+
+    for scale in scales:
+        expenditure_path, trade_path = synthetic_paths(scale)
+        exp_timings, exp_rows = bench_expenditure(expenditure_path)
+        av_timings, av_rows = bench_avionics(trade_path)
+
+        results["scales"][str(scale)] = {
+            "rows": {**exp_rows, **av_rows},
+            "seconds": {**exp_timings, **av_timings},
+        }
+        print(f"\n{scale}× — {exp_rows | av_rows}")
+        for stage, seconds in {**exp_timings, **av_timings}.items():
+            print(f"  {stage:<36}{seconds:>10.4f}s")
+
+    return results
+
+
+def regressions(results, baseline):
+    found = []
+    for scale, current in results["scales"].items():
+        previous = baseline["scales"].get(scale, {}).get("seconds", {})
+        for stage, seconds in current["seconds"].items():
+            before = previous.get(stage)
+            if before is None or max(seconds, before) < MIN_SECONDS:
+                continue
+            if seconds / before > REGRESSION_RATIO:
+                found.append((scale, stage, before, seconds))
+    return found
+
+
+def write_json(path, payload):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(payload, f, indent=2)
+        f.write("\n")
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    scales = [int(arg) for arg in args if arg.isdigit()] or SCALES
+
+    results = run(scales)
+    write_json(LATEST_PATH, results)
+
+    if "--save-baseline" in args:
+        write_json(BASELINE_PATH, results)
+        print(f"\nbaseline disimpan: {BASELINE_PATH}")
+        sys.exit(0)
+
+    if not os.path.exists(BASELINE_PATH):
+        print("\nbelum ada baseline (jalankan dengan --save-baseline)")
+        sys.exit(0)
+
+    with open(BASELINE_PATH, encoding="utf-8") as f:
+        found = regressions(results, json.load(f))
+
+    print(f"\nregresi (> {REGRESSION_RATIO:.2f}× baseline): {len(found)}")
+    for scale, stage, before, seconds in found:
+        print(f"  {scale}× {stage}: {before:.4f}s → {seconds:.4f}s ({seconds / before:.2f}×)")
+
+    if "--check" in args and found:
+        sys.exit(1)
@@ -0,0 +1,38 @@
+import os
+import sys
+import timeit
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dashboard.worldbank import WORLDBANK_FILES, read_worldbank
+
+# =========================
+# JALUR PANDAS LAMA (read_csv + melt + to_numeric)
+# =========================
+def read_naive(path):
+    frame = pd.read_csv(path, sep=";", encoding="utf-8-sig")
+    year_cols = [c for c in frame.columns if str(c).strip().isdigit()]
+    long_df = frame.melt(id_vars=["Country Code"], value_vars=year_cols, var_name="Year", value_name="value")
+    long_df["value"] = pd.to_numeric(long_df["value"], errors="coerce")
+    return long_df.dropna(subset=["value"])
+
+
+def best_of(fn, repeat=5):
+    return min(timeit.repeat(fn, number=1, repeat=repeat))
+
+
+if __name__ == "__main__":
+    print(f"{'file':<32}{'pandas (s)':>12}{'vektor (s)':>12}{'valid pandas':>14}{'valid vektor':>14}{'suspect':>9}")
+    for path in WORLDBANK_FILES:
+        naive = read_naive(path)
+        matrix = read_worldbank(path)
+        print(
+            f"{path:<32}"
+            f"{best_of(lambda: read_naive(path)):>12.4f}"
+            f"{best_of(lambda: read_worldbank(path)):>12.4f}"
+            f"{len(naive):>14}"
+            f"{int(matrix.valid.values.sum()):>14}"
+            f"{int(matrix.suspect.values.sum()):>9}"
+        )
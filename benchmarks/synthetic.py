@@ -0,0 +1,97 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dashboard.data import EXPENDITURE_PATH
+from dashboard.trade import TRADE_REGISTER_PATH
+
+# =========================
+# DATA SINTETIS (skala N×)
+# =========================
+# Dataset dibentuk dari file asli: setiap salinan ke-k mendapat negara "baru"
+# (nama + " #k") dan noise multiplikatif pada kolom angka, sehingga skala 10×/100×
+# meniru cakupan global (lebih banyak negara), bukan sekadar baris duplikat.
+SYNTHETIC_DIR = os.path.join("build", "bench")
+
+EXPENDITURE_NOISE_COLS = [
+    "Military_Expenditure_USD",
+    "GDP_USD",
+    "GDP_per_Capita_USD",
+]
+
+TRADE_NOISE_COLS = [
+    "Number ordered",
+    "Number delivered",
+    "SIPRI TIV per unit",
+    "SIPRI TIV for total order",
+    "SIPRI TIV of delivered weapons",
+]
+
+
+def _rename(values, k):
+    return values if k == 0 else values.where(values.isna(), values + f" #{k}")
+
+
+def _jitter(series, rng):
+    # Nilai kosong / non-angka ("?", "-") dibiarkan apa adanya
+    numeric = pd.to_numeric(series, errors="coerce")
+    noisy = (numeric * rng.lognormal(0, 0.1, len(series))).round(2)
+    return series.where(numeric.isna(), noisy.astype(str))
+
+
+def synthetic_expenditure(scale, seed=0, path=EXPENDITURE_PATH):
+    rng = np.random.default_rng(seed)
+    base = pd.read_csv(path)
+
+    copies = []
+    for k in range(scale):
+        copy = base.copy()
+        copy["Country_clean"] = _rename(copy["Country_clean"], k)
+        copy["Country"] = _rename(copy["Country"], k)
+        if k:
+            for col in EXPENDITURE_NOISE_COLS:
+                copy[col] = copy[col] * rng.lognormal(0, 0.1, len(copy))
+        copies.append(copy)
+
+    return pd.concat(copies, ignore_index=True)
+
+
+def synthetic_trade_register(scale, seed=0, path=TRADE_REGISTER_PATH):
+    # Dibaca sebagai teks mentah supaya CSV hasil tetap "kotor" seperti aslinya
+    rng = np.random.default_rng(seed)
+    base = pd.read_csv(path, sep=";", encoding="latin1", dtype=str, keep_default_na=False)
+
+    copies = []
+    for k in range(scale):
+        copy = base.copy()
+        copy["Recipient"] = _rename(copy["Recipient"], k)
+        if k:
+            for col in TRADE_NOISE_COLS:
+                copy[col] = _jitter(copy[col], rng)
+        copies.append(copy)
+
+    return pd.concat(copies, ignore_index=True)
+
+
+def synthetic_paths(scale, seed=0, directory=SYNTHETIC_DIR):
+    # CSV ditulis sekali per (skala, seed) lalu dipakai ulang antar run benchmark
+    os.makedirs(directory, exist_ok=True)
+    expenditure_path = os.path.join(directory, f"expenditure-x{scale}-s{seed}.csv")
+    trade_path = os.path.join(directory, f"trade-register-x{scale}-s{seed}.csv")
+
+    if not os.path.exists(expenditure_path):
+        synthetic_expenditure(scale, seed).to_csv(expenditure_path, index=False)
+    if not os.path.exists(trade_path):
+        synthetic_trade_register(scale, seed).to_csv(trade_path, sep=";", encoding="latin1", index=False)
+
+    return expenditure_path, trade_path
+
+
+if __name__ == "__main__":
+    for scale in [int(arg) for arg in sys.argv[1:]] or [1, 10, 100]:
+        for path in synthetic_paths(scale):
+            print(f"{path}: {os.path.getsize(path) / 1e6:.1f} MB")
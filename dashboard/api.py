@@ -0,0 +1,180 @@
+import json
+import os
+import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from dashboard.cube import ExpenditureCube
+from dashboard.data import DATASETS
+from dashboard.queries import QUERY_DATASETS, run_query, to_json_ready, validate_params
+from dashboard.scoring import ScoreEngine
+from dashboard.shared import attach
+from dashboard.stream import register_summaries
+
+# =========================
+# API HTTP/JSON (headless)
+# =========================
+# Endpoint lokal untuk job lain yang butuh agregat dashboard tanpa UI:
+#   GET  /health                     → status + stamp dataset + statistik cache
+#   GET  /queries                    → daftar query & dataset-nya
+#   GET  /register_summary           → ringkasan per tahun & per penerima seluruh register
+#   POST /query  {"query", "params"} → satu hasil
+#   POST /batch  {"requests": [...]} → banyak query, dieksekusi paralel
+# Hasil di-cache per (query, parameter, stamp dataset); data baru → key baru.
+API_HOST = os.environ.get("DASHBOARD_API_HOST", "127.0.0.1")
+API_PORT = int(os.environ.get("DASHBOARD_API_PORT", 8765))
+
+CACHE_ENTRIES = 1024
+BATCH_WORKERS = 8
+MAX_BATCH = 256
+
+
+def _not_object(value):
+    return f"request harus berupa objek JSON, bukan {type(value).__name__}"
+
+
+class BatchError(ValueError):
+    # Batch ditolak seluruhnya (400); results = error per entri (None jika entri valid)
+    def __init__(self, message, results):
+        super().__init__(message)
+        self.results = results
+
+
+class QueryService:
+    def __init__(self, cache_entries=CACHE_ENTRIES, workers=BATCH_WORKERS):
+        self.cache_entries = cache_entries
+        self._cache = OrderedDict()
+        self._cubes = {}
+        self._lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="api-query")
+        self.hits = 0
+        self.misses = 0
+
+    # ---------- Dataset ----------
+    def datasets(self):
+        expenditure = attach("expenditure", *DATASETS["expenditure"]())
+        avionics = attach("avionics", *DATASETS["avionics"]())
+
+        # Cube + ScoreEngine (Total_Score dengan bobot dari request) per stamp belanja militer
+        stamp = expenditure.attrs["stamp"]
+        with self._lock:
+            if stamp not in self._cubes:
+                self._cubes = {stamp: (ExpenditureCube(expenditure), ScoreEngine(expenditure))}
+            cube, scores = self._cubes[stamp]
+
+        return cube, scores, avionics, {"expenditure": stamp, "avionics": avionics.attrs["stamp"]}
+
+    # ---------- Query ----------
+    def run(self, name, params=None):
+        if name not in QUERY_DATASETS:
+            raise KeyError(f"query tidak dikenal: {name!r}")
+
+        # Parameter invalid → ValueError / TypeError (400) sebelum dataset & cache disentuh
+        params = validate_params(params)
+        cube, scores, avionics, stamps = self.datasets()
+        key = (name, json.dumps(params, sort_keys=True), stamps[QUERY_DATASETS[name]])
+
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return self._cache[key]
+            self.misses += 1
+
+        result = to_json_ready(run_query(name, params, cube, avionics, scores))
+
+        with self._lock:
+            self._cache[key] = result
+            while len(self._cache) > self.cache_entries:
+                self._cache.popitem(last=False)
+        return result
+
+    def run_one(self, request):
+        if not isinstance(request, dict):
+            return {"error": _not_object(request)}
+        try:
+            return {"result": self.run(request.get("query"), request.get("params"))}
+        except (KeyError, TypeError, ValueError) as exc:
+            return {"error": exc.args[0] if exc.args else str(exc)}
+
+    def run_batch(self, requests):
+        if not isinstance(requests, list):
+            raise ValueError("requests harus berupa list objek JSON")
+        if len(requests) > MAX_BATCH:
+            raise ValueError(f"maksimal {MAX_BATCH} query per batch")
+
+        # Validasi bentuk semua entri sebelum ada yang dijalankan di pool
+        errors = [None if isinstance(request, dict) else {"error": _not_object(request)} for request in requests]
+        if any(errors):
+            raise BatchError("batch berisi entri yang bukan objek JSON", errors)
+        return list(self._pool.map(self.run_one, requests))
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self._cache)}
+
+
+# =========================
+# HTTP HANDLER
+# =========================
+def make_handler(service):
+    class Handler(BaseHTTPRequestHandler):
+        def _send(self, status, payload):
+            body = json.dumps(payload).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _body(self):
+            length = int(self.headers.get("Content-Length", 0))
+            return json.loads(self.rfile.read(length) or b"{}")
+
+        def do_GET(self):
+            if self.path == "/health":
+                _, _, _, stamps = service.datasets()
+                self._send(200, {"status": "ok", "datasets": stamps, "cache": service.stats()})
+            elif self.path == "/queries":
+                self._send(200, QUERY_DATASETS)
+            elif self.path == "/register_summary":
+                # Seluruh trade register, bukan hanya subset avionik (lihat dashboard/stream.py)
+                self._send(200, {name: to_json_ready(frame) for name, frame in register_summaries().items()})
+            else:
+                self._send(404, {"error": f"path tidak dikenal: {self.path}"})
+
+        def do_POST(self):
+            try:
+                payload = self._body()
+                if self.path in ("/query", "/batch") and not isinstance(payload, dict):
+                    self._send(400, {"error": _not_object(payload)})
+                elif self.path == "/query":
+                    response = service.run_one(payload)
+                    self._send(400 if "error" in response else 200, response)
+                elif self.path == "/batch":
+                    self._send(200, {"results": service.run_batch(payload.get("requests", []))})
+                else:
+                    self._send(404, {"error": f"path tidak dikenal: {self.path}"})
+            except BatchError as exc:
+                self._send(400, {"error": str(exc), "results": exc.results})
+            except (json.JSONDecodeError, ValueError) as exc:
+                self._send(400, {"error": str(exc)})
+
+        def log_message(self, format, *args):
+            pass
+
+    return Handler
+
+
+def serve(host=API_HOST, port=API_PORT):
+    service = QueryService()
+    service.datasets()  # muat dataset sebelum menerima request
+
+    server = ThreadingHTTPServer((host, port), make_handler(service))
+    print(f"API dashboard di http://{host}:{server.server_address[1]}")
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    serve(port=int(sys.argv[1]) if len(sys.argv) > 1 else API_PORT)
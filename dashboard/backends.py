@@ -0,0 +1,152 @@
+import os
+import threading
+import warnings
+
+import pyarrow as pa
+
+from dashboard.queries import AVIONICS_QUERIES, SORT_DECIMALS, SUM_DECIMALS, filter_trades
+from dashboard.trade import TEXT_COLS
+
+try:
+    import duckdb
+except ImportError:  # opsional: pip install duckdb
+    duckdb = None
+
+# =========================
+# BACKEND QUERY AVIONIK (pluggable)
+# =========================
+# Halaman avionik meminta agregat lewat backend.query(nama, rentang tahun, penerima):
+#   - "pandas": referensi, memakai fungsi di dashboard/queries.py pada frame terfilter
+#   - "duckdb": tiap chart = satu query SQL atas tabel Arrow (zero-copy dari frame
+#     memory-mapped); filter tahun/penerima di-push ke scan dan dieksekusi paralel
+#     di semua core
+# Pilih dengan env DASHBOARD_BACKEND (default pandas). Chart yang butuh baris mentah
+# (scatter, histogram, tabel) tetap memakai filter pandas: Plotly mengonsumsi frame pandas.
+BACKEND = os.environ.get("DASHBOARD_BACKEND", "pandas")
+DUCKDB_THREADS = int(os.environ.get("DASHBOARD_DUCKDB_THREADS", os.cpu_count() or 1))
+
+# Kolom yang boleh dipakai sebagai dimensi group-by (nama kolom masuk ke teks SQL)
+GROUP_COLS = set(TEXT_COLS) | {"delivery_status"}
+
+
+class PandasBackend:
+    name = "pandas"
+
+    def __init__(self, df):
+        self.df = df
+        self._lock = threading.Lock()
+        self._last = (None, None)
+
+    def rows(self, year_range, recipients=None):
+        # Frame terfilter terakhir dipakai ulang oleh semua chart di rerun yang sama
+        key = (tuple(year_range), tuple(sorted(recipients or [])))
+        with self._lock:
+            if self._last[0] == key:
+                return self._last[1]
+        filtered = filter_trades(self.df, year_range, recipients)
+        with self._lock:
+            self._last = (key, filtered)
+        return filtered
+
+    def query(self, name, year_range, recipients=None, **params):
+        func, _ = AVIONICS_QUERIES[name]
+        return func(self.rows(year_range, recipients), **params)
+
+
+class DuckDBBackend:
+    name = "duckdb"
+
+    def __init__(self, df, threads=DUCKDB_THREADS):
+        self.df = df
+        # Disalin sekali per stamp ke tabel native DuckDB (kolumnar + zone map min/max),
+        # sehingga filter tahun benar-benar melewati row group yang tidak relevan
+        self.con = duckdb.connect(config={"threads": threads})
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        self.con.register("avionics_arrow", table)
+        self.con.execute("CREATE TABLE avionics AS SELECT * FROM avionics_arrow ORDER BY year_of_order")
+        self.con.unregister("avionics_arrow")
+
+    def rows(self, year_range, recipients=None):
+        # Baris mentah untuk Plotly tetap dari frame pandas (tanpa konversi hasil SQL)
+        return filter_trades(self.df, year_range, recipients)
+
+    @staticmethod
+    def _where(year_range, recipients):
+        clauses = ["year_of_order BETWEEN ? AND ?"]
+        params = [int(year_range[0]), int(year_range[1])]
+        if recipients:
+            clauses.append("recipient = ANY(?)")
+            params.append(list(recipients))
+        return " AND ".join(clauses), params
+
+    @staticmethod
+    def _group_col(column):
+        if column not in GROUP_COLS:
+            raise ValueError(f"kolom group-by tidak dikenal: {column!r}")
+        return column
+
+    def sql(self, name, column=None):
+        if name == "trade_summary":
+            return (
+                "SELECT count(*) AS transactions, count(DISTINCT recipient) AS importers, "
+                "count(DISTINCT supplier) AS suppliers, "
+                f"round(coalesce(sum(sipri_tiv_of_delivered_weapons), 0), {SUM_DECIMALS}) AS total_tiv "
+                "FROM avionics WHERE {where}"
+            )
+        if name == "yearly_trades":
+            return (
+                "SELECT year_of_order, count(*) AS transactions FROM avionics "
+                "WHERE {where} GROUP BY 1 ORDER BY 1"
+            )
+        if name == "tiv_yearly":
+            return (
+                f"SELECT year_of_order, round(sum(sipri_tiv_of_delivered_weapons), {SUM_DECIMALS}) "
+                "AS sipri_tiv_of_delivered_weapons "
+                "FROM avionics WHERE {where} GROUP BY 1 ORDER BY 1"
+            )
+        if name == "top_counts":
+            column = self._group_col(column)
+            return (
+                f'SELECT "{column}", count(*) AS transactions FROM avionics '
+                f'WHERE {{where}} GROUP BY 1 ORDER BY transactions DESC, CAST("{column}" AS VARCHAR)'
+            )
+        if name == "mean_age_by":
+            column = self._group_col(column)
+            return (
+                f'SELECT "{column}", avg(weapon_age) AS weapon_age FROM avionics '
+                f'WHERE {{where}} GROUP BY 1 '
+                f'ORDER BY round(avg(weapon_age), {SORT_DECIMALS}), CAST("{column}" AS VARCHAR)'
+            )
+        raise KeyError(f"query tidak dikenal: {name!r}")
+
+    def query(self, name, year_range, recipients=None, **params):
+        where, args = self._where(year_range, recipients)
+        sql = self.sql(name, **params).format(where=where)
+
+        # Cursor per query: aman dipakai paralel oleh beberapa sesi
+        result = self.con.cursor().execute(sql, args).df()
+
+        if name == "trade_summary":
+            row = result.iloc[0]
+            return {
+                "transactions": int(row["transactions"]),
+                "importers": int(row["importers"]),
+                "suppliers": int(row["suppliers"]),
+                "total_tiv": float(row["total_tiv"]),
+            }
+        return result
+
+
+BACKENDS = {
+    "pandas": PandasBackend,
+    "duckdb": DuckDBBackend,
+}
+
+
+def make_backend(df, name=BACKEND):
+    if name == "duckdb" and duckdb is None:
+        warnings.warn("DASHBOARD_BACKEND=duckdb tetapi paket duckdb tidak terpasang; memakai pandas")
+        name = "pandas"
+    if name not in BACKENDS:
+        raise ValueError(f"backend tidak dikenal: {name!r} (pilihan: {sorted(BACKENDS)})")
+    return BACKENDS[name](df)
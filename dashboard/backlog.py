@@ -0,0 +1,142 @@
+import numpy as np
+import pandas as pd
+
+from dashboard.trade import CURRENT_YEAR
+
+# =========================
+# 📦 BACKLOG PENGIRIMAN (order → delivery)
+# =========================
+# Setiap order terbuka sejak year_of_order sampai years_of_delivery: selama itu seluruh
+# number_ordered / sipri_tiv_for_total_order dihitung belum dikirim. Pada tahun kirim,
+# number_delivered / sipri_tiv_of_delivered_weapons tercatat sebagai pengiriman dan sisa
+# yang tidak terkirim (ordered - delivered, minimal 0) tetap terbuka sampai tahun berjalan.
+# Order tanpa tahun kirim terbuka sampai tahun berjalan.
+#
+# Semua order ditulis sekaligus ke array selisih (difference array) penerima × tahun:
+# +nilai di tahun order, (sisa - nilai) di tahun kirim. Satu bincount + cumsum sepanjang
+# tahun menghasilkan stok backlog per penerima per tahun; query = slicing grid.
+BACKLOG_STOCKS = {
+    "open_orders": "Order Terbuka",
+    "outstanding_units": "Unit Belum Dikirim",
+    "outstanding_tiv": "TIV Belum Dikirim",
+}
+
+BACKLOG_EVENTS = {
+    "new_orders": "Order Baru",
+    "ordered_units": "Unit Dipesan",
+    "delivered_units": "Unit Dikirim",
+    "delivered_tiv": "TIV Dikirim",
+}
+
+BACKLOG_UNITS = {
+    "tiv": "SIPRI TIV",
+    "units": "Unit",
+}
+
+
+class BacklogEngine:
+    def __init__(self, df, current_year=CURRENT_YEAR):
+        recipient = df["recipient"].astype("category")
+        self.recipients = np.array(recipient.cat.categories, dtype=object)
+        self.metrics = list(BACKLOG_STOCKS) + list(BACKLOG_EVENTS)
+
+        order_year = pd.to_numeric(df["year_of_order"], errors="coerce").to_numpy(float)
+        delivery_year = pd.to_numeric(df["years_of_delivery"], errors="coerce").to_numpy(float)
+        valid = ~np.isnan(order_year) & recipient.notna().to_numpy()
+
+        def column(name):
+            return np.nan_to_num(pd.to_numeric(df[name], errors="coerce").to_numpy(float)[valid])
+
+        ordered, delivered = column("number_ordered"), column("number_delivered")
+        tiv_total, tiv_delivered = column("sipri_tiv_for_total_order"), column("sipri_tiv_of_delivered_weapons")
+        order_year, delivery_year = order_year[valid], delivery_year[valid]
+
+        self.year_min = int(order_year.min()) if len(order_year) else current_year
+        self.year_max = int(np.nanmax(np.append(delivery_year, current_year)))
+        self.years = np.arange(self.year_min, self.year_max + 1)
+        n_years = len(self.years)
+
+        # Tahun kirim sebelum tahun order dipotong ke tahun order; tanpa tahun kirim → di luar grid
+        has_delivery = ~np.isnan(delivery_year)
+        o = order_year.astype(np.int64) - self.year_min
+        d = np.clip(np.where(has_delivery, delivery_year - self.year_min, n_years), o, n_years).astype(np.int64)
+
+        # Nilai terbuka sebelum & sesudah tahun kirim (komponen × order)
+        remaining_units = np.where(has_delivery, np.clip(ordered - delivered, 0, None), 0.0)
+        before = np.vstack([np.ones(len(o)), ordered, tiv_total])
+        after = np.vstack([
+            (remaining_units > 0).astype(float),
+            remaining_units,
+            np.where(has_delivery, np.clip(tiv_total - tiv_delivered, 0, None), 0.0),
+        ])
+        events = np.vstack([np.ones(len(o)), ordered, delivered * has_delivery, tiv_delivered * has_delivery])
+
+        # Indeks datar (komponen, penerima, tahun) pada grid selebar n_years + 1 (kolom
+        # terakhir menampung perubahan "setelah grid" dan dibuang)
+        r = recipient.cat.codes.to_numpy()[valid].astype(np.int64)
+        width = n_years + 1
+        plane = len(self.recipients) * width
+        at_order = r * width + o
+        at_delivery = r * width + d
+
+        stock_index = np.concatenate([
+            (np.arange(len(BACKLOG_STOCKS))[:, None] * plane + at_order).ravel(),
+            (np.arange(len(BACKLOG_STOCKS))[:, None] * plane + at_delivery).ravel(),
+        ])
+        stock_diff = np.bincount(
+            stock_index, weights=np.concatenate([before.ravel(), (after - before).ravel()]),
+            minlength=len(BACKLOG_STOCKS) * plane,
+        )
+        stocks = np.cumsum(stock_diff.reshape(len(BACKLOG_STOCKS), len(self.recipients), width), axis=2)
+
+        event_at = np.vstack([at_order, at_order, at_delivery, at_delivery])
+        event_index = (np.arange(len(BACKLOG_EVENTS))[:, None] * plane + event_at).ravel()
+        flows = np.bincount(event_index, weights=events.ravel(), minlength=len(BACKLOG_EVENTS) * plane)
+        flows = flows.reshape(len(BACKLOG_EVENTS), len(self.recipients), width)
+
+        # (metrik × penerima × tahun); pembulatan menghapus sisa floating point cumsum
+        self.grid = np.round(np.concatenate([stocks, flows])[:, :, :n_years], 9)
+
+    # ---------- Slicing ----------
+    def _year_slice(self, year_range):
+        start = min(max(int(year_range[0]), self.year_min), self.year_max + 1) - self.year_min
+        stop = min(max(int(year_range[1]), self.year_min - 1), self.year_max) - self.year_min + 1
+        return start, max(stop, start)
+
+    def _recipient_mask(self, recipients):
+        if not recipients:
+            return np.ones(len(self.recipients), dtype=bool)
+        return np.isin(self.recipients, list(recipients))
+
+    # ---------- Query ----------
+    def timeline(self, year_range, recipients=None):
+        # Stok backlog & arus order/pengiriman per tahun kalender. Rentang tahun = jendela
+        # tampilan: order lama yang masih terbuka di dalam jendela tetap dihitung
+        start, stop = self._year_slice(year_range)
+        values = self.grid[:, self._recipient_mask(recipients), start:stop].sum(axis=1)
+        return pd.DataFrame(
+            values.T, index=pd.Index(self.years[start:stop], name="year"), columns=self.metrics
+        ).reset_index()
+
+    def pipeline(self, year_range, recipients=None):
+        # Per penerima: stok backlog di akhir rentang + order & pengiriman selama rentang.
+        # clear_years = TIV belum dikirim / rata-rata TIV dikirim per tahun pada rentang
+        start, stop = self._year_slice(year_range)
+        mask = self._recipient_mask(recipients)
+        columns = list(BACKLOG_STOCKS) + list(BACKLOG_EVENTS)
+        if stop == start:
+            return pd.DataFrame(columns=["recipient"] + columns + ["clear_years"])
+
+        n_stocks = len(BACKLOG_STOCKS)
+        window = self.grid[:, mask, start:stop]
+        frame = pd.DataFrame(
+            np.vstack([window[:n_stocks, :, -1], window[n_stocks:].sum(axis=2)]).T,
+            columns=columns,
+        )
+        frame.insert(0, "recipient", self.recipients[mask])
+
+        rate = frame["delivered_tiv"] / (stop - start)
+        frame["clear_years"] = (frame["outstanding_tiv"] / rate.where(rate > 0)).round(1)
+
+        active = frame[columns].to_numpy().any(axis=1)
+        return frame[active].sort_values("outstanding_tiv", ascending=False, kind="stable").reset_index(drop=True)
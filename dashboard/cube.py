@@ -0,0 +1,137 @@
+import numpy as np
+import pandas as pd
+
+# =========================
+# FILTER CUBE (negara × tahun)
+# =========================
+# Semua agregat dashboard belanja militer (KPI, urutan legenda, ranking, heatmap)
+# bergantung pada rentang tahun + daftar negara saja. Cube menyimpan sum & count per
+# sel negara×tahun beserta prefix sum sepanjang tahun, sehingga setiap kombinasi
+# filter dijawab dengan slicing array O(negara), tanpa groupby/pivot baru.
+CUBE_METRICS = [
+    "Military_Expenditure_USD",
+    "Military_Expenditure_YoY",
+    "Estimated_MRO_USD",
+    "Political_Stability_Index",
+]
+
+
+class ExpenditureCube:
+    def __init__(self, df, metrics=CUBE_METRICS, country_col="Country_clean", year_col="Year"):
+        self.countries = np.array(sorted(df[country_col].unique()), dtype=object)
+        self.year_min = int(df[year_col].min())
+        self.year_max = int(df[year_col].max())
+        self.years = np.arange(self.year_min, self.year_max + 1)
+
+        shape = (len(self.countries), len(self.years))
+        country_idx = pd.Categorical(df[country_col], categories=self.countries).codes
+        year_idx = df[year_col].to_numpy(int) - self.year_min
+
+        # Jumlah baris per sel (untuk nunique negara & tahun terbaru)
+        rows = np.zeros(shape)
+        np.add.at(rows, (country_idx, year_idx), 1)
+        self.rows = rows
+        self._rows_prefix = self._prefix(rows)
+
+        self.sums = {}
+        self.counts = {}
+        self._sum_prefix = {}
+        self._count_prefix = {}
+        for metric in metrics:
+            values = pd.to_numeric(df[metric], errors="coerce").to_numpy(float)
+            valid = ~np.isnan(values)
+
+            sums = np.zeros(shape)
+            counts = np.zeros(shape)
+            np.add.at(sums, (country_idx[valid], year_idx[valid]), values[valid])
+            np.add.at(counts, (country_idx[valid], year_idx[valid]), 1)
+
+            self.sums[metric] = sums
+            self.counts[metric] = counts
+            self._sum_prefix[metric] = self._prefix(sums)
+            self._count_prefix[metric] = self._prefix(counts)
+
+    @staticmethod
+    def _prefix(cells):
+        return np.concatenate([np.zeros((cells.shape[0], 1)), np.cumsum(cells, axis=1)], axis=1)
+
+    # ---------- Helper filter ----------
+    def _year_slice(self, year_range):
+        start = min(max(int(year_range[0]), self.year_min), self.year_max + 1) - self.year_min
+        stop = min(max(int(year_range[1]), self.year_min - 1), self.year_max) - self.year_min + 1
+        return start, max(stop, start)
+
+    def _country_mask(self, countries):
+        if not countries:
+            return np.ones(len(self.countries), dtype=bool)
+        return np.isin(self.countries, list(countries))
+
+    def _range(self, prefix, year_range):
+        start, stop = self._year_slice(year_range)
+        return prefix[:, stop] - prefix[:, start]
+
+    def _present(self, year_range, countries):
+        # Negara yang punya minimal satu baris di rentang tahun (sama seperti hasil groupby)
+        return self._country_mask(countries) & (self._range(self._rows_prefix, year_range) > 0)
+
+    # ---------- Query API ----------
+    def country_count(self, year_range, countries=None):
+        return int(self._present(year_range, countries).sum())
+
+    def total(self, metric, year_range, countries=None):
+        mask = self._country_mask(countries)
+        return float(self._range(self._sum_prefix[metric], year_range)[mask].sum())
+
+    def mean(self, metric, year_range, countries=None):
+        mask = self._country_mask(countries)
+        total = self._range(self._sum_prefix[metric], year_range)[mask].sum()
+        count = self._range(self._count_prefix[metric], year_range)[mask].sum()
+        return float(total / count) if count else np.nan
+
+    def mean_by_country(self, metric, year_range, countries=None, ascending=False):
+        present = self._present(year_range, countries)
+        sums = self._range(self._sum_prefix[metric], year_range)[present]
+        counts = self._range(self._count_prefix[metric], year_range)[present]
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            means = np.where(counts > 0, sums / counts, np.nan)
+
+        series = pd.Series(means, index=pd.Index(self.countries[present], name="Country_clean"), name=metric)
+        return series.sort_values(ascending=ascending, kind="stable")
+
+    def latest_year(self, year_range, countries=None):
+        start, stop = self._year_slice(year_range)
+        mask = self._country_mask(countries)
+        has_rows = self.rows[mask, start:stop].sum(axis=0) > 0
+        if not has_rows.any():
+            return None
+        return int(self.years[start:stop][has_rows][-1])
+
+    def values_at(self, metric, year, countries=None, ascending=False):
+        if year is None:
+            return pd.Series(dtype=float, index=pd.Index([], name="Country_clean"), name=metric)
+
+        j = int(year) - self.year_min
+        mask = self._country_mask(countries) & (self.rows[:, j] > 0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            values = self.sums[metric][mask, j] / self.counts[metric][mask, j]
+
+        series = pd.Series(values, index=pd.Index(self.countries[mask], name="Country_clean"), name=metric)
+        return series.sort_values(ascending=ascending, kind="stable")
+
+    def heatmap(self, metric, year_range, countries=None):
+        start, stop = self._year_slice(year_range)
+        present = self._present(year_range, countries)
+
+        sums = self.sums[metric][present, start:stop]
+        counts = self.counts[metric][present, start:stop]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            cells = np.where(counts > 0, sums / counts, np.nan)
+
+        frame = pd.DataFrame(
+            cells,
+            index=pd.Index(self.countries[present], name="Country_clean"),
+            columns=pd.Index(self.years[start:stop], name="Year"),
+        )
+        # pivot_table membuang baris/kolom yang seluruhnya kosong
+        return frame.dropna(how="all").dropna(axis=1, how="all")
@@ -0,0 +1,226 @@
+import os
+
+import pandas as pd
+import streamlit as st
+
+from dashboard import etl, factors, fleet, mro, stream, trade
+from dashboard.backends import BACKEND, make_backend
+from dashboard.backlog import BacklogEngine
+from dashboard.cube import ExpenditureCube
+from dashboard.ingest import load_ingested_avionics
+from dashboard.fleet import attach_fleet_age, build_fleet_age, build_recipient_index
+from dashboard.flows import TradeFlows
+from dashboard.mro import MroEngine, add_mro_estimate
+from dashboard.scoring import ScoreEngine
+from dashboard.shared import attach, version_stamp
+from dashboard.snapshot import (
+    file_hash,
+    load_avionics_reference,
+    load_trade_register,
+    read_snapshot,
+    snapshot_path,
+    write_snapshot,
+    _remove_stale,
+)
+from dashboard.stream import load_streamed_avionics, should_stream
+from dashboard.trade import TRADE_REGISTER_PATH, AVIONICS_REF_PATH, build_avionics_frame
+
+# =========================
+# DATA-ACCESS LAYER BERSAMA
+# =========================
+# Setiap halaman hanya memanggil loader miliknya sendiri, sehingga dataset halaman
+# lain tidak pernah dimuat. Frame dipakai bersama oleh semua halaman/sesi/proses.
+EXPENDITURE_PATH = "df_asia_final.csv"
+
+
+def data_version(*paths):
+    # Versi dataset murah (mtime + ukuran file sumber), bahan stamp di dashboard/shared.py
+    parts = []
+    for path in paths:
+        stat = os.stat(path)
+        parts.append(f"{stat.st_mtime_ns}-{stat.st_size}")
+    return "|".join(parts)
+
+
+def code_version(*modules):
+    # Perubahan logika builder (deploy baru) juga harus menghasilkan stamp baru
+    return data_version(*(module.__file__ for module in modules))
+
+
+# ---------- Belanja militer ----------
+def expenditure_version():
+    return data_version(EXPENDITURE_PATH)
+
+
+def _build_expenditure():
+    # Avg_Equipment_Age (usia armada per negara × tahun dari trade register) → Age_Factor MRO
+    df = attach_fleet_age(pd.read_csv(EXPENDITURE_PATH), load_fleet_age())
+    return add_mro_estimate(df)
+
+
+def expenditure_dataset():
+    fleet_stamp, _ = fleet_dataset()
+    return version_stamp(expenditure_version(), fleet_stamp, code_version(mro, factors)), _build_expenditure
+
+
+def load_expenditure():
+    # Satu frame memory-mapped per proses, dipakai bersama oleh semua sesi & replika
+    # (lihat dashboard/shared.py); tanpa salinan pickle per panggilan
+    return attach("expenditure", *expenditure_dataset())
+
+
+@st.cache_resource(max_entries=2)
+def _expenditure_cube(stamp, _df):
+    return ExpenditureCube(_df)
+
+
+def load_expenditure_cube():
+    # Cube read-only, satu instance per proses per stamp frame yang sedang disajikan
+    df = load_expenditure()
+    return _expenditure_cube(df.attrs["stamp"], df)
+
+
+# ---------- Perdagangan avionik ----------
+def avionics_version():
+    return data_version(TRADE_REGISTER_PATH, AVIONICS_REF_PATH)
+
+
+def _build_avionics():
+    # Hasil ingest delta terakhir (lihat dashboard/ingest.py) dipakai langsung jika
+    # masih cocok dengan file sumber
+    df_av = load_ingested_avionics()
+    if df_av is not None:
+        return df_av
+
+    # Register besar (global / multi-feed) diproses per batch; hanya subset avionik
+    # yang tersisa di memori (lihat dashboard/stream.py)
+    if should_stream(TRADE_REGISTER_PATH):
+        return load_streamed_avionics(TRADE_REGISTER_PATH, AVIONICS_REF_PATH)
+
+    # Trade register & referensi avionik dibaca dari snapshot Arrow (lihat dashboard/snapshot.py);
+    # CSV hanya di-parse ulang jika hash file sumber berubah
+    df_trade = load_trade_register()
+    df_av_ref = load_avionics_reference()
+
+    return build_avionics_frame(df_trade, df_av_ref)
+
+
+def avionics_dataset():
+    return version_stamp(avionics_version(), code_version(trade, stream, factors)), _build_avionics
+
+
+def load_avionics():
+    return attach("avionics", *avionics_dataset())
+
+
+@st.cache_resource(max_entries=2)
+def _avionics_backend(name, stamp, _df):
+    return make_backend(_df, name)
+
+
+def load_avionics_backend():
+    # Backend query (pandas / duckdb, lihat dashboard/backends.py), satu per proses per stamp
+    df = load_avionics()
+    return _avionics_backend(BACKEND, df.attrs["stamp"], df)
+
+
+@st.cache_resource(max_entries=2)
+def _trade_flows(stamp, _df):
+    return TradeFlows(_df)
+
+
+def load_trade_flows():
+    # Tensor arus supplier → penerima (lihat dashboard/flows.py), satu per proses per stamp
+    df = load_avionics()
+    return _trade_flows(df.attrs["stamp"], df)
+
+
+@st.cache_resource(max_entries=2)
+def _backlog_engine(stamp, _df):
+    return BacklogEngine(_df)
+
+
+def load_backlog_engine():
+    # Grid backlog penerima × tahun (lihat dashboard/backlog.py), satu per proses per stamp
+    df = load_avionics()
+    return _backlog_engine(df.attrs["stamp"], df)
+
+
+# ---------- Indeks penerima → negara & usia armada ----------
+# Join trade register ↔ belanja militer dihitung sekali per versi register dan dipakai
+# bersama kedua halaman (lihat dashboard/fleet.py); frame kecil (negara × tahun).
+def _build_recipient_index():
+    # Nama negara diambil dari frame belanja militer mentah (bukan load_expenditure,
+    # yang sendiri bergantung pada usia armada)
+    countries = pd.read_csv(EXPENDITURE_PATH, usecols=["Country_clean"])["Country_clean"].dropna().unique()
+    return build_recipient_index(load_avionics()["recipient"].cat.categories, countries)
+
+
+def recipient_index_dataset():
+    avionics_stamp, _ = avionics_dataset()
+    return version_stamp(avionics_stamp, expenditure_version(), code_version(fleet, etl)), _build_recipient_index
+
+
+def load_recipient_index():
+    return attach("recipient_index", *recipient_index_dataset())
+
+
+def fleet_snapshot_path():
+    # Hash isi sumber + kode builder (bukan mtime): snapshot tetap berlaku lintas deploy/host
+    sources = (TRADE_REGISTER_PATH, AVIONICS_REF_PATH, EXPENDITURE_PATH)
+    modules = (fleet, trade, stream, factors, etl)
+    return snapshot_path("fleet_age", version_stamp(*map(file_hash, sources), *(file_hash(m.__file__) for m in modules)))
+
+
+def _build_fleet_age():
+    # Snapshot persisten → frame belanja militer (yang butuh usia armada untuk MRO) bisa
+    # dibangun tanpa membangun frame avionik; avionik hanya dimuat jika snapshot belum ada
+    path = fleet_snapshot_path()
+    if os.path.exists(path):
+        return read_snapshot(path)
+
+    df = build_fleet_age(load_avionics(), load_recipient_index())
+    write_snapshot(df, path)
+    _remove_stale("fleet_age", path)
+    return df
+
+
+def fleet_dataset():
+    index_stamp, _ = recipient_index_dataset()
+    return version_stamp(index_stamp, code_version(fleet)), _build_fleet_age
+
+
+def load_fleet_age():
+    return attach("fleet_age", *fleet_dataset())
+
+
+# ---------- Engine skenario MRO ----------
+@st.cache_resource(max_entries=2)
+def _mro_engine(stamp, _df):
+    return MroEngine(_df)
+
+
+def load_mro_engine():
+    df = load_expenditure()
+    return _mro_engine(df.attrs["stamp"], df)
+
+
+# ---------- Engine Total Score (bobot & normalisasi dinamis) ----------
+@st.cache_resource(max_entries=2)
+def _score_engine(stamp, _df):
+    return ScoreEngine(_df)
+
+
+def load_score_engine():
+    df = load_expenditure()
+    return _score_engine(df.attrs["stamp"], df)
+
+
+# Dataset yang dipublikasikan oleh `python -m dashboard.shared`
+# (urutan = urutan dependensi build)
+DATASETS = {
+    "avionics": avionics_dataset,
+    "recipient_index": recipient_index_dataset,
+    "fleet_age": fleet_dataset,
+    "expenditure": expenditure_dataset,
+}
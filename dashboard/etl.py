@@ -0,0 +1,436 @@
+import hashlib
+import os
+import sys
+import time
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+import pycountry
+import pycountry_convert
+
+from dashboard.snapshot import file_hash, write_snapshot, read_snapshot
+from dashboard.worldbank import read_worldbank, to_long
+
+# =========================
+# KONFIGURASI SUMBER
+# =========================
+SIPRI_SOURCES = {
+    "Military_Expenditure_USD": "Military expenditure by country in constant (2023) US$.xlsx",
+    "Military_Expenditure_pct_GDP": "Military expenditure as share of GDP.xlsx",
+    "Military_Expenditure_pct_Govt": "Military expenditure (% of government expenditure).xlsx",
+}
+
+WORLDBANK_SOURCES = {
+    "GDP_USD": "gdgcurrect_us_worldbank.csv",
+    "GDP_per_Capita_USD": "gdp_perkapita_worldbank.csv",
+    "Political_Stability_Index": "political_stability.csv",
+}
+
+# File yang dibaca dashboard (di-commit). Pipeline menulis ke build/ kecuali diminta
+# eksplisit menimpa file ini (--overwrite); lihat parity_report untuk perbedaannya.
+SHIPPED_PATH = "df_asia_final.csv"
+OUTPUT_PATH = os.path.join("build", "df_asia_final.csv")
+ETL_CACHE_DIR = os.environ.get("DASHBOARD_ETL_CACHE_DIR", os.path.join("build", "etl"))
+
+# Naikkan jika logika salah satu stage berubah
+ETL_VERSION = "4"
+
+# =========================
+# METODE
+# =========================
+# "shipped" (default) mereproduksi df_asia_final.csv (diuji di tests/test_etl.py):
+#   - CSV World Bank di-parse apa adanya (pd.to_numeric → sel bertitik ribuan jadi NaN)
+#     dan di-join ke SIPRI lewat nama negara mentah
+#   - GDP & pct_Govt kosong diisi median per tahun atas semua baris SIPRI (sebelum filter
+#     Asia); GDP yang masih kosong (tahun tanpa data World Bank) diisi median seluruh kolom
+#   - pct_GDP = belanja (USD juta) / GDP × 100, 0 jika GDP tahun itu tidak ada
+#   - Brunei & Türkiye tidak ikut (tidak dikenali pycountry saat file dibuat)
+#   - Country hanya terisi untuk SHIPPED_LABELLED negara dengan total belanja terbesar
+#   - YoY terhadap baris sebelumnya (termasuk lompatan tahun), Score_Growth dari YoY mentah
+# "revised" (opt-in, --revised) memuat koreksi yang disengaja; lihat README → ETL Pipeline.
+ETL_METHODS = ("shipped", "revised")
+DEFAULT_METHOD = "shipped"
+
+SHIPPED_EXCLUDED = {"BRN", "TUR"}
+SHIPPED_LABELLED = 10
+SHIPPED_YEAR_MEDIAN = ["GDP_USD", "Military_Expenditure_pct_Govt"]
+
+CONTINENT = "Asia"
+
+# Bobot composite score (lihat README → Methodology)
+SCORE_WEIGHTS = {
+    "Score_Expenditure": 0.4,
+    "Score_Growth": 0.3,
+    "Score_pctGovt": 0.2,
+    "Score_Politics": 0.1,
+}
+
+YOY_CLIP = (-50, 100)
+
+# Nama negara versi SIPRI yang tidak dikenali pycountry.lookup
+COUNTRY_ALIASES = {
+    "Brunei": "BRN",
+    "Cape Verde": "CPV",
+    "Congo, DR": "COD",
+    "Congo, Republic": "COG",
+    "Cote d'Ivoire": "CIV",
+    "Gambia, The": "GMB",
+    "Korea, North": "PRK",
+    "Korea, South": "KOR",
+    "Russia": "RUS",
+    "Timor Leste": "TLS",
+    "Yemen, North": "YEM",  # 1988–1989 (sebelum unifikasi), seperti df_asia_final.csv
+}
+
+# Country_clean yang dipakai df_asia_final.csv jika berbeda dari nama pycountry
+COUNTRY_CLEAN_NAMES = {
+    "BRN": "Brunei",
+    "LAO": "Lao People's Democratic Republic",
+}
+
+OUTPUT_COLUMNS = [
+    "Country", "Year",
+    "Military_Expenditure_USD", "Military_Expenditure_pct_Govt", "Military_Expenditure_pct_GDP",
+    "GDP_USD", "GDP_per_Capita_USD", "Political_Stability_Index",
+    "Military_Expenditure_missing", "Political_Stability_missing", "Military_Expenditure_pct_Govt_missing",
+    "Country_clean", "Continent",
+    "Military_Expenditure_YoY", "Military_Expenditure_YoY_Clipped",
+    "Score_Expenditure", "Score_Growth", "Score_pctGovt", "Score_Politics",
+    "Total_Score",
+]
+
+
+# =========================
+# NORMALISASI NEGARA (pycountry)
+# =========================
+@lru_cache(maxsize=None)
+def country_iso3(name):
+    if name in COUNTRY_ALIASES:
+        return COUNTRY_ALIASES[name]
+    try:
+        return pycountry.countries.lookup(name).alpha_3
+    except LookupError:
+        # Nama region/agregat (mis. "South East Asia") atau negara yang sudah bubar
+        return None
+
+
+@lru_cache(maxsize=None)
+def country_clean(iso3):
+    if iso3 in COUNTRY_CLEAN_NAMES:
+        return COUNTRY_CLEAN_NAMES[iso3]
+    country = pycountry.countries.get(alpha_3=iso3)
+    return getattr(country, "common_name", None) or country.name
+
+
+@lru_cache(maxsize=None)
+def country_continent(iso3):
+    alpha2 = pycountry.countries.get(alpha_3=iso3).alpha_2
+    try:
+        code = pycountry_convert.country_alpha2_to_continent_code(alpha2)
+    except KeyError:
+        return None
+    return pycountry_convert.convert_continent_code_to_continent_name(code)
+
+
+# =========================
+# STAGE 1 — WIDE → LONG
+# =========================
+def _melt_years(frame, id_col, value_name):
+    year_cols = [c for c in frame.columns if str(c).strip().isdigit()]
+    long_df = frame.melt(id_vars=[id_col], value_vars=year_cols, var_name="Year", value_name=value_name)
+    long_df["Year"] = long_df["Year"].astype(str).str.strip().astype("int64")
+    long_df[value_name] = pd.to_numeric(long_df[value_name], errors="coerce")
+    return long_df.dropna(subset=[value_name])
+
+
+def read_sipri_long(path, value_name):
+    frame = pd.read_excel(path)
+    frame = frame.rename(columns={frame.columns[0]: "Country"})
+
+    long_df = _melt_years(frame, "Country", value_name)
+    # Nama yang tidak dikenali (region/agregat) tetap disimpan: metode "shipped"
+    # menghitung median per tahun atas semua baris
+    long_df["iso3"] = long_df["Country"].map(country_iso3)
+    return long_df.reset_index(drop=True)
+
+
+def read_worldbank_long(path, value_name, reference=None):
+    return to_long(read_worldbank(path, reference), value_name)
+
+
+def read_worldbank_shipped(path, value_name):
+    # Parse seperti saat df_asia_final.csv dibuat: tanpa rekonstruksi besaran, baris
+    # yang terpotong koma tetap terbaca dengan nama negara sebelum koma
+    frame = pd.read_csv(path, sep=";", encoding="utf-8-sig", dtype=str)
+    long_df = _melt_years(frame, "Country Name", value_name).rename(columns={"Country Name": "Country"})
+    return long_df.drop_duplicates(["Country", "Year"]).reset_index(drop=True)
+
+
+# Perkiraan kasar GDP dari SIPRI (belanja militer / share of GDP), dipakai sebagai
+# referensi besaran untuk negara yang semua nilai GDP World Bank-nya ambigu
+def gdp_reference(sources):
+    wide = lambda col: sources[col].pivot_table(index="iso3", columns="Year", values=col)
+    return wide("Military_Expenditure_USD") * 1e6 / wide("Military_Expenditure_pct_GDP")
+
+
+# Sumber World Bank yang butuh referensi besaran dari sumber SIPRI
+WORLDBANK_REFERENCES = {"GDP_USD": gdp_reference}
+
+
+def worldbank_references(sources):
+    return {col: build(sources) for col, build in WORLDBANK_REFERENCES.items()}
+
+
+# =========================
+# CACHE PER STAGE (berbasis hash konten)
+# =========================
+def frame_hash(*frames):
+    digest = hashlib.sha256(ETL_VERSION.encode())
+    for frame in frames:
+        digest.update(",".join(map(str, frame.columns)).encode())
+        digest.update(pd.util.hash_pandas_object(frame, index=False).values.tobytes())
+    return digest.hexdigest()[:16]
+
+
+def source_key(col, path, reference=None, method=None):
+    key = f"{col}-v{ETL_VERSION}-{file_hash(path)}"
+    if method is not None:
+        key += f"-{method}"
+    if reference is not None:
+        key += f"-{frame_hash(reference.reset_index())}"
+    return key
+
+
+def stage_path(stage, key):
+    return os.path.join(ETL_CACHE_DIR, stage, f"{key}.arrow")
+
+
+def cached_stage(stage, key, build, stats):
+    path = stage_path(stage, key)
+    if os.path.exists(path):
+        stats["cached"] += 1
+        return read_snapshot(path)
+
+    stats["computed"] += 1
+    df = build()
+    write_snapshot(df, path)
+    return df
+
+
+# =========================
+# STAGE 2 — JOIN PER PARTISI TAHUN
+# =========================
+def build_year_partition(parts, method=DEFAULT_METHOD):
+    if method == "shipped":
+        return build_year_partition_shipped(parts)
+
+    base = parts["Military_Expenditure_USD"][["iso3", "Country", "Year", "Military_Expenditure_USD"]]
+
+    base = base[base["iso3"].notna()]
+    base = base[base["iso3"].map(country_continent) == CONTINENT]
+
+    for col, part in parts.items():
+        if col == "Military_Expenditure_USD":
+            continue
+        base = base.merge(part[["iso3", col]], on="iso3", how="left")
+
+    return base.reset_index(drop=True)
+
+
+def build_year_partition_shipped(parts):
+    # Semua baris SIPRI tahun ini (filter Asia di stage 3), join lewat nama mentah
+    base = parts["Military_Expenditure_USD"][["iso3", "Country", "Year", "Military_Expenditure_USD"]]
+    for col in ["Military_Expenditure_pct_Govt", *WORLDBANK_SOURCES]:
+        base = base.merge(parts[col][["Country", col]], on="Country", how="left")
+
+    for col in SHIPPED_YEAR_MEDIAN:
+        base[col] = base[col].fillna(base[col].median())
+    base["Military_Expenditure_pct_GDP"] = base["Military_Expenditure_USD"] / base["GDP_USD"] * 100
+
+    return base.reset_index(drop=True)
+
+
+# =========================
+# STAGE 3 — YoY, FLAG, SCORE
+# =========================
+def min_max(series):
+    span = series.max() - series.min()
+    if not span:
+        return pd.Series(0.0, index=series.index)
+    return (series - series.min()) / span
+
+
+def _flags_and_fill(df):
+    df["Military_Expenditure_missing"] = df["Military_Expenditure_USD"].isna().astype(int)
+    df["Political_Stability_missing"] = df["Political_Stability_Index"].isna().astype(int)
+    df["Military_Expenditure_pct_Govt_missing"] = df["Military_Expenditure_pct_Govt"].isna().astype(int)
+
+    df["Political_Stability_Index"] = df["Political_Stability_Index"].fillna(0)
+    df["Military_Expenditure_pct_Govt"] = df["Military_Expenditure_pct_Govt"].fillna(0)
+
+
+def _scores(df, growth):
+    df["Military_Expenditure_YoY_Clipped"] = df["Military_Expenditure_YoY"].clip(*YOY_CLIP).fillna(0)
+
+    df["Score_Expenditure"] = min_max(df["Military_Expenditure_USD"])
+    df["Score_Growth"] = min_max(df[growth]).where(df["Military_Expenditure_YoY"].notna())
+    df["Score_pctGovt"] = min_max(df["Military_Expenditure_pct_Govt"])
+    df["Score_Politics"] = min_max(df["Political_Stability_Index"])
+
+    weights = pd.Series(SCORE_WEIGHTS)
+    df["Total_Score"] = df[weights.index].to_numpy() @ weights.to_numpy()
+
+    return df[OUTPUT_COLUMNS]
+
+
+def finalize(df, method=DEFAULT_METHOD):
+    if method == "shipped":
+        return finalize_shipped(df)
+
+    df = df.sort_values(["iso3", "Year"]).reset_index(drop=True)
+
+    df["Country_clean"] = df["iso3"].map(country_clean)
+    df["Continent"] = CONTINENT
+    _flags_and_fill(df)
+
+    # YoY dihitung terhadap tahun sebelumnya yang benar-benar berurutan
+    prev = df.groupby("iso3")["Military_Expenditure_USD"].shift()
+    consecutive = df.groupby("iso3")["Year"].diff() == 1
+    df["Military_Expenditure_YoY"] = ((df["Military_Expenditure_USD"] / prev - 1) * 100).where(consecutive)
+
+    return _scores(df, "Military_Expenditure_YoY_Clipped")
+
+
+def finalize_shipped(df):
+    # Median global dihitung atas semua baris SIPRI, sebelum filter Asia
+    df["GDP_USD"] = df["GDP_USD"].fillna(df["GDP_USD"].median())
+    df["Military_Expenditure_pct_GDP"] = df["Military_Expenditure_pct_GDP"].fillna(0)
+
+    df = df[df["iso3"].notna() & ~df["iso3"].isin(SHIPPED_EXCLUDED)]
+    df = df[df["iso3"].map(country_continent) == CONTINENT].copy()
+    df["Country_clean"] = df["iso3"].map(country_clean)
+    df = df.sort_values(["Country_clean", "Year"]).reset_index(drop=True)
+
+    totals = df.groupby("Country_clean")["Military_Expenditure_USD"].sum()
+    df["Country"] = df["Country_clean"].where(df["Country_clean"].isin(totals.nlargest(SHIPPED_LABELLED).index))
+    df["Continent"] = CONTINENT
+    _flags_and_fill(df)
+
+    df["Military_Expenditure_YoY"] = df.groupby("Country_clean")["Military_Expenditure_USD"].pct_change() * 100
+
+    return _scores(df, "Military_Expenditure_YoY")
+
+
+# =========================
+# PIPELINE
+# =========================
+def worldbank_key(col, path, references, method=DEFAULT_METHOD):
+    if method == "shipped":
+        return source_key(col, path, method=method)
+    return source_key(col, path, references.get(col))
+
+
+def run_pipeline(output_path=OUTPUT_PATH, method=DEFAULT_METHOD):
+    if method not in ETL_METHODS:
+        raise ValueError(f"method harus salah satu dari {ETL_METHODS}, bukan {method!r}")
+    stats = {"cached": 0, "computed": 0}
+
+    # Stage 1: reshape tiap sumber, cache per hash file sumber
+    sources = {}
+    for col, path in SIPRI_SOURCES.items():
+        key = source_key(col, path)
+        sources[col] = cached_stage("long", key, lambda p=path, c=col: read_sipri_long(p, c), stats)
+
+    references = worldbank_references(sources) if method == "revised" else {}
+    for col, path in WORLDBANK_SOURCES.items():
+        key = worldbank_key(col, path, references, method)
+        if method == "shipped":
+            build = lambda p=path, c=col: read_worldbank_shipped(p, c)
+        else:
+            build = lambda p=path, c=col, r=references.get(col): read_worldbank_long(p, c, r)
+        sources[col] = cached_stage("long", key, build, stats)
+
+    # Stage 2: join per tahun, cache per hash isi partisi
+    # → tahun data baru hanya menghitung ulang partisi yang berubah
+    years = sorted(sources["Military_Expenditure_USD"]["Year"].unique())
+    by_year = {col: dict(tuple(src.groupby("Year"))) for col, src in sources.items()}
+
+    partitions = []
+    for year in years:
+        parts = {
+            col: groups.get(year, sources[col].iloc[:0])
+            for col, groups in by_year.items()
+        }
+        key = f"{year}-{method}-{frame_hash(*parts.values())}"
+        partitions.append(cached_stage("year", key, lambda p=parts: build_year_partition(p, method), stats))
+
+    # Stage 3: YoY & score bergantung lintas tahun, selalu dihitung (vektor, murah)
+    df_final = finalize(pd.concat(partitions, ignore_index=True), method)
+
+    if output_path:
+        os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+        df_final.to_csv(output_path, index=False)
+
+    return df_final, stats
+
+
+# =========================
+# PARITY VS df_asia_final.csv
+# =========================
+# Metode "shipped" harus identik (toleransi float) dengan file yang di-commit; metode
+# "revised" berbeda secara sengaja (lihat README → ETL Pipeline).
+PARITY_KEYS = ["Country_clean", "Year"]
+
+
+def parity_report(df, reference_path=SHIPPED_PATH, rtol=1e-6):
+    reference = pd.read_csv(reference_path)
+    merged = reference.merge(df, on=PARITY_KEYS, how="outer", suffixes=("_ref", "_new"), indicator=True)
+    both = merged[merged["_merge"] == "both"]
+
+    columns = {}
+    for col in OUTPUT_COLUMNS:
+        if col in PARITY_KEYS:
+            continue
+        old, new = both[f"{col}_ref"], both[f"{col}_new"]
+        if pd.api.types.is_numeric_dtype(old) and pd.api.types.is_numeric_dtype(new):
+            same = np.isclose(old.to_numpy(float), new.to_numpy(float), rtol=rtol, equal_nan=True)
+        else:
+            same = ((old.astype(str) == new.astype(str)) | (old.isna() & new.isna())).to_numpy()
+        columns[col] = int((~same).sum())
+
+    only = lambda side: merged[merged["_merge"] == side].groupby("Country_clean").size().to_dict()
+    return {
+        "rows_reference": len(reference),
+        "rows_new": len(df),
+        "only_new": only("right_only"),
+        "only_reference": only("left_only"),
+        "differing_values": {col: n for col, n in columns.items() if n},
+    }
+
+
+def format_parity(report):
+    lines = [f"parity vs {SHIPPED_PATH}: {report['rows_new']} baris baru, {report['rows_reference']} baris lama"]
+    for side, label in (("only_new", "hanya di output baru"), ("only_reference", "hanya di file lama")):
+        if report[side]:
+            lines.append(f"  {label}: " + ", ".join(f"{k} ({v})" for k, v in report[side].items()))
+    for col, n in report["differing_values"].items():
+        lines.append(f"  {col}: {n} baris berbeda")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    start = time.perf_counter()
+    args = sys.argv[1:]
+    # Menimpa file yang di-commit hanya jika diminta eksplisit
+    paths = [arg for arg in args if not arg.startswith("--")]
+    output = SHIPPED_PATH if "--overwrite" in args else (paths[0] if paths else OUTPUT_PATH)
+    method = "revised" if "--revised" in args else DEFAULT_METHOD
+    df_final, stats = run_pipeline(output, method)
+    print(
+        f"{len(df_final)} baris → {output} "
+        f"({stats['computed']} stage dihitung, {stats['cached']} dari cache, "
+        f"{time.perf_counter() - start:.2f}s)"
+    )
+    if os.path.abspath(output) != os.path.abspath(SHIPPED_PATH):
+        print(format_parity(parity_report(df_final)))
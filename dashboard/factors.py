@@ -0,0 +1,80 @@
+import numpy as np
+import pandas as pd
+
+# =========================
+# TABEL FAKTOR (bisa diubah / dioper sebagai argumen)
+# =========================
+# ---------- Faktor Usia Alat ----------
+# (batas atas, inklusif?, faktor) dievaluasi berurutan; di atas semua batas → default
+#   usia < 10        → 0.9
+#   10 <= usia <= 20 → 1.0
+#   usia > 20        → 1.3
+AGE_FACTOR_TABLE = [
+    (10, False, 0.9),
+    (20, True, 1.0),
+]
+AGE_FACTOR_DEFAULT = 1.3
+
+# ---------- Faktor Konflik ----------
+CONFLICT_FACTOR_TABLE = {
+    "Low": 0.9,
+    "Medium": 1.0,
+    "High": 1.2
+}
+CONFLICT_FACTOR_DEFAULT = 1.0
+
+# ---------- Label pengiriman ----------
+DELIVERY_STATUS_LABELS = {
+    "completed": "completed",
+    "partial": "partial",
+}
+
+CONSISTENCY_LABELS = {
+    "consistent": "✅ Konsisten",
+    "under": "⚠️ Kurang Kirim",
+    "over": "📈 Over Delivery",
+}
+
+
+def _like(source, values):
+    # Pertahankan index jika input berupa Series
+    if isinstance(source, pd.Series):
+        return pd.Series(values, index=source.index, name=source.name)
+    return values
+
+
+def _labelled(codes, labels):
+    # Label dikembalikan sebagai kategori: satu kode int8 per baris, bukan string
+    return pd.Categorical.from_codes(codes.astype("int8"), categories=list(labels))
+
+
+# =========================
+# KERNEL VEKTOR
+# =========================
+def age_factor(age, table=AGE_FACTOR_TABLE, default=AGE_FACTOR_DEFAULT):
+    values = np.asarray(age, dtype=float)
+    conditions = [
+        (values <= upper) if inclusive else (values < upper)
+        for upper, inclusive, _ in table
+    ]
+    return _like(age, np.select(conditions, [factor for *_, factor in table], default))
+
+
+def conflict_factor(level, table=CONFLICT_FACTOR_TABLE, default=CONFLICT_FACTOR_DEFAULT):
+    # Kode kategori -1 (level tidak dikenal / kosong) jatuh ke elemen terakhir = default
+    codes = pd.Categorical(level, categories=list(table)).codes
+    factors = np.append(np.fromiter(table.values(), dtype=float), default)
+    return _like(level, factors[codes])
+
+
+def delivery_status(delivery_gap, labels=DELIVERY_STATUS_LABELS):
+    gap = np.asarray(delivery_gap, dtype=float)
+    codes = (gap != 0)
+    return _like(delivery_gap, _labelled(codes, [labels["completed"], labels["partial"]]))
+
+
+# delivery_gap di sini = dikirim - dipesan (negatif → kurang kirim)
+def consistency_flag(delivery_gap, labels=CONSISTENCY_LABELS):
+    gap = np.asarray(delivery_gap, dtype=float)
+    codes = np.select([gap == 0, gap < 0], [0, 1], 2)
+    return _like(delivery_gap, _labelled(codes, [labels["consistent"], labels["under"], labels["over"]]))
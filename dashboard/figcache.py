@@ -0,0 +1,190 @@
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict, namedtuple
+
+import plotly.io as pio
+import streamlit as st
+
+try:
+    from streamlit.elements.lib.form_utils import current_form_id
+    from streamlit.elements.lib.layout_utils import LayoutConfig
+    from streamlit.elements.lib.utils import compute_and_register_element_id
+    from streamlit.proto.PlotlyChart_pb2 import PlotlyChart as PlotlyChartProto
+except ImportError:  # API internal Streamlit berubah → fallback ke st.plotly_chart
+    PlotlyChartProto = None
+
+logger = logging.getLogger(__name__)
+
+# =========================
+# CACHE FIGURE TERSERIALISASI (lintas sesi)
+# =========================
+# Figure setiap section disimpan sebagai JSON Plotly yang sudah jadi, dengan key
+# kanonik (section, tag, input filter: negara terurut, tuple tahun, versi dataset).
+# View yang berulang (rentang default, pilihan negara yang sama) diambil langsung dari
+# cache dan JSON-nya dikirim apa adanya ke browser: tanpa pandas, tanpa Plotly
+# (to_dict / validasi / to_json). Cache dibatasi total byte (LRU) dan umur entri (TTL).
+FIGCACHE_MAX_BYTES = int(float(os.environ.get("DASHBOARD_FIGCACHE_MB", 128)) * 1e6)
+FIGCACHE_TTL_SECONDS = float(os.environ.get("DASHBOARD_FIGCACHE_TTL", 3600))
+
+# Tinggi default plotly.js jika layout tidak menentukan height
+DEFAULT_HEIGHT = 450
+
+CachedFigure = namedtuple("CachedFigure", ["spec", "height", "points", "nbytes"])
+
+
+def canonical(value):
+    # Nilai input → key hashable & kanonik (urutan list negara tidak berpengaruh)
+    if isinstance(value, dict):
+        return tuple(sorted((k, canonical(v)) for k, v in value.items()))
+    if isinstance(value, (list, set, frozenset)):
+        return tuple(sorted(canonical(v) for v in value))
+    if isinstance(value, tuple):
+        return tuple(canonical(v) for v in value)
+    return value
+
+
+def serialize(fig):
+    # Sama dengan yang dikirim st.plotly_chart (to_json tanpa validasi ulang)
+    spec = pio.to_json(fig, validate=False)
+    points = 0
+    for trace in fig.data:
+        for axis in ("x", "y", "z"):
+            values = getattr(trace, axis, None)
+            if values is not None:
+                points += len(values)
+                break
+    return CachedFigure(spec, int(fig.layout.height or DEFAULT_HEIGHT), points, sys.getsizeof(spec))
+
+
+class FigureCache:
+    def __init__(self, max_bytes=FIGCACHE_MAX_BYTES, ttl=FIGCACHE_TTL_SECONDS):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._entries = OrderedDict()  # key → (CachedFigure, kedaluwarsa)
+        self._lock = threading.Lock()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def _drop(self, key):
+        cached, _ = self._entries.pop(key)
+        self.bytes -= cached.nbytes
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] <= time.monotonic():
+                self._drop(key)
+                self.expirations += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, cached):
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            # Figure yang lebih besar dari seluruh kapasitas tidak disimpan
+            if cached.nbytes > self.max_bytes:
+                return
+            self._entries[key] = (cached, time.monotonic() + self.ttl)
+            self.bytes += cached.nbytes
+            while self.bytes > self.max_bytes:
+                self._drop(next(iter(self._entries)))
+                self.evictions += 1
+
+    def get_or_build(self, key, build):
+        cached = self.get(key)
+        if cached is None:
+            cached = serialize(build())
+            self.put(key, cached)
+        return cached
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self.bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups else None,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
+
+
+# Satu cache per proses server, dipakai bersama semua sesi & halaman
+FIGURE_CACHE = FigureCache()
+
+
+# =========================
+# RENDER DARI JSON
+# =========================
+# Jalur cepat mengulang langkah st.plotly_chart Streamlit 1.65 tanpa membangun ulang
+# figure, memakai API privat: st._main, DeltaGenerator._enqueue, current_form_id,
+# compute_and_register_element_id, dan LayoutConfig. Hanya diuji dengan 1.65, jadi
+# requirements.txt mem-pin streamlit ke minor itu (>=1.65,<1.66); naikkan pin hanya
+# setelah tests/test_figcache.py lulus di versi baru. Jika signature / atribut internal
+# tetap berubah (TypeError / AttributeError), jalur cepat dimatikan untuk seluruh
+# proses dan chart dirender lewat st.plotly_chart.
+_fast_path = {"enabled": PlotlyChartProto is not None}
+
+# Argumen st.plotly_chart yang direplikasi. Seperti Streamlit, id elemen di-hash dari
+# argumen yang diminta (height "content"), sedangkan LayoutConfig memakai tinggi hasil
+# resolusi "content" (layout.height figure atau DEFAULT_HEIGHT, lihat serialize)
+CHART_WIDTH = "stretch"
+CHART_HEIGHT = "content"
+
+
+def _enqueue_spec(cached, key):
+    dg = st._main
+    proto = PlotlyChartProto()
+    proto.theme = "streamlit"
+    proto.form_id = current_form_id(dg)
+    proto.spec = cached.spec
+    proto.config = json.dumps({})
+    layout_config = LayoutConfig(width=CHART_WIDTH, height=cached.height)
+    enqueue = dg._enqueue
+    proto.id = compute_and_register_element_id(
+        "plotly_chart",
+        user_key=key,
+        key_as_main_identity=False,
+        dg=dg,
+        plotly_spec=proto.spec,
+        plotly_config=proto.config,
+        selection_mode=("points", "box", "lasso"),
+        is_selection_activated=False,
+        theme="streamlit",
+        width=CHART_WIDTH,
+        height=CHART_HEIGHT,
+        alt=None,
+    )
+    return enqueue("plotly_chart", proto, layout_config=layout_config)
+
+
+def plotly_chart(cached, key=None, **selection):
+    # Seleksi (on_select) menjadikan chart widget → tetap lewat st.plotly_chart
+    if _fast_path["enabled"] and not selection:
+        try:
+            return _enqueue_spec(cached, key)
+        except (TypeError, AttributeError):
+            _fast_path["enabled"] = False
+            logger.warning("API internal Streamlit berubah; figure cache dirender lewat st.plotly_chart", exc_info=True)
+    return st.plotly_chart(json.loads(cached.spec), width=CHART_WIDTH, height=CHART_HEIGHT, key=key, **selection)
@@ -0,0 +1,109 @@
+import logging
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+from dashboard.etl import COUNTRY_ALIASES, country_iso3, country_clean
+from dashboard.trade import CURRENT_YEAR
+
+logger = logging.getLogger(__name__)
+
+# =========================
+# INDEKS PENERIMA → NEGARA (pycountry)
+# =========================
+# Nama penerima SIPRI (lower/strip, lihat trade.py) dipetakan sekali ke ISO3. Negara
+# yang ada di frame belanja militer mendapat Country_clean persis seperti di frame tsb
+# (dicocokkan lewat ISO3, bukan nama pycountry), sehingga join usia armada selalu kena;
+# negara lain memakai nama pycountry. Aktor non-negara (pemberontak, organisasi) dan
+# negara yang sudah bubar sengaja tidak dipetakan.
+RECIPIENT_ALIASES = {
+    **{name.lower(): iso3 for name, iso3 in COUNTRY_ALIASES.items()},
+    "turkiye": "TUR",
+    "uae": "ARE",
+    "cote d'ivoire": "CIV",
+    "dr congo": "COD",
+    "bosnia-herzegovina": "BIH",
+    "palestine": "PSE",
+}
+
+
+@lru_cache(maxsize=None)
+def recipient_iso3(name):
+    if name in RECIPIENT_ALIASES:
+        return RECIPIENT_ALIASES[name]
+    return country_iso3(name)
+
+
+def build_recipient_index(recipients, countries=()):
+    # countries: nilai Country_clean frame belanja militer
+    expenditure = {}
+    for name in countries:
+        iso3 = country_iso3(name)
+        if iso3 is None:
+            logger.warning("Country_clean %r tidak dikenali pycountry; usia armada default", name)
+        else:
+            expenditure[iso3] = name
+
+    rows = []
+    for recipient in recipients:
+        iso3 = recipient_iso3(recipient)
+        name = expenditure.get(iso3) or (country_clean(iso3) if iso3 else None)
+        rows.append((recipient, iso3, name, iso3 in expenditure))
+    index = pd.DataFrame(rows, columns=["recipient", "iso3", "Country_clean", "in_expenditure"])
+
+    unmatched = index.loc[index["iso3"].isna(), "recipient"].tolist()
+    if unmatched:
+        logger.info("%d penerima tanpa negara (aktor non-negara / sudah bubar): %s", len(unmatched), unmatched)
+    missing = sorted(set(expenditure.values()) - set(index.loc[index["in_expenditure"], "Country_clean"]))
+    if missing:
+        logger.warning(
+            "%d negara belanja militer tanpa penerima di trade register (usia armada default): %s",
+            len(missing), missing,
+        )
+    return index
+
+
+# =========================
+# USIA ARMADA PER NEGARA × TAHUN
+# =========================
+# Usia armada tahun Y = rata-rata (Y - tahun kirim) seluruh unit yang sudah dikirim
+# s.d. Y, tertimbang number_delivered:
+#   Avg_Equipment_Age(Y) = Y - Σ(unit × tahun kirim) / Σ unit
+# Kedua jumlah kumulatif dihitung sekali per negara sepanjang tahun (cumsum).
+def build_fleet_age(df_av, recipient_index):
+    mapping = recipient_index.dropna(subset=["Country_clean"]).set_index("recipient")["Country_clean"]
+    country = df_av["recipient"].astype(object).map(mapping)
+
+    valid = country.notna() & df_av["years_of_delivery"].notna() & (df_av["number_delivered"] > 0)
+    deliveries = pd.DataFrame({
+        "Country_clean": country[valid],
+        "Year": df_av.loc[valid, "years_of_delivery"].astype(int),
+        "units": df_av.loc[valid, "number_delivered"].astype(float),
+    })
+    deliveries["unit_years"] = deliveries["units"] * deliveries["Year"]
+
+    per_year = deliveries.groupby(["Country_clean", "Year"])[["units", "unit_years"]].sum()
+    years = np.arange(per_year.index.get_level_values("Year").min(), CURRENT_YEAR + 1)
+
+    units = per_year["units"].unstack(fill_value=0).reindex(columns=years, fill_value=0).cumsum(axis=1)
+    unit_years = per_year["unit_years"].unstack(fill_value=0).reindex(columns=years, fill_value=0).cumsum(axis=1)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        age = years[None, :] - unit_years.to_numpy() / units.to_numpy()
+
+    fleet = pd.DataFrame({
+        "Country_clean": np.repeat(units.index.to_numpy(), len(years)),
+        "Year": np.tile(years, len(units)),
+        "Avg_Equipment_Age": age.ravel(),
+        "Fleet_Units": units.to_numpy().ravel(),
+    })
+    return fleet[fleet["Fleet_Units"] > 0].reset_index(drop=True)
+
+
+def attach_fleet_age(df, fleet):
+    # Join kecil (negara × tahun) sekali per versi dataset, bukan per rerun
+    columns = ["Country_clean", "Year", "Avg_Equipment_Age", "Fleet_Units"]
+    return df.drop(columns=[c for c in columns[2:] if c in df.columns]).merge(
+        fleet[columns], on=["Country_clean", "Year"], how="left"
+    )
@@ -0,0 +1,126 @@
+import numpy as np
+import pandas as pd
+
+# =========================
+# ARUS PERDAGANGAN SUPPLIER → PENERIMA
+# =========================
+# Tensor jarang supplier × penerima × tahun (year_of_order) berisi jumlah transaksi &
+# total sipri_tiv_of_delivered_weapons. Hanya sel yang terisi yang disimpan, sebagai
+# array berkode (supplier, penerima, tahun) terurut per tahun + offset awal tiap tahun.
+# Filter rentang tahun = slicing kontigu [offset[awal], offset[akhir]); filter penerima
+# = mask pada slice tsb. Biaya query sebanding dengan jumlah sel terisi pada rentang,
+# bukan jumlah baris register.
+FLOW_METRICS = {
+    "transactions": "Jumlah Transaksi",
+    "tiv": "SIPRI TIV",
+}
+
+
+class TradeFlows:
+    def __init__(self, df, year_col="year_of_order", tiv_col="sipri_tiv_of_delivered_weapons"):
+        # recipient & supplier berbagi satu kamus negara (lihat trade.COUNTRY_COLS)
+        supplier = df["supplier"].astype("category")
+        recipient = df["recipient"].astype("category")
+        self.countries = np.array(
+            sorted(set(supplier.cat.categories) | set(recipient.cat.categories)), dtype=object
+        )
+        n = len(self.countries)
+
+        years = pd.to_numeric(df[year_col], errors="coerce")
+        valid = years.notna().to_numpy() & supplier.notna().to_numpy() & recipient.notna().to_numpy()
+        year_values = years.to_numpy(float)[valid].astype(np.int64)
+        self.year_min = int(year_values.min()) if len(year_values) else 0
+        self.year_max = int(year_values.max()) if len(year_values) else -1
+        self.years = np.arange(self.year_min, self.year_max + 1)
+
+        s = pd.Categorical(supplier[valid], categories=self.countries).codes.astype(np.int64)
+        r = pd.Categorical(recipient[valid], categories=self.countries).codes.astype(np.int64)
+        y = year_values - self.year_min
+        tiv = np.nan_to_num(pd.to_numeric(df[tiv_col], errors="coerce").to_numpy(float)[valid])
+
+        # Sel terisi (kunci urut tahun → supplier → penerima) + agregat per sel
+        cell = (y * n + s) * n + r
+        keys, inverse = np.unique(cell, return_inverse=True)
+        self.transactions = np.bincount(inverse, minlength=len(keys)).astype(float)
+        self.tiv = np.bincount(inverse, weights=tiv, minlength=len(keys))
+
+        self.year_idx = keys // (n * n)
+        self.supplier_idx = (keys // n) % n
+        self.recipient_idx = keys % n
+        self.year_offsets = np.searchsorted(self.year_idx, np.arange(len(self.years) + 1))
+
+    # ---------- Slicing ----------
+    def _slice(self, year_range, recipients=None):
+        start = min(max(int(year_range[0]), self.year_min), self.year_max + 1) - self.year_min
+        stop = min(max(int(year_range[1]), self.year_min - 1), self.year_max) - self.year_min + 1
+        cells = slice(self.year_offsets[start], self.year_offsets[max(stop, start)])
+
+        mask = None
+        if recipients:
+            selected = np.isin(self.countries, list(recipients))
+            mask = selected[self.recipient_idx[cells]]
+        return cells, mask
+
+    def _cells(self, metric, year_range, recipients):
+        if metric not in FLOW_METRICS:
+            raise ValueError(f"metric harus salah satu dari {list(FLOW_METRICS)}")
+        cells, mask = self._slice(year_range, recipients)
+        values = (self.transactions if metric == "transactions" else self.tiv)[cells]
+        year, supplier, recipient = self.year_idx[cells], self.supplier_idx[cells], self.recipient_idx[cells]
+        if mask is not None:
+            values, year, supplier, recipient = values[mask], year[mask], supplier[mask], recipient[mask]
+        return values, year, supplier, recipient
+
+    # ---------- Query ----------
+    def flows(self, year_range, recipients=None, metric="transactions", top=None):
+        # Pasangan supplier → penerima, dijumlah sepanjang rentang tahun, terurut menurun
+        values, _, supplier, recipient = self._cells(metric, year_range, recipients)
+        n = len(self.countries)
+        pairs, inverse = np.unique(supplier * n + recipient, return_inverse=True)
+        totals = np.bincount(inverse, weights=values, minlength=len(pairs))
+
+        order = np.argsort(-totals, kind="stable")
+        order = order[totals[order] > 0][:top]
+        return pd.DataFrame({
+            "supplier": self.countries[pairs[order] // n],
+            "recipient": self.countries[pairs[order] % n],
+            metric: totals[order],
+        })
+
+    def supplier_year(self, year_range, recipients=None, metric="transactions"):
+        # Matriks tahun × supplier (hanya supplier yang muncul pada slice)
+        values, year, supplier, _ = self._cells(metric, year_range, recipients)
+        n = len(self.countries)
+        matrix = np.bincount(year * n + supplier, weights=values, minlength=len(self.years) * n)
+        matrix = matrix.reshape(len(self.years), n)
+
+        # Tahun yang punya transaksi pada rentang (sama seperti groupby)
+        rows = np.unique(year)
+        present = matrix.sum(axis=0) > 0
+        return pd.DataFrame(
+            matrix[rows][:, present],
+            index=pd.Index(self.years[rows], name="year_of_order"),
+            columns=pd.Index(self.countries[present], name="supplier"),
+        )
+
+    def concentration(self, year_range, recipients=None, metric="transactions"):
+        # Pangsa pasar supplier per tahun + HHI (Σ pangsa² × 10.000; > 2.500 = sangat terkonsentrasi)
+        matrix = self.supplier_year(year_range, recipients, metric)
+        totals = matrix.sum(axis=1)
+        shares = matrix.div(totals.where(totals > 0), axis=0)
+        return pd.DataFrame({
+            "year_of_order": matrix.index,
+            "hhi": (shares ** 2).sum(axis=1, min_count=1).to_numpy() * 10_000,
+            "suppliers": (matrix > 0).sum(axis=1).to_numpy(),
+            "top_supplier": matrix.idxmax(axis=1).where(totals > 0).to_numpy(),
+            "top_share": shares.max(axis=1).to_numpy(),
+        })
+
+    def market_share(self, year_range, recipients=None, metric="transactions", top=5):
+        # Pangsa supplier terbesar (total rentang) per tahun; sisanya digabung "lainnya"
+        matrix = self.supplier_year(year_range, recipients, metric)
+        totals = matrix.sum(axis=1)
+        leaders = matrix.sum(axis=0).nlargest(top).index
+        shares = matrix[leaders].assign(lainnya=matrix.drop(columns=leaders).sum(axis=1))
+        shares = shares.div(totals.where(totals > 0), axis=0) * 100
+        return shares.reset_index().melt(id_vars="year_of_order", var_name="supplier", value_name="share")
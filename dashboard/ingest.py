@@ -0,0 +1,198 @@
+import json
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from dashboard.snapshot import (
+    SNAPSHOT_DIR,
+    file_hash,
+    snapshot_path,
+    write_snapshot,
+    read_snapshot,
+    _remove_stale,
+)
+from dashboard.trade import (
+    TRADE_REGISTER_PATH,
+    AVIONICS_REF_PATH,
+    read_trade_register,
+    read_avionics_reference,
+    build_avionics_frame,
+    concat_categorical,
+)
+
+# =========================
+# INGEST DELTA TRADE REGISTER
+# =========================
+# Rilis SIPRI baru kebanyakan hanya menambah order atau mengubah number_delivered /
+# status. Setiap baris diberi sidik jari (key stabil + hash isi) yang disimpan bersama
+# frame avionik; ingest hanya menerapkan insert/update/delete ke state tersimpan, dan kolom turunan avionik
+# (delivery_gap, delivery_status, weapon_age, ...) hanya dihitung untuk baris yang berubah.
+INGEST_DIR = os.path.join(SNAPSHOT_DIR, "ingest")
+
+# Naikkan jika logika build_avionics_frame berubah → state lama dibangun ulang penuh
+INGEST_VERSION = "2"
+
+KEY_COLS = ["recipient", "supplier", "weapon_designation", "year_of_order"]
+
+STATE_FILES = {
+    "fingerprints": "fingerprints.arrow",
+    "avionics": "avionics.arrow",
+    "meta": "meta.json",
+}
+
+
+def _state_path(name):
+    return os.path.join(INGEST_DIR, STATE_FILES[name])
+
+
+# =========================
+# SIDIK JARI BARIS
+# =========================
+def row_keys(df):
+    # Key bisnis bisa kembar (mis. order bertahap) → tambah nomor urut dalam grup key
+    keys = df[KEY_COLS].copy()
+    keys["_seq"] = keys.groupby(KEY_COLS, dropna=False).cumcount()
+    return pd.util.hash_pandas_object(keys, index=False).to_numpy()
+
+
+def row_hashes(df):
+    return pd.util.hash_pandas_object(df, index=False).to_numpy()
+
+
+def diff_rows(old_keys, old_hashes, new_keys, new_hashes):
+    old = pd.Series(old_hashes, index=old_keys)
+
+    in_old = np.isin(new_keys, old_keys)
+    inserted = ~in_old
+    updated = in_old & (old.reindex(new_keys).to_numpy() != new_hashes)
+    deleted = ~np.isin(old_keys, new_keys)
+
+    # Mask dalam urutan rilis baru (inserted/updated) dan urutan state lama (deleted)
+    return inserted, updated, deleted
+
+
+# =========================
+# STATE
+# =========================
+def load_state():
+    try:
+        with open(_state_path("meta")) as f:
+            meta = json.load(f)
+        fingerprints = read_snapshot(_state_path("fingerprints"))
+        avionics = read_snapshot(_state_path("avionics")).drop(columns="register_position")
+    except FileNotFoundError:
+        return None
+
+    if meta.get("version") != INGEST_VERSION:
+        return None
+    return meta, fingerprints, avionics
+
+
+def save_state(meta, fingerprints, avionics):
+    write_snapshot(fingerprints, _state_path("fingerprints"))
+    write_snapshot(avionics, _state_path("avionics"))
+
+    # meta ditulis terakhir (atomik): state hanya dianggap valid jika ketiga file lengkap
+    tmp_path = f"{_state_path('meta')}.{os.getpid()}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(meta, f)
+    os.replace(tmp_path, _state_path("meta"))
+
+
+def _avionics_rows(register, keys, df_av_ref):
+    df_av = build_avionics_frame(register, df_av_ref)
+    df_av["row_key"] = keys[df_av.index.to_numpy()]
+    return df_av
+
+
+# =========================
+# INGEST
+# =========================
+def ingest(path=TRADE_REGISTER_PATH, ref_path=AVIONICS_REF_PATH, full=False):
+    start = time.perf_counter()
+
+    new_register = read_trade_register(path).reset_index(drop=True)
+    new_keys = row_keys(new_register)
+    new_hashes = row_hashes(new_register)
+
+    df_av_ref = read_avionics_reference(ref_path)
+    ref_digest = file_hash(ref_path)
+
+    state = None if full else load_state()
+    if state is not None and state[0]["reference"] != ref_digest:
+        # Whitelist avionik berubah → semua baris bisa masuk/keluar subset
+        state = None
+
+    if state is None:
+        avionics = _avionics_rows(new_register, new_keys, df_av_ref)
+        stats = {"mode": "full", "inserted": len(new_register), "updated": 0, "deleted": 0}
+    else:
+        _, fingerprints, old_avionics = state
+        old_keys = fingerprints["row_key"].to_numpy()
+        inserted, updated, deleted = diff_rows(old_keys, fingerprints["row_hash"].to_numpy(), new_keys, new_hashes)
+
+        # Kolom turunan hanya dihitung ulang untuk baris baru / berubah
+        changed = np.flatnonzero(inserted | updated)
+        fresh = _avionics_rows(new_register.iloc[changed], new_keys, df_av_ref)
+
+        stale_keys = np.concatenate([old_keys[deleted], new_keys[updated]])
+        kept = old_avionics[~np.isin(old_avionics["row_key"].to_numpy(), stale_keys)].copy()
+        avionics = concat_categorical([kept, fresh])
+
+        stats = {
+            "mode": "delta",
+            "inserted": int(inserted.sum()),
+            "updated": int(updated.sum()),
+            "deleted": int(deleted.sum()),
+        }
+
+    # Urutkan & beri index sesuai posisi baris di rilis baru (sama dengan build penuh)
+    positions = pd.Index(new_keys).get_indexer(avionics["row_key"].to_numpy())
+    avionics = avionics.set_axis(positions).sort_index()
+
+    meta = {
+        "version": INGEST_VERSION,
+        "source": file_hash(path),
+        "reference": ref_digest,
+    }
+    fingerprints = pd.DataFrame({"row_key": new_keys, "row_hash": new_hashes})
+    save_state(meta, fingerprints, avionics.reset_index(names="register_position"))
+
+    # Rilis yang menggantikan file register utama juga mengisi snapshot biasa,
+    # sehingga dashboard tidak mem-parse ulang CSV-nya
+    if os.path.abspath(path) == os.path.abspath(TRADE_REGISTER_PATH):
+        target = snapshot_path("trade_register", meta["source"])
+        write_snapshot(new_register, target)
+        _remove_stale("trade_register", target)
+
+    stats["seconds"] = time.perf_counter() - start
+    return avionics.drop(columns="row_key"), stats
+
+
+def load_ingested_avionics(path=TRADE_REGISTER_PATH, ref_path=AVIONICS_REF_PATH):
+    # Frame avionik hasil ingest terakhir, hanya jika masih cocok dengan file sumber
+    try:
+        with open(_state_path("meta")) as f:
+            meta = json.load(f)
+    except FileNotFoundError:
+        return None
+
+    if (meta.get("version"), meta.get("source"), meta.get("reference")) != (
+        INGEST_VERSION, file_hash(path), file_hash(ref_path)
+    ):
+        return None
+
+    avionics = read_snapshot(_state_path("avionics"))
+    return avionics.set_index("register_position").rename_axis(None).drop(columns="row_key")
+
+
+if __name__ == "__main__":
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    _, stats = ingest(args[0] if args else TRADE_REGISTER_PATH, full="--full" in sys.argv[1:])
+    print(
+        f"{stats['mode']}: {stats['inserted']} insert, {stats['updated']} update, "
+        f"{stats['deleted']} delete ({stats['seconds']:.2f}s)"
+    )
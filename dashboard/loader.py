@@ -0,0 +1,227 @@
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import pyarrow as pa
+
+from dashboard.etl import (
+    DEFAULT_METHOD,
+    OUTPUT_PATH,
+    SHIPPED_PATH,
+    SIPRI_SOURCES,
+    WORLDBANK_REFERENCES,
+    WORLDBANK_SOURCES,
+    format_parity,
+    parity_report,
+    read_sipri_long,
+    read_worldbank_long,
+    read_worldbank_shipped,
+    run_pipeline,
+    source_key,
+    stage_path,
+    worldbank_key,
+    worldbank_references,
+)
+from dashboard.snapshot import (
+    SOURCES as SNAPSHOT_SOURCES,
+    file_hash,
+    read_snapshot,
+    snapshot_path,
+    write_snapshot,
+    _remove_stale,
+)
+from dashboard.worldbank import WORLDBANK_FILES, parse_matrix, read_raw, to_long
+
+# =========================
+# LOADER PARALEL MULTI-SUMBER
+# =========================
+# Refresh penuh mem-parse 3 workbook SIPRI (openpyxl, single-thread), 3 CSV World Bank,
+# trade register, dan referensi avionik. Setiap parse jalan di process pool; worker
+# mengirim hasilnya sebagai buffer Arrow IPC (bukan DataFrame ter-pickle) dan parent
+# membacanya zero-copy. Hasil selalu digabung dalam urutan deklarasi sumber, apa pun
+# urutan selesainya, sehingga cache & snapshot yang ditulis deterministik.
+#
+#   python -m dashboard.loader              # parse sumber yang cache-nya belum ada
+#   python -m dashboard.loader --force      # parse ulang semua sumber
+#   python -m dashboard.loader --workers 4
+#   python -m dashboard.loader --overwrite  # timpa df_asia_final.csv yang di-commit
+#   python -m dashboard.loader --revised    # metode ETL "revised" (lihat dashboard.etl)
+#
+# Seperti dashboard.etl, output default ke build/; file yang dibaca dashboard hanya
+# ditimpa jika diminta eksplisit.
+LOADER_WORKERS = int(os.environ.get("DASHBOARD_LOADER_WORKERS", os.cpu_count() or 1))
+
+
+# =========================
+# WORKER → BUFFER ARROW
+# =========================
+def to_buffer(df):
+    table = pa.Table.from_pandas(df)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue()
+
+
+def from_buffer(buffer):
+    return pa.ipc.open_stream(buffer).read_all().to_pandas()
+
+
+def _parse(name, parser, args):
+    start = time.perf_counter()
+    df = parser(*args)
+    parsed = time.perf_counter()
+    buffer = to_buffer(df)
+    return buffer, {
+        "pid": os.getpid(),
+        "rows": len(df),
+        "parse_s": parsed - start,
+        "encode_s": time.perf_counter() - parsed,
+        "bytes": buffer.size,
+    }
+
+
+def load_parallel(tasks, workers=LOADER_WORKERS):
+    # tasks: [(name, parser, args, path)] → ({name: frame} urutan deklarasi, laporan per sumber)
+    start = time.perf_counter()
+    frames = {}
+    report = {}
+    if not tasks:
+        return frames, {"sources": report, "wall_s": 0.0, "workers": 0}
+
+    workers = max(min(workers, len(tasks)), 1)
+    if workers == 1:
+        # Satu core / satu sumber: tanpa pool (fork + transfer hanya menambah waktu)
+        for name, parser, args, _ in tasks:
+            task_start = time.perf_counter()
+            frames[name] = parser(*args)
+            report[name] = {"pid": os.getpid(), "rows": len(frames[name]), "parse_s": time.perf_counter() - task_start}
+        return frames, {"sources": report, "wall_s": time.perf_counter() - start, "workers": 1}
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        # Sumber terbesar disubmit lebih dulu supaya tidak menjadi ekor antrean
+        by_size = sorted(tasks, key=lambda task: -os.path.getsize(task[3]))
+        futures = {name: pool.submit(_parse, name, parser, args) for name, parser, args, _ in by_size}
+
+        for name, _, _, _ in tasks:
+            buffer, stats = futures[name].result()
+            decode_start = time.perf_counter()
+            frames[name] = from_buffer(buffer)
+            report[name] = {**stats, "decode_s": time.perf_counter() - decode_start}
+
+    return frames, {"sources": report, "wall_s": time.perf_counter() - start, "workers": workers}
+
+
+# =========================
+# REFRESH PENUH (cache stage-1 ETL + snapshot trade register)
+# =========================
+def _parse_worldbank_raw(path):
+    # Sumber yang butuh referensi SIPRI: worker hanya mem-parse teks, besaran
+    # direkonstruksi di parent setelah frame SIPRI tersedia
+    return read_raw(path)
+
+
+def _missing(path, force):
+    return force or not os.path.exists(path)
+
+
+def refresh_tasks(force=False, method=DEFAULT_METHOD):
+    # Hanya sumber yang cache/snapshot-nya belum ada (atau semua jika force)
+    tasks = []
+    sipri = {}
+    for col, path in SIPRI_SOURCES.items():
+        cache_path = stage_path("long", source_key(col, path))
+        if _missing(cache_path, force):
+            tasks.append((col, read_sipri_long, (path, col), path))
+        else:
+            sipri[col] = read_snapshot(cache_path)
+
+    # Key sumber ber-referensi hanya bisa dihitung jika semua frame SIPRI sudah ada di cache
+    references = worldbank_references(sipri) if len(sipri) == len(SIPRI_SOURCES) else {}
+    for col, path in WORLDBANK_SOURCES.items():
+        if method == "shipped":
+            if _missing(stage_path("long", worldbank_key(col, path, {}, method)), force):
+                tasks.append((col, read_worldbank_shipped, (path, col), path))
+        elif col not in WORLDBANK_REFERENCES:
+            if _missing(stage_path("long", source_key(col, path)), force):
+                tasks.append((col, read_worldbank_long, (path, col), path))
+        elif col not in references or _missing(stage_path("long", source_key(col, path, references[col])), force):
+            tasks.append((col, _parse_worldbank_raw, (path,), path))
+
+    for name, (path, parser) in SNAPSHOT_SOURCES.items():
+        if _missing(snapshot_path(name, file_hash(path)), force):
+            tasks.append((name, parser, (path,), path))
+
+    return tasks, sipri
+
+
+def refresh(force=False, workers=LOADER_WORKERS, output_path=OUTPUT_PATH, method=DEFAULT_METHOD):
+    tasks, sipri = refresh_tasks(force, method)
+    frames, report = load_parallel(tasks, workers)
+
+    # Tulis hasil dalam urutan deklarasi sumber (deterministik)
+    for col, path in SIPRI_SOURCES.items():
+        if col in frames:
+            sipri[col] = frames[col]
+            write_snapshot(frames[col], stage_path("long", source_key(col, path)))
+
+    references = worldbank_references(sipri) if method == "revised" else {}
+    for col, path in WORLDBANK_SOURCES.items():
+        if col not in frames:
+            continue
+        long_df = frames[col]
+        if col in references:
+            spec = WORLDBANK_FILES[os.path.basename(path)]
+            long_df = to_long(parse_matrix(long_df, spec["log10_range"], references[col]), col)
+        write_snapshot(long_df, stage_path("long", worldbank_key(col, path, references, method)))
+
+    for name, (path, _) in SNAPSHOT_SOURCES.items():
+        if name in frames:
+            target = snapshot_path(name, file_hash(path))
+            write_snapshot(frames[name], target)
+            _remove_stale(name, target)
+
+    # Stage 1 kini seluruhnya dari cache; join per tahun & skor seperti biasa
+    start = time.perf_counter()
+    df_final, stats = run_pipeline(output_path, method)
+    report["pipeline_s"] = time.perf_counter() - start
+    report["pipeline_stats"] = stats
+    report["output_path"] = output_path
+    if os.path.abspath(output_path) != os.path.abspath(SHIPPED_PATH):
+        report["parity"] = parity_report(df_final)
+    report["total_s"] = report["wall_s"] + report["pipeline_s"]
+    return report
+
+
+def format_report(report):
+    sources = report["sources"]
+    lines = [f"{'sumber':<34}{'pid':>8}{'baris':>10}{'parse (s)':>11}{'transfer (s)':>14}"]
+    for name, stats in sources.items():
+        transfer = stats.get("encode_s", 0.0) + stats.get("decode_s", 0.0)
+        lines.append(f"{name:<34}{stats['pid']:>8}{stats['rows']:>10}{stats['parse_s']:>11.3f}{transfer:>14.3f}")
+
+    slowest = max((stats["parse_s"] for stats in sources.values()), default=0.0)
+    total = sum(stats["parse_s"] for stats in sources.values())
+    lines.append(
+        f"{len(sources)} sumber, {report['workers']} worker: wall {report['wall_s']:.2f}s "
+        f"(jumlah parse {total:.2f}s, sumber terlama {slowest:.2f}s)"
+    )
+    if "pipeline_s" in report:
+        stats = report["pipeline_stats"]
+        lines.append(
+            f"pipeline ETL {report['pipeline_s']:.2f}s ({stats['computed']} stage dihitung, "
+            f"{stats['cached']} dari cache) → total {report['total_s']:.2f}s"
+        )
+        lines.append(f"output → {report['output_path']}")
+    if "parity" in report:
+        lines.append(format_parity(report["parity"]))
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    workers = int(args[args.index("--workers") + 1]) if "--workers" in args else LOADER_WORKERS
+    output_path = SHIPPED_PATH if "--overwrite" in args else OUTPUT_PATH
+    method = "revised" if "--revised" in args else DEFAULT_METHOD
+    print(format_report(refresh(force="--force" in args, workers=workers, output_path=output_path, method=method)))
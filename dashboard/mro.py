@@ -0,0 +1,222 @@
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from dashboard.factors import (
+    AGE_FACTOR_TABLE,
+    AGE_FACTOR_DEFAULT,
+    CONFLICT_FACTOR_TABLE,
+    CONFLICT_FACTOR_DEFAULT,
+    age_factor,
+    conflict_factor,
+)
+
+# =========================
+# ✈️ ESTIMASI MRO MARKET
+# =========================
+BASE_MRO_RATIO = 0.20  # Rasio rata-rata global MRO terhadap belanja militer
+
+# Usia alat jika tidak diketahui (faktor 1.0 pada tabel default)
+DEFAULT_EQUIPMENT_AGE = 15
+
+# Faktor usia alat & konflik: tabel ada di dashboard/factors.py
+# (AGE_FACTOR_TABLE, CONFLICT_FACTOR_TABLE)
+
+
+def add_mro_estimate(df):
+    df = df.copy()
+
+    # Pastikan numeric
+    df["Military_Expenditure_USD"] = pd.to_numeric(df["Military_Expenditure_USD"], errors="coerce")
+
+    # Jika kolom usia alat tersedia
+    if "Avg_Equipment_Age" in df.columns:
+        df["Avg_Equipment_Age"] = pd.to_numeric(df["Avg_Equipment_Age"], errors="coerce").fillna(DEFAULT_EQUIPMENT_AGE)
+        df["Age_Factor"] = age_factor(df["Avg_Equipment_Age"])
+    else:
+        df["Age_Factor"] = 1.0
+
+    # Jika kolom konflik tersedia
+    if "Conflict_Level" in df.columns:
+        df["Conflict_Factor"] = conflict_factor(df["Conflict_Level"])
+    else:
+        df["Conflict_Factor"] = 1.0
+
+    # Hitung estimasi MRO
+    df["Estimated_MRO_USD"] = (
+        df["Military_Expenditure_USD"]
+        * BASE_MRO_RATIO
+        * df["Age_Factor"]
+        * df["Conflict_Factor"]
+    )
+
+    return df
+
+
+# =========================
+# SKENARIO MRO
+# =========================
+# Satu skenario = rasio dasar + pita usia + peta konflik + sumber usia alat.
+# equipment_age: "column" (Avg_Equipment_Age = usia armada dari trade register, lihat
+# dashboard/fleet.py; 15 tahun jika tidak diketahui) atau "fixed" (15 tahun untuk semua).
+DEFAULT_SCENARIO = {
+    "base_ratio": BASE_MRO_RATIO,
+    "age_bands": AGE_FACTOR_TABLE,
+    "age_default": AGE_FACTOR_DEFAULT,
+    "conflict_map": CONFLICT_FACTOR_TABLE,
+    "conflict_default": CONFLICT_FACTOR_DEFAULT,
+    "equipment_age": "column",
+}
+
+EQUIPMENT_AGE_SOURCES = ["column", "fixed"]
+
+MRO_CACHE_ENTRIES = 4096
+
+# Batas elemen array (skenario × pita usia × baris) per batch broadcast
+MAX_BROADCAST_CELLS = 20_000_000
+
+
+def make_scenario(**overrides):
+    unknown = set(overrides) - set(DEFAULT_SCENARIO)
+    if unknown:
+        raise TypeError(f"parameter skenario tidak dikenal: {sorted(unknown)}")
+    scenario = {**DEFAULT_SCENARIO, **overrides}
+    if scenario["equipment_age"] not in EQUIPMENT_AGE_SOURCES:
+        raise ValueError(f"equipment_age harus salah satu dari {EQUIPMENT_AGE_SOURCES}")
+    return scenario
+
+
+def scenario_hash(scenario):
+    canonical = json.dumps(
+        {**scenario, "age_bands": [list(band) for band in scenario["age_bands"]]},
+        sort_keys=True,
+    )
+    return hashlib.sha256(canonical.encode()).hexdigest()[:16]
+
+
+# =========================
+# ENGINE (batch skenario × negara × tahun)
+# =========================
+class MroEngine:
+    def __init__(self, df, cache_entries=MRO_CACHE_ENTRIES):
+        self.expenditure = pd.to_numeric(df["Military_Expenditure_USD"], errors="coerce").to_numpy(float)
+
+        if "Avg_Equipment_Age" in df.columns:
+            column_age = pd.to_numeric(df["Avg_Equipment_Age"], errors="coerce").fillna(DEFAULT_EQUIPMENT_AGE)
+            self.column_age = column_age.to_numpy(float)
+        else:
+            self.column_age = np.full(len(df), float(DEFAULT_EQUIPMENT_AGE))
+
+        # Level konflik sebagai string; kolom tidak ada → semua level tidak dikenal (default)
+        if "Conflict_Level" in df.columns:
+            self.conflict_levels = df["Conflict_Level"].astype(object).to_numpy()
+        else:
+            self.conflict_levels = np.full(len(df), None, dtype=object)
+
+        # Indeks agregasi negara × tahun
+        self.countries = np.array(sorted(df["Country_clean"].unique()), dtype=object)
+        self.country_idx = pd.Categorical(df["Country_clean"], categories=self.countries).codes
+        self.years = df["Year"].to_numpy(int)
+
+        self.cache_entries = cache_entries
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+
+    # ---------- Evaluasi batch ----------
+    def _ages(self, scenarios):
+        fixed = np.array([s["equipment_age"] == "fixed" for s in scenarios])
+        return np.where(fixed[:, None], float(DEFAULT_EQUIPMENT_AGE), self.column_age[None, :])
+
+    def _age_factors(self, scenarios, ages):
+        # Pita usia dipadatkan ke K kolom; padding (batas +inf, faktor default) tidak pernah cocok lebih dulu
+        width = max(len(s["age_bands"]) for s in scenarios) or 1
+        upper = np.full((len(scenarios), width), np.inf)
+        inclusive = np.zeros((len(scenarios), width), bool)
+        factors = np.ones((len(scenarios), width))
+        defaults = np.array([s["age_default"] for s in scenarios], float)
+        for i, scenario in enumerate(scenarios):
+            for k, (bound, incl, factor) in enumerate(scenario["age_bands"]):
+                upper[i, k], inclusive[i, k], factors[i, k] = bound, incl, factor
+
+        values = ages[:, None, :]
+        bounds = upper[:, :, None]
+        matches = np.where(inclusive[:, :, None], values <= bounds, values < bounds)
+
+        first = matches.argmax(axis=1)
+        matched = matches.any(axis=1)
+        chosen = np.take_along_axis(factors, first, axis=1)
+        return np.where(matched, chosen, defaults[:, None])
+
+    def _conflict_factors(self, scenarios):
+        levels = sorted({level for s in scenarios for level in s["conflict_map"]})
+        codes = pd.Categorical(self.conflict_levels, categories=levels).codes
+
+        # Kolom terakhir = default per skenario (kode -1 → level tidak dikenal)
+        table = np.array([
+            [s["conflict_map"].get(level, s["conflict_default"]) for level in levels] + [s["conflict_default"]]
+            for s in scenarios
+        ], float)
+        return table[:, codes]
+
+    def _evaluate(self, scenarios):
+        base = np.array([s["base_ratio"] for s in scenarios], float)[:, None]
+        ages = self._ages(scenarios)
+        return self.expenditure[None, :] * base * self._age_factors(scenarios, ages) * self._conflict_factors(scenarios)
+
+    def estimate(self, scenarios):
+        # (skenario × baris); hanya skenario yang belum ada di cache yang dihitung
+        hashes = [scenario_hash(s) for s in scenarios]
+        with self._lock:
+            missing = list({h: s for h, s in zip(hashes, scenarios) if h not in self._cache}.items())
+
+        width = max((len(s["age_bands"]) for _, s in missing), default=1) or 1
+        batch = max(MAX_BROADCAST_CELLS // (width * max(len(self.expenditure), 1)), 1)
+        for start in range(0, len(missing), batch):
+            chunk = missing[start:start + batch]
+            values = self._evaluate([s for _, s in chunk])
+            with self._lock:
+                for (h, _), row in zip(chunk, values):
+                    self._cache[h] = row
+                while len(self._cache) > self.cache_entries:
+                    self._cache.popitem(last=False)
+
+        with self._lock:
+            rows = []
+            for h, s in zip(hashes, scenarios):
+                if h in self._cache:
+                    self._cache.move_to_end(h)
+                    rows.append(self._cache[h])
+                else:  # tergusur LRU di tengah batch besar
+                    rows.append(self._evaluate([s])[0])
+        return np.vstack(rows) if rows else np.empty((0, len(self.expenditure)))
+
+    # ---------- Agregat ----------
+    def _mask(self, year_range=None, countries=None):
+        mask = np.ones(len(self.years), bool)
+        if year_range is not None:
+            mask &= (self.years >= year_range[0]) & (self.years <= year_range[1])
+        if countries:
+            mask &= np.isin(self.countries[self.country_idx], list(countries))
+        return mask
+
+    def totals(self, scenarios, year_range=None, countries=None):
+        values = self.estimate(scenarios)[:, self._mask(year_range, countries)]
+        return np.nansum(values, axis=1)
+
+    def by_country(self, scenarios, year_range=None, countries=None):
+        # DataFrame skenario × negara (total MRO pada rentang filter)
+        mask = self._mask(year_range, countries)
+        values = np.nan_to_num(self.estimate(scenarios)[:, mask])
+        onehot = np.zeros((mask.sum(), len(self.countries)))
+        onehot[np.arange(mask.sum()), self.country_idx[mask]] = 1
+        totals = values @ onehot
+        present = onehot.any(axis=0)
+        return pd.DataFrame(
+            totals[:, present],
+            index=[scenario_hash(s) for s in scenarios],
+            columns=self.countries[present],
+        )
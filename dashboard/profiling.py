@@ -0,0 +1,270 @@
+import json
+import os
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+import pandas as pd
+import streamlit as st
+
+from dashboard.figcache import FIGURE_CACHE
+
+# =========================
+# PROFILING HOT PATH (opt-in)
+# =========================
+# DASHBOARD_PROFILE=1 → semua sesi diprofil; DASHBOARD_PROFILE=query → hanya sesi yang
+# dibuka dengan ?profile=1; selain itu (default) profiling mati dan ?profile=1 diabaikan.
+# Setiap section (filter, KPI, chart, tabel) menjadi span: wall time, baris yang
+# diproses, memori yang dialokasikan (puncak tracemalloc), ukuran figure terserialisasi,
+# dan apakah figure diambil dari memo. Span ditampilkan di sidebar dan diekspor sebagai
+# OTLP/JSON (satu trace per rerun per baris) ke PROFILE_FILE.
+#
+# tracemalloc memperlambat alokasi seluruh proses, jadi hanya aktif selama ada rerun
+# yang sedang diprofil dan dihentikan begitu rerun terakhir selesai. Pelacaknya global:
+# jika beberapa sesi diprofil bersamaan, alokasi sesi lain ikut terhitung (atribut
+# concurrent_runs > 1, kolom alloc dikosongkan di sidebar).
+PROFILE_MODE = os.environ.get("DASHBOARD_PROFILE", "0")
+PROFILE_FILE = os.environ.get("DASHBOARD_PROFILE_FILE", os.path.join("build", "profile", "spans.jsonl"))
+
+SERVICE_NAME = "military-dashboard"
+
+_local = threading.local()
+_file_lock = threading.Lock()
+
+# Rerun terprofil yang sedang berjalan (semua sesi); tracemalloc aktif selama > 0
+_tracing_lock = threading.Lock()
+_active_runs = 0
+
+
+def profiling_enabled():
+    if PROFILE_MODE == "1":
+        return True
+    return PROFILE_MODE == "query" and st.query_params.get("profile") == "1"
+
+
+def _new_id(n_bytes):
+    return os.urandom(n_bytes).hex()
+
+
+def _stack():
+    if not hasattr(_local, "stack"):
+        _local.stack = []
+    return _local.stack
+
+
+def _acquire_tracing():
+    global _active_runs
+    with _tracing_lock:
+        _active_runs += 1
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+
+def _release_tracing():
+    global _active_runs
+    with _tracing_lock:
+        _active_runs = max(_active_runs - 1, 0)
+        if not _active_runs and tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+
+# =========================
+# TRACE PER RERUN
+# =========================
+def begin_run(page):
+    # Dipanggil di awal halaman; span root = seluruh rerun. Trace rerun sebelumnya yang
+    # tidak sampai end_run (exception / st.stop) melepas slot tracing-nya di sini
+    if st.session_state.pop("_profile_trace", None) is not None:
+        _release_tracing()
+    if not profiling_enabled():
+        return
+
+    _acquire_tracing()
+    trace = {"trace_id": _new_id(16), "spans": []}
+    st.session_state["_profile_trace"] = trace
+    _stack().clear()
+    _stack().append(_open_span(trace, f"rerun {page}", {"page": page}))
+
+
+def end_run():
+    # Dipanggil di akhir halaman: tutup root, ekspor, tampilkan panel sidebar
+    trace = st.session_state.pop("_profile_trace", None)
+    if trace is None:
+        return
+
+    stack = _stack()
+    while stack:
+        _close_span(trace, stack.pop())
+    _release_tracing()
+
+    export_trace(trace)
+    render_sidebar(trace)
+
+
+def _traced_peak():
+    return tracemalloc.get_traced_memory()[1] if tracemalloc.is_tracing() else 0
+
+
+def _open_span(trace, name, attributes):
+    stack = _stack()
+    current = tracemalloc.get_traced_memory()[0] if tracemalloc.is_tracing() else 0
+    if stack:
+        # Puncak parent sejauh ini disimpan sebelum reset_peak untuk child
+        stack[-1]["peak"] = max(stack[-1]["peak"], _traced_peak())
+        tracemalloc.reset_peak()
+    return {
+        "trace_id": trace["trace_id"],
+        "span_id": _new_id(8),
+        "parent_span_id": stack[-1]["span_id"] if stack else "",
+        "name": name,
+        "start_ns": time.time_ns(),
+        "start": time.perf_counter(),
+        "memory_start": current,
+        "peak": current,
+        "concurrent_runs": _active_runs,
+        "attributes": dict(attributes),
+    }
+
+
+def _close_span(trace, span):
+    seconds = time.perf_counter() - span["start"]
+    span["end_ns"] = span["start_ns"] + int(seconds * 1e9)
+    span["attributes"]["duration_ms"] = seconds * 1000
+
+    # Puncak span = max(puncak child yang sudah ditutup, puncak sejak reset terakhir);
+    # diteruskan ke parent supaya reset_peak child berikutnya tidak menghapusnya
+    peak = max(span.pop("peak"), _traced_peak())
+    stack = _stack()
+    if stack:
+        stack[-1]["peak"] = max(stack[-1]["peak"], peak)
+
+    concurrent = max(span.pop("concurrent_runs"), _active_runs)
+    if span["parent_span_id"]:
+        span["attributes"]["memory_allocated_bytes"] = max(peak - span["memory_start"], 0)
+        span["attributes"]["concurrent_runs"] = concurrent
+    trace["spans"].append(span)
+
+
+@contextmanager
+def span(name, **attributes):
+    if not profiling_enabled():
+        yield attributes
+        return
+
+    # Rerun fragment (tanpa begin_run): span berdiri sendiri sebagai trace baru
+    trace = st.session_state.get("_profile_trace")
+    standalone = trace is None
+    if standalone:
+        _acquire_tracing()
+        trace = {"trace_id": _new_id(16), "spans": []}
+
+    current = _open_span(trace, name, attributes)
+    _stack().append(current)
+    try:
+        yield current["attributes"]
+    finally:
+        _stack().pop()
+        _close_span(trace, current)
+        if standalone:
+            _release_tracing()
+            export_trace(trace)
+
+
+def annotate(**attributes):
+    # Tambah/akumulasi atribut numerik pada span yang sedang berjalan
+    stack = _stack()
+    if not stack or not profiling_enabled():
+        return
+    target = stack[-1]["attributes"]
+    for key, value in attributes.items():
+        if isinstance(value, (int, float)) and not isinstance(value, bool) and key in target:
+            target[key] += value
+        else:
+            target[key] = value
+
+
+def figure_stats(cached):
+    # Titik yang diplot (panjang x/y/z per trace) + ukuran JSON yang dikirim ke browser,
+    # dicatat sekali saat figure diserialisasi (lihat dashboard/figcache.py)
+    return {"rows": cached.points, "figure_bytes": len(cached.spec)}
+
+
+# =========================
+# EKSPOR OTLP/JSON
+# =========================
+def _otlp_value(value):
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def to_otlp(trace):
+    spans = [
+        {
+            "traceId": span["trace_id"],
+            "spanId": span["span_id"],
+            "parentSpanId": span["parent_span_id"],
+            "name": span["name"],
+            "kind": 1,  # SPAN_KIND_INTERNAL
+            "startTimeUnixNano": str(span["start_ns"]),
+            "endTimeUnixNano": str(span["end_ns"]),
+            "attributes": [
+                {"key": f"dashboard.{key}", "value": _otlp_value(value)}
+                for key, value in span["attributes"].items()
+            ],
+        }
+        for span in trace["spans"]
+    ]
+    return {
+        "resourceSpans": [{
+            "resource": {"attributes": [{"key": "service.name", "value": {"stringValue": SERVICE_NAME}}]},
+            "scopeSpans": [{"scope": {"name": "dashboard.profiling"}, "spans": spans}],
+        }]
+    }
+
+
+def export_trace(trace, path=None):
+    # PROFILE_FILE dibaca saat dipanggil (seperti SNAPSHOT_DIR / ETL_CACHE_DIR)
+    path = path or PROFILE_FILE
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    line = json.dumps(to_otlp(trace))
+    with _file_lock, open(path, "a", encoding="utf-8") as f:
+        f.write(line + "\n")
+
+
+# =========================
+# PANEL SIDEBAR
+# =========================
+def spans_frame(trace):
+    rows = []
+    for span in trace["spans"]:
+        attrs = span["attributes"]
+        rows.append({
+            "section": span["name"],
+            "ms": attrs.get("duration_ms"),
+            "rows": attrs.get("rows"),
+            # Alokasi hanya bisa diatribusikan jika tidak ada rerun terprofil lain yang berjalan
+            "alloc_MB": (
+                attrs.get("memory_allocated_bytes", 0) / 1e6
+                if span["parent_span_id"] and attrs.get("concurrent_runs", 1) <= 1 else None
+            ),
+            "figure_KB": attrs["figure_bytes"] / 1e3 if "figure_bytes" in attrs else None,
+            "memo": attrs.get("figure_cached"),
+        })
+    return pd.DataFrame(rows).sort_values("ms", ascending=False, ignore_index=True)
+
+
+def render_sidebar(trace):
+    with st.sidebar.expander("⏱️ Profiling rerun", expanded=True):
+        st.dataframe(spans_frame(trace), hide_index=True, use_container_width=True)
+        cache = FIGURE_CACHE.stats()
+        st.caption(
+            f"Figure cache: {cache['hits']} hit / {cache['misses']} miss, "
+            f"{cache['entries']} figure, {cache['bytes'] / 1e6:.1f} / {cache['max_bytes'] / 1e6:.0f} MB"
+        )
+        st.caption(f"Trace `{trace['trace_id'][:8]}` → `{PROFILE_FILE}`")
@@ -0,0 +1,256 @@
+import numpy as np
+import pandas as pd
+
+from dashboard.etl import SCORE_WEIGHTS
+
+# =========================
+# QUERY ENGINE (tanpa Streamlit)
+# =========================
+# Semua agregat yang ditampilkan dashboard dihitung di sini sebagai fungsi murni,
+# sehingga halaman Streamlit dan API HTTP (dashboard/api.py) memakai kode yang sama.
+# Query belanja militer menerima ExpenditureCube, query avionik menerima frame avionik.
+#
+# Total_Score tidak diambil dari cube (nilai bobot tetap di CSV) melainkan dihitung ulang
+# dari komponen oleh ScoreEngine (dashboard/scoring.py) dengan bobot & normalisasi yang
+# sama seperti di halaman; parameter weights / renormalize hanya berlaku untuk metrik ini.
+SCORE_METRIC = "Total_Score"
+
+
+# ---------- Belanja militer (cube) ----------
+def expenditure_kpis(cube, year_range, countries=None):
+    return {
+        "country_count": cube.country_count(year_range, countries),
+        "total_expenditure": cube.total("Military_Expenditure_USD", year_range, countries),
+        "total_mro": cube.total("Estimated_MRO_USD", year_range, countries),
+        "mean_yoy": cube.mean("Military_Expenditure_YoY", year_range, countries),
+        "mean_political_stability": cube.mean("Political_Stability_Index", year_range, countries),
+    }
+
+
+def _score_weights(metric, scores, weights, renormalize):
+    # → bobot untuk ScoreEngine, atau None jika metrik dijawab cube
+    if metric != SCORE_METRIC:
+        if weights is not None or renormalize:
+            raise TypeError(f"weights / renormalize hanya berlaku untuk {SCORE_METRIC}")
+        return None
+    if scores is None:
+        raise ValueError(f"{SCORE_METRIC} membutuhkan ScoreEngine")
+    if weights is None:
+        return dict(SCORE_WEIGHTS)
+    if not isinstance(weights, dict):
+        raise TypeError("weights harus berupa objek {komponen: bobot}")
+    return weights
+
+
+# by="latest": nilai di tahun terbaru pada rentang; by="mean": rata-rata sepanjang rentang
+def legend_order(cube, metric, year_range, countries=None, by="latest", scores=None, weights=None, renormalize=False):
+    if by not in ("latest", "mean"):
+        raise ValueError(f"by harus 'latest' atau 'mean', bukan {by!r}")
+
+    score_weights = _score_weights(metric, scores, weights, renormalize)
+    if score_weights is not None:
+        if by == "latest":
+            year = cube.latest_year(year_range, countries)
+            if year is None:
+                return []
+            year_range = (year, year)
+        ranked = scores.ranking(score_weights, year_range, countries, renormalize)
+        return ranked["Country_clean"].tolist()
+
+    if by == "latest":
+        values = cube.values_at(metric, cube.latest_year(year_range, countries), countries)
+    else:
+        values = cube.mean_by_country(metric, year_range, countries)
+    return values.index.tolist()
+
+
+def ranking(cube, metric, year_range, countries=None, scores=None, weights=None, renormalize=False):
+    score_weights = _score_weights(metric, scores, weights, renormalize)
+    if score_weights is not None:
+        return scores.ranking(score_weights, year_range, countries, renormalize)
+    return cube.mean_by_country(metric, year_range, countries).reset_index()
+
+
+def heatmap(cube, metric, year_range, countries=None, scores=None, weights=None, renormalize=False):
+    score_weights = _score_weights(metric, scores, weights, renormalize)
+    if score_weights is not None:
+        return scores.heatmap(score_weights, year_range, countries, renormalize)
+    return cube.heatmap(metric, year_range, countries)
+
+
+# ---------- Perdagangan avionik (frame) ----------
+# Fungsi di bawah adalah referensi backend avionik (dashboard/backends.py); backend lain
+# harus menghasilkan urutan & nilai yang sama. Urutan penjumlahan berbeda antar engine,
+# jadi jumlah TIV (presisi sumber 2 desimal) dibulatkan ke SUM_DECIMALS dan urutan
+# rata-rata dibandingkan pada nilai yang dibulatkan ke SORT_DECIMALS: sisa pembulatan
+# floating point tidak mengubah hasil maupun urutan.
+SUM_DECIMALS = 6
+SORT_DECIMALS = 9
+
+
+def filter_trades(df, year_range, recipients=None):
+    filtered = df[
+        (df["year_of_order"] >= year_range[0]) &
+        (df["year_of_order"] <= year_range[1])
+    ]
+    if recipients:
+        filtered = filtered[filtered["recipient"].isin(recipients)]
+    return filtered
+
+
+def trade_summary(df):
+    return {
+        "transactions": len(df),
+        "importers": df["recipient"].nunique(),
+        "suppliers": df["supplier"].nunique(),
+        "total_tiv": round(float(df["sipri_tiv_of_delivered_weapons"].sum()), SUM_DECIMALS),
+    }
+
+
+def yearly_trades(df):
+    return df.groupby("year_of_order").size().reset_index(name="transactions")
+
+
+def tiv_yearly(df):
+    return df.groupby("year_of_order")["sipri_tiv_of_delivered_weapons"].sum().round(SUM_DECIMALS).reset_index()
+
+
+def top_counts(df, column):
+    # top_importers (recipient), top_suppliers (supplier), jenis senjata (weapon_description)
+    counts = (
+        df[column]
+        .value_counts()
+        .loc[lambda counts: counts > 0]  # kolom kategori: buang kategori tanpa transaksi
+        .reset_index()
+    )
+    counts.columns = [column, "transactions"]
+    # Urut turun menurut jumlah; seri → nama kolom (sama dengan ORDER BY DuckDB)
+    order = np.lexsort((counts[column].astype(str), -counts["transactions"].to_numpy()))
+    return counts.iloc[order].reset_index(drop=True)
+
+
+def mean_age_by(df, column):
+    # age_by_weapon (weapon_description), age_by_country (recipient)
+    # Urut naik menurut usia rata-rata; seri usia → nama kolom (sama dengan ORDER BY DuckDB)
+    means = df.groupby(column, observed=True)["weapon_age"].mean().reset_index()
+    order = np.lexsort((means[column].astype(str), means["weapon_age"].round(SORT_DECIMALS)))
+    return means.iloc[order].reset_index(drop=True)
+
+
+# =========================
+# REGISTRY (dipakai API)
+# =========================
+# name → (fungsi, parameter tambahan yang diteruskan); filter (year_range,
+# countries / recipients) selalu diterima
+EXPENDITURE_QUERIES = {
+    "kpis": (expenditure_kpis, []),
+    "legend_order": (legend_order, ["metric", "by", "weights", "renormalize"]),
+    "ranking": (ranking, ["metric", "weights", "renormalize"]),
+    "heatmap": (heatmap, ["metric", "weights", "renormalize"]),
+}
+
+AVIONICS_QUERIES = {
+    "trade_summary": (trade_summary, []),
+    "yearly_trades": (yearly_trades, []),
+    "tiv_yearly": (tiv_yearly, []),
+    "top_counts": (top_counts, ["column"]),
+    "mean_age_by": (mean_age_by, ["column"]),
+}
+
+QUERY_DATASETS = {
+    **{name: "expenditure" for name in EXPENDITURE_QUERIES},
+    **{name: "avionics" for name in AVIONICS_QUERIES},
+}
+
+
+# Filter divalidasi sebelum engine mana pun dipanggil: year_range = [awal, akhir]
+# (bilangan bulat), countries / recipients = list nama (diurutkan → key cache kanonik)
+FILTER_LISTS = ("countries", "recipients")
+
+
+def _year_range(value):
+    if (
+        not isinstance(value, (list, tuple))
+        or len(value) != 2
+        or not all(isinstance(year, int) and not isinstance(year, bool) for year in value)
+    ):
+        raise ValueError(f"year_range harus [tahun_awal, tahun_akhir] (2 bilangan bulat), bukan {value!r}")
+    if value[0] > value[1]:
+        raise ValueError(f"year_range: tahun awal {value[0]} > tahun akhir {value[1]}")
+    return [value[0], value[1]]
+
+
+def _names(key, value):
+    if not isinstance(value, (list, tuple)) or not all(isinstance(name, str) for name in value):
+        raise ValueError(f"{key} harus berupa list nama (string), bukan {value!r}")
+    return sorted(value)
+
+
+def validate_params(params):
+    if params is None:
+        return {}
+    if not isinstance(params, dict):
+        raise TypeError(f"params harus berupa objek JSON, bukan {type(params).__name__}")
+    params = dict(params)
+    if params.get("year_range") is not None:
+        params["year_range"] = _year_range(params["year_range"])
+    for key in FILTER_LISTS:
+        if params.get(key) is not None:
+            params[key] = _names(key, params[key])
+    return params
+
+
+def run_query(name, params, cube, avionics, scores=None):
+    params = validate_params(params)
+    year_range = params.pop("year_range", None)
+
+    if name in EXPENDITURE_QUERIES:
+        func, extra = EXPENDITURE_QUERIES[name]
+        year_range = year_range or (cube.year_min, cube.year_max)
+        kwargs = {key: params.pop(key) for key in extra if key in params}
+        countries = params.pop("countries", None)
+        _reject_unknown(name, params)
+        if "weights" in extra:
+            kwargs["scores"] = scores
+        return func(cube, year_range=year_range, countries=countries, **kwargs)
+
+    if name in AVIONICS_QUERIES:
+        func, extra = AVIONICS_QUERIES[name]
+        year_range = year_range or (avionics["year_of_order"].min(), avionics["year_of_order"].max())
+        kwargs = {key: params.pop(key) for key in extra if key in params}
+        filtered = filter_trades(avionics, year_range, params.pop("recipients", None))
+        _reject_unknown(name, params)
+        return func(filtered, **kwargs)
+
+    raise KeyError(f"query tidak dikenal: {name!r}")
+
+
+def _reject_unknown(name, params):
+    if params:
+        raise TypeError(f"{name}: parameter tidak dikenal {sorted(params)}")
+
+
+# =========================
+# HASIL → JSON
+# =========================
+def _plain(value):
+    if isinstance(value, (np.integer,)):
+        return int(value)
+    if isinstance(value, (np.floating, float)):
+        return None if np.isnan(value) else float(value)
+    return value
+
+
+def to_json_ready(result):
+    if isinstance(result, pd.DataFrame):
+        frame = result.astype(object).where(result.notna(), None)
+        return {
+            "index": [_plain(v) for v in frame.index],
+            "columns": [_plain(v) for v in frame.columns],
+            "data": [[_plain(v) for v in row] for row in frame.itertuples(index=False)],
+        }
+    if isinstance(result, dict):
+        return {key: _plain(value) for key, value in result.items()}
+    if isinstance(result, list):
+        return [_plain(value) for value in result]
+    return _plain(result)
@@ -0,0 +1,117 @@
+import numpy as np
+import pandas as pd
+import plotly.express as px
+
+# =========================
+# STRATEGI RENDER SCATTER
+# =========================
+# Jumlah titik menentukan cara render:
+#   <= WEBGL_POINT_THRESHOLD   → SVG biasa dengan hover lengkap
+#   <= DENSITY_POINT_THRESHOLD → WebGL (scattergl); hover hanya sumbu + warna
+#   di atasnya                 → titik di-bin 2D di server, satu marker per bin
+#                                (ukuran/warna = jumlah), drill-down via seleksi
+WEBGL_POINT_THRESHOLD = 5000
+DENSITY_POINT_THRESHOLD = 20000
+DENSITY_BINS = 60
+
+
+def scatter_mode(n_points):
+    if n_points > DENSITY_POINT_THRESHOLD:
+        return "density"
+    if n_points > WEBGL_POINT_THRESHOLD:
+        return "webgl"
+    return "svg"
+
+
+# =========================
+# BINNING 2D
+# =========================
+def _axis_bins(values, bins, log):
+    values = np.asarray(values, dtype=float)
+    if log:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            values = np.where(values > 0, np.log10(values), np.nan)
+
+    finite = values[np.isfinite(values)]
+    if not len(finite):
+        return np.full(len(values), -1)
+
+    lo, hi = finite.min(), finite.max()
+    span = (hi - lo) or 1.0
+    idx = np.floor((values - lo) / span * bins)
+    idx = np.clip(np.nan_to_num(idx, nan=-1), -1, bins - 1).astype(int)
+    return np.where(np.isfinite(values), idx, -1)
+
+
+def bin_ids(df, x, y, bins=DENSITY_BINS, log_x=False, log_y=False):
+    # -1 = titik yang tidak bisa diplot (NaN / <= 0 di sumbu log)
+    ix = _axis_bins(df[x], bins, log_x)
+    iy = _axis_bins(df[y], bins, log_y)
+    return np.where((ix < 0) | (iy < 0), -1, ix * bins + iy)
+
+
+def bin_points(df, x, y, bins=DENSITY_BINS, log_x=False, log_y=False):
+    ids = bin_ids(df, x, y, bins, log_x, log_y)
+    keep = ids >= 0
+
+    # Posisi marker = rata-rata titik anggota bin (lebih akurat dari titik tengah bin)
+    binned = (
+        pd.DataFrame({x: df[x].to_numpy()[keep], y: df[y].to_numpy()[keep], "bin": ids[keep]})
+        .groupby("bin")
+        .agg(**{x: (x, "mean"), y: (y, "mean"), "count": (x, "size")})
+        .reset_index()
+    )
+    return binned
+
+
+# =========================
+# FIGURE
+# =========================
+def adaptive_scatter(df, x, y, hover_data=None, log_x=False, log_y=False, **px_kwargs):
+    mode = scatter_mode(len(df))
+
+    if mode == "density":
+        binned = bin_points(df, x, y, log_x=log_x, log_y=log_y)
+        fig = px.scatter(
+            binned,
+            x=x,
+            y=y,
+            size="count",
+            color="count",
+            log_x=log_x,
+            log_y=log_y,
+            render_mode="webgl",
+            labels={**px_kwargs.get("labels", {}), "count": "Jumlah titik"},
+            color_continuous_scale="Viridis",
+        )
+        fig.update_traces(
+            marker=dict(sizemode="area", sizeref=binned["count"].max() / 30**2, sizemin=3),
+            hovertemplate="%{x}, %{y}<br>%{marker.color:,} titik<extra></extra>",
+        )
+        fig.update_layout(dragmode="select")
+        return fig
+
+    # Kolom hover tambahan hanya dikirim untuk chart kecil; di mode WebGL detail
+    # baris dilihat lewat tabel / drill-down
+    if mode == "webgl":
+        hover_data = None
+        px_kwargs.pop("hover_name", None)
+
+    return px.scatter(
+        df,
+        x=x,
+        y=y,
+        hover_data=hover_data,
+        log_x=log_x,
+        log_y=log_y,
+        render_mode="webgl" if mode == "webgl" else "svg",
+        **px_kwargs,
+    )
+
+
+def drilldown_rows(df, x, y, point_indices, log_x=False, log_y=False):
+    # point_indices = indeks marker bin yang diseleksi user (box/lasso) pada chart density;
+    # bin dihitung ulang dari df yang sama sehingga indeksnya identik dengan figure
+    binned = bin_points(df, x, y, log_x=log_x, log_y=log_y)
+    selected = binned["bin"].to_numpy()[list(point_indices)]
+    return df[np.isin(bin_ids(df, x, y, log_x=log_x, log_y=log_y), selected)]
@@ -0,0 +1,203 @@
+import numpy as np
+import pandas as pd
+
+# =========================
+# 🏆 TOTAL SCORE DINAMIS
+# =========================
+# Total_Score di df_asia_final.csv dinormalisasi min-max atas seluruh dataset dengan
+# bobot tetap (lihat etl.finalize). Engine ini menyimpan nilai mentah tiap komponen
+# sehingga skor bisa dihitung ulang untuk bobot apa pun dan, opsional, dinormalisasi
+# ulang atas subset negara × tahun yang sedang difilter.
+#
+# komponen → (kolom mentah, kolom yang NaN-nya membuat skor komponen NaN). Default sama
+# dengan df_asia_final.csv (growth dari YoY mentah), sehingga bobot default mereproduksi
+# Total_Score file tersebut.
+SCORE_COMPONENTS = {
+    "Score_Expenditure": ("Military_Expenditure_USD", None),
+    "Score_Growth": ("Military_Expenditure_YoY", "Military_Expenditure_YoY"),
+    "Score_pctGovt": ("Military_Expenditure_pct_Govt", None),
+    "Score_Politics": ("Political_Stability_Index", None),
+}
+
+# Opt-in: growth dari YoY yang di-clip (etl.YOY_CLIP), seperti metode ETL "revised"
+CLIPPED_SCORE_COMPONENTS = {
+    **SCORE_COMPONENTS,
+    "Score_Growth": ("Military_Expenditure_YoY_Clipped", "Military_Expenditure_YoY"),
+}
+
+
+class ScoreEngine:
+    def __init__(self, df, components=SCORE_COMPONENTS):
+        self.components = list(components)
+
+        # Matriks baris × komponen (nilai mentah) + mask komponen yang tidak terdefinisi
+        self.values = np.column_stack([
+            pd.to_numeric(df[raw], errors="coerce").to_numpy(float) for raw, _ in components.values()
+        ])
+        self.missing = np.column_stack([
+            df[flag].isna().to_numpy() if flag else np.zeros(len(df), bool)
+            for _, flag in components.values()
+        ])
+
+        self.countries = np.array(sorted(df["Country_clean"].unique()), dtype=object)
+        self.country_idx = pd.Categorical(df["Country_clean"], categories=self.countries).codes.astype(np.int64)
+        self.year_min = int(df["Year"].min())
+        self.year_max = int(df["Year"].max())
+        self.years = np.arange(self.year_min, self.year_max + 1)
+        self.year_idx = df["Year"].to_numpy(int) - self.year_min
+
+        # Min/max per sel negara × tahun × komponen (sel kosong: +inf / -inf)
+        shape = (len(self.countries), len(self.years), len(self.components))
+        cell_min = np.full(shape, np.inf)
+        cell_max = np.full(shape, -np.inf)
+        for c in range(len(self.components)):
+            valid = ~np.isnan(self.values[:, c])
+            cells = (self.country_idx[valid], self.year_idx[valid], c)
+            np.minimum.at(cell_min, cells, self.values[valid, c])
+            np.maximum.at(cell_max, cells, self.values[valid, c])
+
+        self._min_table = self._sparse_table(cell_min, np.minimum)
+        self._max_table = self._sparse_table(cell_max, np.maximum)
+
+        self.global_bounds = (np.nanmin(self.values, axis=0), np.nanmax(self.values, axis=0))
+        self._last = (None, None)
+
+    # ---------- Indeks min/max rentang tahun ----------
+    # Sparse table sepanjang sumbu tahun: level k = min/max jendela 2^k tahun, sehingga
+    # min/max rentang tahun mana pun = gabungan dua jendela yang saling tumpang tindih, O(negara).
+    @staticmethod
+    def _sparse_table(cells, reduce):
+        table = [cells]
+        width = 1
+        while width * 2 <= cells.shape[1]:
+            prev = table[-1]
+            table.append(reduce(prev[:, :-width], prev[:, width:]))
+            width *= 2
+        return table
+
+    def _year_slice(self, year_range):
+        start = min(max(int(year_range[0]), self.year_min), self.year_max + 1) - self.year_min
+        stop = min(max(int(year_range[1]), self.year_min - 1), self.year_max) - self.year_min + 1
+        return start, max(stop, start)
+
+    def _country_mask(self, countries):
+        if not countries:
+            return np.ones(len(self.countries), dtype=bool)
+        return np.isin(self.countries, list(countries))
+
+    def bounds(self, year_range=None, countries=None):
+        # (min, max) per komponen pada subset negara × tahun
+        if year_range is None and not countries:
+            return self.global_bounds
+
+        start, stop = self._year_slice(year_range or (self.year_min, self.year_max))
+        if stop == start:
+            empty = np.full(len(self.components), np.nan)
+            return empty, empty
+
+        k = (stop - start).bit_length() - 1
+        mask = self._country_mask(countries)
+        lo = np.minimum(self._min_table[k][mask, start], self._min_table[k][mask, stop - (1 << k)])
+        hi = np.maximum(self._max_table[k][mask, start], self._max_table[k][mask, stop - (1 << k)])
+        return lo.min(axis=0, initial=np.inf), hi.max(axis=0, initial=-np.inf)
+
+    # ---------- Bobot ----------
+    def weight_matrix(self, weights):
+        # dict → 1 vektor; list dict / array (k × komponen) → k vektor; tiap vektor dinormalisasi ke jumlah 1
+        if isinstance(weights, dict):
+            weights = [weights]
+        if len(weights) and isinstance(weights[0], dict):
+            unknown = {key for w in weights for key in w} - set(self.components)
+            if unknown:
+                raise TypeError(f"komponen skor tidak dikenal: {sorted(unknown)}")
+            weights = [[w.get(c, 0.0) for c in self.components] for w in weights]
+
+        matrix = np.atleast_2d(np.asarray(weights, float))
+        if matrix.shape[1] != len(self.components):
+            raise ValueError(f"bobot harus berisi {len(self.components)} komponen: {self.components}")
+        totals = matrix.sum(axis=1, keepdims=True)
+        if (matrix < 0).any() or (totals <= 0).any():
+            raise ValueError("bobot tidak boleh negatif dan jumlahnya harus > 0")
+        return matrix / totals
+
+    # ---------- Skor ----------
+    def _rows(self, year_range, countries):
+        mask = np.ones(len(self.year_idx), bool)
+        if year_range is not None:
+            start, stop = self._year_slice(year_range)
+            mask &= (self.year_idx >= start) & (self.year_idx < stop)
+        if countries:
+            mask &= self._country_mask(countries)[self.country_idx]
+        return mask
+
+    def normalized(self, year_range=None, countries=None, renormalize=False):
+        # Skor komponen (baris subset × komponen), min-max seperti etl.min_max; hasil terakhir
+        # disimpan karena perubahan bobot saja tidak mengubah normalisasi
+        key = (year_range and tuple(map(int, year_range)), tuple(sorted(countries or [])), renormalize)
+        last_key, last = self._last
+        if last_key == key:
+            return last
+
+        rows = self._rows(year_range, countries)
+        lo, hi = self.bounds(year_range, countries) if renormalize else self.global_bounds
+        span = hi - lo
+        with np.errstate(invalid="ignore", divide="ignore"):
+            scores = np.where(span > 0, (self.values[rows] - lo) / span, 0.0)
+
+        self._last = (key, (rows, scores))
+        return rows, scores
+
+    def scores(self, weights, year_range=None, countries=None, renormalize=False):
+        # (baris subset × vektor bobot) dalam satu perkalian matriks. Komponen yang tidak
+        # terdefinisi (mis. growth tanpa tahun sebelumnya) → NaN, kecuali bobotnya 0
+        matrix = self.weight_matrix(weights)
+        rows, scores = self.normalized(year_range, countries, renormalize)
+
+        totals = np.nan_to_num(scores) @ matrix.T
+        undefined = (self.missing[rows] | np.isnan(scores)).astype(float) @ (matrix > 0).T.astype(float)
+        return rows, np.where(undefined > 0, np.nan, totals)
+
+    # ---------- Agregat ----------
+    def country_scores(self, weights, year_range=None, countries=None, renormalize=False):
+        # DataFrame negara × vektor bobot: rata-rata Total_Score pada rentang filter.
+        # Baris diurutkan per negara lalu dijumlah per blok (reduceat) untuk semua vektor sekaligus
+        rows, totals = self.scores(weights, year_range, countries, renormalize)
+        country_idx = self.country_idx[rows]
+        order = np.argsort(country_idx, kind="stable")
+        if not len(order):
+            return pd.DataFrame(index=pd.Index([], name="Country_clean"), columns=range(totals.shape[1]), dtype=float)
+
+        present, starts = np.unique(country_idx[order], return_index=True)
+        valid = ~np.isnan(totals[order])
+        sums = np.add.reduceat(np.where(valid, totals[order], 0.0), starts, axis=0)
+        counts = np.add.reduceat(valid.astype(float), starts, axis=0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            means = np.where(counts > 0, sums / counts, np.nan)
+        return pd.DataFrame(means, index=pd.Index(self.countries[present], name="Country_clean"))
+
+    def ranking(self, weights, year_range=None, countries=None, renormalize=False):
+        # Format sama dengan queries.ranking(cube, "Total_Score", ...)
+        means = self.country_scores(weights, year_range, countries, renormalize)[0].rename("Total_Score")
+        return means.sort_values(ascending=False, kind="stable").reset_index()
+
+    def heatmap(self, weights, year_range=None, countries=None, renormalize=False):
+        # Rata-rata Total_Score per sel negara × tahun (vektor bobot pertama)
+        rows, totals = self.scores(weights, year_range, countries, renormalize)
+        values = totals[:, 0]
+        valid = ~np.isnan(values)
+        cells = self.country_idx[rows] * len(self.years) + self.year_idx[rows]
+        size = len(self.countries) * len(self.years)
+
+        sums = np.bincount(cells[valid], values[valid], minlength=size)
+        counts = np.bincount(cells[valid], minlength=size)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            means = np.where(counts > 0, sums / counts, np.nan).reshape(len(self.countries), len(self.years))
+
+        start, stop = self._year_slice(year_range or (self.year_min, self.year_max))
+        frame = pd.DataFrame(
+            means[:, start:stop],
+            index=pd.Index(self.countries, name="Country_clean"),
+            columns=pd.Index(self.years[start:stop], name="Year"),
+        )
+        # pivot_table membuang baris/kolom yang seluruhnya kosong
+        return frame.dropna(how="all").dropna(axis=1, how="all")
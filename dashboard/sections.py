@@ -0,0 +1,45 @@
+from functools import wraps
+
+import streamlit as st
+
+from dashboard.figcache import FIGURE_CACHE, canonical
+from dashboard.profiling import annotate, figure_stats, profiling_enabled, span
+
+# =========================
+# RENDER PER SECTION (fragment + figure ter-cache)
+# =========================
+# Setiap section chart mendeklarasikan input yang dipakainya (mis. rentang tahun,
+# negara). Section dijalankan sebagai st.fragment dan figure-nya disimpan sebagai JSON
+# di cache lintas sesi berdasarkan nilai input tsb (lihat dashboard/figcache.py), sehingga
+# chart yang inputnya tidak berubah tidak dibangun ulang dan payload-nya identik
+# (Streamlit tidak mengirim ulang pesan yang sama ke browser).
+
+
+def chart_section(*depends_on):
+    def decorator(render):
+        @st.fragment
+        @wraps(render)
+        def fragment(**inputs):
+            # "version" = versi dataset (lihat dashboard/data.py), selalu bagian dari key
+            undeclared = set(inputs) - set(depends_on) - {"version"}
+            if undeclared:
+                raise TypeError(f"{render.__name__}: input tidak dideklarasikan {sorted(undeclared)}")
+
+            key = canonical(inputs)
+
+            def figure(build, tag=""):
+                # → CachedFigure; ditampilkan dengan figcache.plotly_chart
+                if not profiling_enabled():
+                    return FIGURE_CACHE.get_or_build((render.__name__, tag, key), build)
+
+                built = []
+                cached = FIGURE_CACHE.get_or_build((render.__name__, tag, key), lambda: built.append(1) or build())
+                annotate(figure_cached=not built, **figure_stats(cached))
+                return cached
+
+            with span(render.__name__):
+                render(figure, **inputs)
+
+        return fragment
+
+    return decorator
@@ -0,0 +1,132 @@
+import glob
+import hashlib
+import os
+import sys
+import time
+
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from dashboard.trade import (
+    TRADE_REGISTER_PATH,
+    AVIONICS_REF_PATH,
+    read_trade_register,
+    read_avionics_reference,
+)
+
+# =========================
+# KONFIGURASI SNAPSHOT
+# =========================
+# Snapshot disimpan sebagai file Arrow IPC (tanpa kompresi) agar bisa di-memory-map
+# saat startup. Nama file memuat hash sumber, jadi CSV hanya di-parse ulang
+# ketika isi file sumber berubah.
+SNAPSHOT_DIR = os.environ.get("DASHBOARD_SNAPSHOT_DIR", os.path.join("build", "snapshots"))
+
+# Naikkan jika logika parsing berubah, supaya snapshot lama tidak dipakai lagi
+SNAPSHOT_VERSION = "1"
+
+SOURCES = {
+    "trade_register": (TRADE_REGISTER_PATH, read_trade_register),
+    "avionics_reference": (AVIONICS_REF_PATH, read_avionics_reference),
+}
+
+
+# =========================
+# HASH SUMBER
+# =========================
+def file_hash(path, chunk_size=1 << 20):
+    digest = hashlib.sha256(SNAPSHOT_VERSION.encode())
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()[:16]
+
+
+def snapshot_path(name, digest):
+    return os.path.join(SNAPSHOT_DIR, f"{name}-{digest}.arrow")
+
+
+# =========================
+# TULIS / BACA SNAPSHOT
+# =========================
+def write_snapshot(df, path):
+    table = pa.Table.from_pandas(df, preserve_index=False)
+
+    # Kolom teks disimpan sebagai dictionary (kategori) supaya ringkas
+    for i, field in enumerate(table.schema):
+        if pa.types.is_string(field.type) or pa.types.is_large_string(field.type):
+            table = table.set_column(i, field.name, pc.dictionary_encode(table.column(i)))
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with pa.OSFile(tmp_path, "wb") as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+
+    # Rename atomik: proses lain tidak pernah membaca file setengah jadi
+    os.replace(tmp_path, path)
+
+
+def read_snapshot(path):
+    with pa.memory_map(path, "r") as source:
+        table = pa.ipc.open_file(source).read_all()
+
+    # Dekode dictionary kembali ke string agar dtype sama dengan jalur CSV;
+    # kolom yang memang kategori di pandas tetap kategori
+    metadata = table.schema.pandas_metadata or {}
+    categorical = {c["name"] for c in metadata.get("columns", []) if c["pandas_type"] == "categorical"}
+    for i, field in enumerate(table.schema):
+        if pa.types.is_dictionary(field.type) and field.name not in categorical:
+            table = table.set_column(i, field.name, pc.cast(table.column(i), field.type.value_type))
+
+    return table.to_pandas()
+
+
+def _remove_stale(name, keep_path):
+    for path in glob.glob(os.path.join(SNAPSHOT_DIR, f"{name}-*.arrow")):
+        if path != keep_path:
+            os.remove(path)
+
+
+def load_snapshot(name):
+    source_path, parser = SOURCES[name]
+    path = snapshot_path(name, file_hash(source_path))
+
+    if os.path.exists(path):
+        return read_snapshot(path)
+
+    # Hash berubah (atau belum pernah di-build): fallback ke CSV lalu simpan snapshot
+    df = parser(source_path)
+    write_snapshot(df, path)
+    _remove_stale(name, path)
+    return df
+
+
+def load_trade_register():
+    return load_snapshot("trade_register")
+
+
+def load_avionics_reference():
+    return load_snapshot("avionics_reference")
+
+
+# =========================
+# BUILD STEP
+# =========================
+def build_snapshots(force=False):
+    built = {}
+    for name, (source_path, parser) in SOURCES.items():
+        path = snapshot_path(name, file_hash(source_path))
+        if force or not os.path.exists(path):
+            start = time.perf_counter()
+            write_snapshot(parser(source_path), path)
+            _remove_stale(name, path)
+            built[name] = time.perf_counter() - start
+    return built
+
+
+if __name__ == "__main__":
+    built = build_snapshots(force="--force" in sys.argv[1:])
+    for name, seconds in built.items():
+        print(f"{name}: {seconds:.2f}s")
+    print(f"{len(built)} snapshot dibuat di {SNAPSHOT_DIR}")
@@ -0,0 +1,202 @@
+import csv
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from dashboard.snapshot import SNAPSHOT_DIR, file_hash, snapshot_path, write_snapshot, read_snapshot, _remove_stale
+from dashboard.trade import (
+    TRADE_REGISTER_PATH,
+    AVIONICS_REF_PATH,
+    NUMERIC_COLS,
+    read_avionics_reference,
+    read_trade_register,
+    normalize_trade_register,
+    build_avionics_frame,
+    concat_categorical,
+)
+
+# =========================
+# STREAMING TRADE REGISTER (out-of-core)
+# =========================
+# Register global lengkap (atau gabungan beberapa feed) tidak perlu dimuat utuh:
+# CSV dibaca per batch CHUNK_ROWS baris → normalisasi → filter whitelist avionik →
+# kolom turunan. Yang tetap di memori hanya subset avionik, ringkasan per tahun &
+# per penerima untuk seluruh register, serta sidik jari 8 byte per baris untuk
+# drop_duplicates lintas batch. Puncak memori kerja = satu batch, berapa pun ukuran file.
+CHUNK_ROWS = int(os.environ.get("DASHBOARD_STREAM_CHUNK_ROWS", 100_000))
+
+# Register di atas ukuran ini otomatis lewat jalur streaming (lihat dashboard/data.py)
+STREAM_THRESHOLD_BYTES = int(os.environ.get("DASHBOARD_STREAM_THRESHOLD_MB", 256)) * 1_000_000
+
+SUMMARY_NAMES = ["register_by_year", "register_by_recipient"]
+
+
+def sniff_separator(path, encoding="latin1"):
+    # Sama dengan sep=None (engine python), tapi cukup sekali dari header
+    # sehingga batch bisa dibaca dengan engine C
+    with open(path, encoding=encoding) as f:
+        header = f.readline()
+    return csv.Sniffer().sniff(header, delimiters=";,\t|").delimiter
+
+
+def iter_register_batches(path=TRADE_REGISTER_PATH, chunk_rows=CHUNK_ROWS):
+    reader = pd.read_csv(
+        path,
+        encoding="latin1",
+        sep=sniff_separator(path),
+        chunksize=chunk_rows,
+    )
+    float_cols = [col for col in NUMERIC_COLS if col != "year_of_order"]
+    offset = 0
+    with reader:
+        for chunk in reader:
+            # Index = posisi baris mentah di register (sebelum dedup), sama dengan index
+            # jalur baca penuh (read_trade_register → drop_duplicates mempertahankannya)
+            chunk.index = pd.RangeIndex(offset, offset + len(chunk))
+            offset += len(chunk)
+
+            # dtype per batch bisa berbeda (mis. kolom tanpa NaN → int64, kolom kosong →
+            # float64); samakan dengan jalur baca penuh supaya hash & concat konsisten
+            batch = normalize_trade_register(chunk)
+            batch[float_cols] = batch[float_cols].astype("float64")
+            for col in batch.columns.difference(NUMERIC_COLS):
+                batch[col] = batch[col].astype("str")
+            yield batch
+
+
+# =========================
+# DEDUP LINTAS BATCH
+# =========================
+class SeenRows:
+    # Hash baris yang sudah lewat, disimpan terurut (8 byte/baris)
+    def __init__(self):
+        self.hashes = np.empty(0, dtype=np.uint64)
+
+    def first_seen(self, hashes):
+        pos = np.searchsorted(self.hashes, hashes).clip(max=max(len(self.hashes) - 1, 0))
+        seen = (self.hashes[pos] == hashes) if len(self.hashes) else np.zeros(len(hashes), bool)
+        self.hashes = np.sort(np.concatenate([self.hashes, hashes[~seen]]), kind="stable")
+        return ~seen
+
+
+# =========================
+# RINGKASAN SELURUH REGISTER
+# =========================
+def _batch_summaries(batch):
+    recipient = batch["recipient"].fillna("unknown").str.lower().str.strip()
+    frame = pd.DataFrame({
+        "year_of_order": batch["year_of_order"],
+        "recipient": recipient,
+        "transactions": 1,
+        "sipri_tiv_of_delivered_weapons": batch["sipri_tiv_of_delivered_weapons"].fillna(0),
+    })
+    return {
+        "register_by_year": frame.groupby("year_of_order")[["transactions", "sipri_tiv_of_delivered_weapons"]].sum(),
+        "register_by_recipient": frame.groupby("recipient")[["transactions", "sipri_tiv_of_delivered_weapons"]].sum(),
+    }
+
+
+def _accumulate(totals, parts):
+    for name, part in parts.items():
+        totals[name] = part if name not in totals else totals[name].add(part, fill_value=0)
+
+
+def _finish_summaries(totals):
+    return {
+        name: totals[name].astype({"transactions": "int64"}).sort_index().reset_index()
+        for name in SUMMARY_NAMES
+    }
+
+
+def summarize_register(df_trade):
+    # Register yang sudah dimuat utuh (jalur non-streaming): satu "batch"
+    return _finish_summaries(_batch_summaries(df_trade))
+
+
+# =========================
+# STREAM → SUBSET AVIONIK
+# =========================
+def stream_avionics(path=TRADE_REGISTER_PATH, ref_path=AVIONICS_REF_PATH, chunk_rows=CHUNK_ROWS):
+    df_av_ref = read_avionics_reference(ref_path)
+    seen = SeenRows()
+
+    frames = []
+    totals = {}
+    stats = {"batches": 0, "rows": 0, "duplicates": 0}
+
+    for batch in iter_register_batches(path, chunk_rows):
+        # drop_duplicates per batch sudah dilakukan normalize; sisanya lintas batch
+        first = seen.first_seen(pd.util.hash_pandas_object(batch, index=False).to_numpy())
+        stats["duplicates"] += int((~first).sum())
+        batch = batch[first]
+
+        _accumulate(totals, _batch_summaries(batch))
+        frames.append(build_avionics_frame(batch, df_av_ref))
+
+        stats["batches"] += 1
+        stats["rows"] += len(batch)
+
+    df_av = concat_categorical(frames)
+    stats["avionics_rows"] = len(df_av)
+
+    return df_av, _finish_summaries(totals), stats
+
+
+# =========================
+# RINGKASAN TERSIMPAN
+# =========================
+def save_summaries(summaries, path=TRADE_REGISTER_PATH):
+    digest = file_hash(path)
+    for name, frame in summaries.items():
+        target = snapshot_path(name, digest)
+        write_snapshot(frame, target)
+        _remove_stale(name, target)
+
+
+def load_summaries(path=TRADE_REGISTER_PATH):
+    # None jika register belum pernah di-stream sejak terakhir berubah
+    digest = file_hash(path)
+    try:
+        return {name: read_snapshot(snapshot_path(name, digest)) for name in SUMMARY_NAMES}
+    except FileNotFoundError:
+        return None
+
+
+def register_summaries(path=TRADE_REGISTER_PATH, ref_path=AVIONICS_REF_PATH):
+    # Ringkasan per tahun / per penerima untuk seluruh register (bukan hanya subset
+    # avionik). Dibuat sekali per hash register: register besar lewat streaming,
+    # register kecil dari baca penuh
+    summaries = load_summaries(path)
+    if summaries is None:
+        if should_stream(path):
+            _, summaries, _ = stream_avionics(path, ref_path)
+        else:
+            summaries = summarize_register(read_trade_register(path))
+        save_summaries(summaries, path)
+    return summaries
+
+
+def should_stream(path=TRADE_REGISTER_PATH):
+    return os.environ.get("DASHBOARD_STREAMING") == "1" or os.path.getsize(path) >= STREAM_THRESHOLD_BYTES
+
+
+def load_streamed_avionics(path=TRADE_REGISTER_PATH, ref_path=AVIONICS_REF_PATH):
+    df_av, summaries, _ = stream_avionics(path, ref_path)
+    save_summaries(summaries, path)
+    return df_av
+
+
+if __name__ == "__main__":
+    # python -m dashboard.stream [register.csv]
+    path = sys.argv[1] if len(sys.argv) > 1 else TRADE_REGISTER_PATH
+
+    start = time.perf_counter()
+    df_av, summaries, stats = stream_avionics(path)
+    save_summaries(summaries, path)
+
+    print(f"{path}: {stats} dalam {time.perf_counter() - start:.2f}s")
+    print(f"subset avionik: {df_av.memory_usage(deep=True).sum() / 1e6:.1f} MB")
+    print(f"ringkasan di {SNAPSHOT_DIR}: {', '.join(SUMMARY_NAMES)}")
@@ -0,0 +1,141 @@
+import os
+import tempfile
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+# =========================
+# TABEL TER-PAGINASI (server-side)
+# =========================
+# Sorting, filter kolom, dan paginasi dikerjakan di server: browser hanya menerima
+# jendela baris yang sedang ditampilkan. Urutan baris (posisi hasil filter + sort)
+# disimpan per sesi dan hanya dihitung ulang jika input/sort/filter berubah.
+PAGE_SIZE_OPTIONS = [25, 50, 100, 250]
+
+# Export CSV ditulis ke file sementara per potongan baris: selama export hanya satu
+# potongan yang ada di memori (Streamlit sendiri membaca file jadi saat download)
+EXPORT_CHUNK_ROWS = 5000
+
+
+# =========================
+# FILTER & SORT
+# =========================
+def filter_mask(series, query):
+    query = query.strip()
+    if not query:
+        return np.ones(len(series), dtype=bool)
+
+    # Kolom numerik: "a:b" = rentang inklusif (sisi kosong = tanpa batas), selain itu nilai persis
+    if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+        values = series.to_numpy(dtype=float, na_value=np.nan)
+        if ":" in query:
+            lo, hi = (pd.to_numeric(part or np.nan, errors="coerce") for part in query.split(":", 1))
+            mask = np.ones(len(values), dtype=bool)
+            if not np.isnan(lo):
+                mask &= values >= lo
+            if not np.isnan(hi):
+                mask &= values <= hi
+            return mask
+        target = pd.to_numeric(query, errors="coerce")
+        return values == target
+
+    # Kolom teks/kategori: substring tanpa membedakan huruf besar-kecil
+    text = series.astype(str).str.lower()
+    return text.str.contains(query.lower(), regex=False).fillna(False).to_numpy(bool)
+
+
+def sorted_positions(df, sort_col=None, ascending=True, filter_col=None, query=""):
+    positions = np.arange(len(df))
+    if filter_col and query:
+        positions = np.flatnonzero(filter_mask(df[filter_col], query))
+
+    if sort_col:
+        values = df[sort_col].iloc[positions].reset_index(drop=True)
+        order = values.sort_values(ascending=ascending, kind="stable", na_position="last").index
+        positions = positions[order.to_numpy()]
+
+    return positions
+
+
+# =========================
+# EXPORT CSV (per potongan)
+# =========================
+def iter_csv_chunks(df, positions, chunk_rows=EXPORT_CHUNK_ROWS):
+    for start in range(0, max(len(positions), 1), chunk_rows):
+        chunk = df.iloc[positions[start:start + chunk_rows]]
+        yield chunk.to_csv(index=False, header=(start == 0)).encode("utf-8")
+
+
+def export_csv(df, positions, chunk_rows=EXPORT_CHUNK_ROWS):
+    # File dibuka ulang "rb" (BufferedReader, tipe yang diterima download_button untuk
+    # data deferred) lalu di-unlink: isinya hilang begitu handle ditutup
+    sink = tempfile.NamedTemporaryFile("wb", suffix=".csv", delete=False)
+    try:
+        with sink:
+            for chunk in iter_csv_chunks(df, positions, chunk_rows):
+                sink.write(chunk)
+        return open(sink.name, "rb")
+    finally:
+        os.unlink(sink.name)
+
+
+# =========================
+# KOMPONEN STREAMLIT
+# =========================
+def _positions_cached(df, key, cache_key, sort_col, ascending, filter_col, query):
+    # Tanpa cache_key, identitas objek df dipakai (tetap sama selama rerun fragment)
+    content = id(df) if cache_key is None else cache_key
+    signature = (content, len(df), sort_col, ascending, filter_col, query)
+    state = st.session_state.get(f"_table_{key}")
+    if state is None or state[0] != signature:
+        state = (signature, sorted_positions(df, sort_col, ascending, filter_col, query))
+        st.session_state[f"_table_{key}"] = state
+        # Isi/urutan berubah → kembali ke halaman pertama
+        st.session_state[f"{key}_page"] = 1
+    return state[1]
+
+
+# cache_key: nilai yang menentukan isi df (mis. input filter sidebar); urutan baris
+# dipakai ulang selama cache_key, sort, dan filter tidak berubah
+@st.fragment
+def paged_table(df, key, cache_key=None, default_sort=None, ascending=True, file_name="data.csv"):
+    columns = list(df.columns)
+
+    col_sort, col_order, col_filter, col_query, col_size = st.columns([3, 2, 3, 3, 2])
+    sort_col = col_sort.selectbox(
+        "Urutkan", columns, index=columns.index(default_sort) if default_sort in columns else None,
+        placeholder="(urutan asli)", key=f"{key}_sort"
+    )
+    order = col_order.radio(
+        "Arah", ["Naik", "Turun"], index=0 if ascending else 1, horizontal=True, key=f"{key}_order"
+    )
+    filter_col = col_filter.selectbox("Filter kolom", columns, index=None, placeholder="(tanpa filter)", key=f"{key}_filter")
+    query = col_query.text_input("Nilai filter", key=f"{key}_query", help="Teks: mengandung. Angka: nilai persis atau rentang a:b")
+    page_size = col_size.selectbox("Baris/halaman", PAGE_SIZE_OPTIONS, key=f"{key}_size")
+
+    positions = _positions_cached(df, key, cache_key, sort_col, order == "Naik", filter_col, query)
+
+    n_pages = max(1, -(-len(positions) // page_size))
+    page_key = f"{key}_page"
+    if st.session_state[page_key] > n_pages:
+        st.session_state[page_key] = n_pages
+
+    start = (st.session_state[page_key] - 1) * page_size
+    window = positions[start:start + page_size]
+    st.dataframe(df.iloc[window], use_container_width=True)
+
+    col_page, col_info, col_export = st.columns([2, 5, 2])
+    col_page.number_input("Halaman", min_value=1, max_value=n_pages, step=1, key=page_key)
+    col_info.caption(
+        f"Baris {min(start + 1, len(positions)):,}–{start + len(window):,} dari {len(positions):,} "
+        f"(total {len(df):,} sebelum filter kolom)"
+    )
+    col_export.download_button(
+        "⬇️ Export CSV",
+        data=lambda: export_csv(df, positions),
+        file_name=file_name,
+        mime="text/csv",
+        key=f"{key}_export",
+        on_click="ignore",
+    )
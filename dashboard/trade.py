@@ -0,0 +1,166 @@
+import pandas as pd
+import numpy as np
+
+from dashboard.factors import delivery_status
+
+# =========================
+# KONFIGURASI
+# =========================
+TRADE_REGISTER_PATH = "trade-register-edited.csv"
+AVIONICS_REF_PATH = "avionik_weapon_sipri.csv"
+
+CURRENT_YEAR = 2026
+
+NUMERIC_COLS = [
+    "year_of_order",
+    "number_ordered",
+    "number_delivered",
+    "years_of_delivery",
+    "sipri_tiv_per_unit",
+    "sipri_tiv_for_total_order",
+    "sipri_tiv_of_delivered_weapons"
+]
+
+TEXT_COLS = [
+    "recipient", "supplier", "weapon_designation",
+    "weapon_description", "status"
+]
+
+# recipient & supplier berbagi satu kamus negara (kategori & kode yang sama)
+COUNTRY_COLS = ["recipient", "supplier"]
+
+
+# =========================
+# BACA TRADE REGISTER (CSV)
+# =========================
+def read_trade_register(path=TRADE_REGISTER_PATH):
+    df_trade = pd.read_csv(
+        path,
+        encoding="latin1",
+        sep=None,
+        engine="python"
+    )
+
+    return normalize_trade_register(df_trade)
+
+
+def normalize_trade_register(df_trade):
+    # Normalisasi kolom
+    df_trade.columns = (
+        df_trade.columns.str.lower()
+        .str.strip()
+        .str.replace(" ", "_")
+        .str.replace(r"[^\w]", "", regex=True)
+    )
+
+    df_trade.replace(["?", "-", "n/a", "N/A", ""], np.nan, inplace=True)
+
+    df_trade[NUMERIC_COLS] = df_trade[NUMERIC_COLS].apply(
+        lambda x: pd.to_numeric(x, errors="coerce")
+    )
+
+    df_trade["year_of_order"] = df_trade["year_of_order"].round().astype("Int64")
+
+    for col in NUMERIC_COLS:
+        df_trade.loc[df_trade[col] < 0, col] = np.nan
+
+    df_trade = df_trade.drop_duplicates()
+
+    return df_trade
+
+
+def read_avionics_reference(path=AVIONICS_REF_PATH):
+    return pd.read_csv(path, sep=";")
+
+
+def avionics_whitelist(df_av_ref):
+    return set(
+        df_av_ref[df_av_ref["avionik"] == True]["weapon_description"]
+        .str.strip()
+        .str.lower()
+    )
+
+
+# =========================
+# KOLOM TEKS → KATEGORI
+# =========================
+# Normalisasi (fillna, lower, strip) hanya dijalankan pada nilai unik; setiap sel
+# disimpan sebagai kode integer, sehingga isin / value_counts / groupby di hilir
+# bekerja pada kode, bukan hash string Python.
+def normalized_categorical(series, fill="unknown"):
+    codes, uniques = pd.factorize(series)
+    labels = pd.Series(np.append(uniques.astype(object), fill)).str.lower().str.strip()
+
+    categories = pd.Index(sorted(labels.unique()))
+    mapping = categories.get_indexer(labels)
+    return pd.Series(
+        pd.Categorical.from_codes(mapping[codes], categories=categories),
+        index=series.index,
+        name=series.name,
+    )
+
+
+def compact_categories(df):
+    # Buang kategori teks yang tidak terpakai; kolom negara memakai kamus gabungan.
+    # Label tetap (mis. delivery_status) tidak disentuh.
+    for col in [c for c in TEXT_COLS + ["comments"] if c not in COUNTRY_COLS]:
+        df[col] = df[col].cat.remove_unused_categories()
+
+    countries = pd.Index(sorted(set().union(*(df[col].unique().dropna() for col in COUNTRY_COLS))))
+    for col in COUNTRY_COLS:
+        df[col] = df[col].cat.set_categories(countries)
+
+    return df
+
+
+def concat_categorical(frames):
+    # pd.concat kategori dengan kamus berbeda → object; samakan kamusnya dulu
+    for col in frames[0].select_dtypes("category").columns:
+        categories = frames[0][col].cat.categories
+        for frame in frames[1:]:
+            categories = categories.union(frame[col].cat.categories)
+        for frame in frames:
+            frame[col] = frame[col].cat.set_categories(categories)
+    return compact_categories(pd.concat(frames))
+
+
+# =========================
+# SUBSET AVIONIK + KOLOM TURUNAN
+# =========================
+def build_avionics_frame(df_trade, df_av_ref):
+    whitelist = avionics_whitelist(df_av_ref)
+
+    # Join whitelist lewat kode: cukup cek tiap kategori sekali
+    weapon_desc = normalized_categorical(df_trade["weapon_description"])
+    is_avionics = weapon_desc.cat.categories.isin(whitelist)[weapon_desc.cat.codes]
+
+    df_av = df_trade[is_avionics].copy()
+
+    # Cleaning lanjutan
+    num_cols = [
+        "number_ordered",
+        "number_delivered",
+        "sipri_tiv_per_unit",
+        "sipri_tiv_for_total_order",
+        "sipri_tiv_of_delivered_weapons"
+    ]
+
+    df_av[num_cols] = df_av[num_cols].fillna(0)
+
+    for col in TEXT_COLS:
+        df_av[col] = normalized_categorical(df_av[col])
+
+    df_av["comments"] = df_av["comments"].fillna("-").astype("category")
+
+    df_av["delivery_gap"] = df_av["number_ordered"] - df_av["number_delivered"]
+    df_av["delivery_status"] = delivery_status(df_av["delivery_gap"])
+
+    # Hitung usia alat
+    df_av["weapon_age"] = CURRENT_YEAR - df_av["years_of_delivery"]
+
+    df_av = df_av[
+        (df_av["weapon_age"] >= 0) &
+        (df_av["weapon_age"] <= 60)
+    ]
+
+    return compact_categories(df_av)
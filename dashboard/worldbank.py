@@ -0,0 +1,231 @@
+import os
+import sys
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+# =========================
+# KONFIGURASI FILE WORLD BANK
+# =========================
+# Ekspor World Bank di repo ini memakai titik sebagai pemisah ribuan dan kehilangan
+# titik desimalnya, mis. "405.586.592.178.771" untuk 405586592.178771. Digit
+# signifikannya utuh, tetapi besaran (pangkat 10) hilang. Besaran direkonstruksi
+# dari nilai tetangga yang tidak ambigu dan rentang wajar tiap indikator.
+#
+# log10_range: rentang wajar log10(|nilai|) untuk indikator tsb.
+WORLDBANK_FILES = {
+    "gdgcurrect_us_worldbank.csv": {"log10_range": (7.0, 14.0)},
+    "gdp_perkapita_worldbank.csv": {"log10_range": (1.5, 5.5)},
+    "political_stability.csv": {"log10_range": (-4.0, np.log10(2.6))},
+}
+
+# Lonjakan lebih dari ~3x terhadap tahun tetangga dianggap mencurigakan
+MAGNITUDE_TOLERANCE = 0.5
+
+# Kolom identitas terbanyak yang mungkin muncul sebelum kolom tahun
+MAX_ID_FIELDS = 6
+
+DOTTED_PATTERN = r"-?\d{1,3}(?:\.\d{3})+"
+COMMA_DECIMAL_PATTERN = r"-?\d+,\d+(?:[eE][+-]?\d+)?"
+NUMERIC_LIKE_PATTERN = r"-?[\d.,]+(?:[eE][+-]?\d+)?"
+CODE_PATTERN = r"[A-Z0-9]{3}"
+
+# Nama negara World Bank yang mengandung koma ikut terpecah oleh ";" saat ekspor,
+# dan di file GDP kolom Country Code-nya hilang. Kode dipulihkan dari nama lengkap.
+WORLDBANK_NAME_CODES = {
+    "Bahamas, The": "BHS",
+    "Congo, Dem. Rep.": "COD",
+    "Congo, Rep.": "COG",
+    "Egypt, Arab Rep.": "EGY",
+    "Gambia, The": "GMB",
+    "Hong Kong SAR, China": "HKG",
+    "Iran, Islamic Rep.": "IRN",
+    "Korea, Dem. People's Rep.": "PRK",
+    "Korea, Rep.": "KOR",
+    "Macao SAR, China": "MAC",
+    "Micronesia, Fed. Sts.": "FSM",
+    "Somalia, Fed. Rep.": "SOM",
+    "Venezuela, RB": "VEN",
+    "Yemen, Rep.": "YEM",
+}
+
+WorldBankMatrix = namedtuple("WorldBankMatrix", ["values", "valid", "exact", "suspect"])
+
+
+# =========================
+# PARSE MENTAH (pandas C parser, semua sel string)
+# =========================
+def read_raw(path):
+    raw = pd.read_csv(path, sep=";", encoding="utf-8-sig", dtype=str, header=None)
+
+    # Header: kolom identitas lalu tahun; trailing ";;" menghasilkan kolom kosong
+    years = [int(c) for c in raw.iloc[0] if isinstance(c, str) and c.strip().isdigit()]
+    body = raw.iloc[1:].reset_index(drop=True)
+
+    # Jumlah kolom identitas per baris = field teks non-numerik di awal baris.
+    # Baris dengan nama ber-koma punya field ekstra sehingga nilainya bergeser.
+    lead = body.iloc[:, :MAX_ID_FIELDS]
+    is_id = lead.notna() & ~lead.apply(lambda col: col.str.fullmatch(NUMERIC_LIKE_PATTERN).fillna(False).astype(bool))
+    n_id = is_id.to_numpy().cumprod(axis=1).sum(axis=1)
+
+    # Pecahan nama diawali spasi (", The" → " The")
+    fragments = lead.iloc[:, 1:].apply(lambda col: col.str.startswith(" ").fillna(False).astype(bool))
+    n_fragments = fragments.to_numpy().cumprod(axis=1).sum(axis=1)
+    name = lead[0]
+    for i in range(1, MAX_ID_FIELDS):
+        name = name.where(n_fragments < i, name + "," + lead[i].fillna(""))
+
+    is_code = lead.apply(lambda col: col.str.fullmatch(CODE_PATTERN).fillna(False).astype(bool))
+    code = lead.where(is_code).bfill(axis=1).iloc[:, 0]
+    code = code.fillna(name.map(WORLDBANK_NAME_CODES))
+
+    # Ambil blok nilai mulai dari kolom identitas terakhir tiap baris (gather vektor)
+    cells = np.concatenate(
+        [body.to_numpy(dtype=object), np.full((len(body), len(years)), np.nan, dtype=object)], axis=1
+    )
+    take = n_id[:, None] + np.arange(len(years))[None, :]
+    values = np.take_along_axis(cells, take, axis=1)
+
+    matrix = pd.DataFrame(values, index=code.rename("Country Code"), columns=years)
+    matrix = matrix[matrix.index.notna() & ~matrix.index.duplicated()]
+    return matrix
+
+
+# =========================
+# KERNEL VEKTOR
+# =========================
+def _classify(flat):
+    flat = flat.str.strip()
+    dotted = flat.str.fullmatch(DOTTED_PATTERN).fillna(False).to_numpy(bool)
+
+    # Nilai tidak ambigu: desimal biasa, notasi ilmiah dengan koma ("1,39E+11")
+    comma = flat.str.fullmatch(COMMA_DECIMAL_PATTERN).fillna(False).to_numpy(bool)
+    plain_text = flat.where(~comma, flat.str.replace(",", ".", regex=False))
+    exact = pd.to_numeric(plain_text.where(~dotted), errors="coerce").to_numpy(float)
+
+    # Nilai ambigu: ambil digit signifikan → mantissa di [1, 10)
+    digits = flat.where(dotted).str.replace(r"[^\d]", "", regex=True)
+    digits = digits.str.lstrip("0")
+    mantissa = pd.to_numeric(digits, errors="coerce").to_numpy(float)
+    n_digits = digits.str.len().to_numpy(float)
+    phase = np.log10(mantissa) - (n_digits - 1)
+    sign = np.where(flat.str.startswith("-").fillna(False).to_numpy(bool), -1.0, 1.0)
+
+    return exact, phase, sign
+
+
+def _continuity_pass(exact_log, phase, ref, guide_log, lo_dotted, hi):
+    n_rows, n_years = exact_log.shape
+    resolved = np.full((n_rows, n_years), np.nan)
+    prev = np.full(n_rows, np.nan)
+
+    for j in range(n_years):
+        # Pilih pangkat 10 yang paling dekat dengan panduan eksternal, atau dengan
+        # tahun valid sebelumnya (vektor untuk semua negara sekaligus)
+        target = np.where(np.isnan(prev), ref[:, j], prev)
+        target = np.where(np.isnan(guide_log[:, j]), target, guide_log[:, j])
+        p = phase[:, j]
+        exponent = np.round(target - p)
+        exponent = np.minimum(np.maximum(exponent, np.ceil(lo_dotted - p)), np.floor(hi - p))
+
+        resolved[:, j] = np.where(np.isnan(exact_log[:, j]), p + exponent, exact_log[:, j])
+        prev = np.where(np.isnan(resolved[:, j]), prev, resolved[:, j])
+
+    return resolved
+
+
+def _guide_from_reference(exact_log, reference_log):
+    # Referensi eksternal bisa berbeda basis (mis. USD konstan vs USD berjalan).
+    # Selisih per tahun diperkirakan dari median sel yang punya nilai pasti.
+    offset = pd.DataFrame(exact_log - reference_log).median(axis=0)
+    offset = offset.interpolate(limit_direction="both").fillna(0).to_numpy()
+    return reference_log + offset[None, :]
+
+
+def _resolve_magnitude(exact_log, phase, log10_range, guide_log):
+    lo, hi = log10_range
+
+    # Nilai dengan pemisah ribuan selalu >= 1, jadi batas bawah pangkatnya 0
+    lo_dotted = max(lo, 0.0)
+
+    # Referensi awal: interpolasi nilai pasti sepanjang tahun, fallback titik tengah rentang
+    ref = pd.DataFrame(exact_log).interpolate(axis=1, limit_direction="both").to_numpy()
+    ref = np.where(np.isnan(ref), (lo + hi) / 2, ref)
+
+    forward = _continuity_pass(exact_log, phase, ref, guide_log, lo_dotted, hi)
+    backward = _continuity_pass(
+        exact_log[:, ::-1], phase[:, ::-1], ref[:, ::-1], guide_log[:, ::-1], lo_dotted, hi
+    )[:, ::-1]
+
+    # Sel sesudah nilai pasti pertama → rantai maju; sebelum itu → rantai mundur dari nilai pasti
+    anchored_before = np.cumsum(~np.isnan(exact_log), axis=1) > 0
+    return np.where(anchored_before, forward, backward)
+
+
+def _neighbour_suspect(values):
+    # Bandingkan dengan rata-rata tahun valid sebelum & sesudahnya (skala log, |x| < 1 → 0)
+    scale = pd.DataFrame(np.log10(np.maximum(np.abs(values), 1.0)))
+    prev = scale.ffill(axis=1).shift(1, axis=1).to_numpy()
+    nxt = scale.bfill(axis=1).shift(-1, axis=1).to_numpy()
+
+    count = ~np.isnan(prev) * 1 + ~np.isnan(nxt) * 1
+    neighbour = (np.nan_to_num(prev) + np.nan_to_num(nxt)) / np.where(count == 0, np.nan, count)
+
+    return np.abs(scale.to_numpy() - neighbour) > MAGNITUDE_TOLERANCE
+
+
+def parse_matrix(raw, log10_range, reference=None):
+    # Satu Series datar (row-major) → semua regex/konversi jalan sekali untuk seluruh file
+    flat = pd.Series(raw.to_numpy().ravel(), dtype="string")
+    exact, phase, sign = _classify(flat)
+
+    shape = raw.shape
+    exact = exact.reshape(shape)
+    phase = phase.reshape(shape)
+    sign = sign.reshape(shape)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        exact_log = np.where(exact != 0, np.log10(np.abs(exact)), np.nan)
+
+    guide_log = np.full(shape, np.nan)
+    if reference is not None:
+        reference = reference.reindex(index=raw.index, columns=raw.columns).to_numpy(float)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            guide_log = _guide_from_reference(exact_log, np.log10(np.abs(reference)))
+
+    resolved_log = _resolve_magnitude(exact_log, phase, log10_range, guide_log)
+    values = np.where(np.isnan(exact), sign * 10 ** resolved_log, exact)
+
+    valid = ~np.isnan(values)
+    suspect = _neighbour_suspect(values)
+
+    as_frame = lambda a: pd.DataFrame(a, index=raw.index, columns=raw.columns)
+    return WorldBankMatrix(
+        values=as_frame(values),
+        valid=as_frame(valid),
+        exact=as_frame(~np.isnan(exact)),
+        suspect=as_frame(suspect),
+    )
+
+
+# reference (opsional): matriks negara×tahun berisi perkiraan kasar nilai yang sama
+# dari sumber lain, dipakai untuk menentukan besaran negara tanpa nilai pasti
+def read_worldbank(path, reference=None):
+    spec = WORLDBANK_FILES[os.path.basename(path)]
+    return parse_matrix(read_raw(path), spec["log10_range"], reference)
+
+
+def to_long(matrix, value_name):
+    long_df = matrix.values.rename_axis(index="iso3", columns="Year").stack().rename(value_name)
+    return long_df.reset_index()
+
+
+if __name__ == "__main__":
+    for path in sys.argv[1:] or WORLDBANK_FILES:
+        matrix = read_worldbank(path)
+        print(
+            f"{path}: {int(matrix.valid.values.sum())} nilai valid, "
+            f"{int((matrix.valid & ~matrix.exact).values.sum())} direkonstruksi, "
+            f"{int(matrix.suspect.values.sum())} mencurigakan"
+        )
@@ -0,0 +1,605 @@
+import streamlit as st
+import pandas as pd
+import numpy as np
+import plotly.express as px
+import plotly.graph_objects as go
+
+from dashboard.data import (
+    load_avionics, load_avionics_backend, load_backlog_engine, load_fleet_age, load_recipient_index,
+    load_trade_flows,
+)
+from dashboard.backlog import BACKLOG_UNITS
+from dashboard.factors import consistency_flag
+from dashboard.figcache import plotly_chart
+from dashboard.flows import FLOW_METRICS
+from dashboard.profiling import begin_run, end_run, span
+from dashboard.render import adaptive_scatter, drilldown_rows, scatter_mode
+from dashboard.sections import chart_section
+from dashboard.table import paged_table
+
+st.title("Analisis Perdagangan Senjata Avionik Global (SIPRI)")
+st.caption("Data-driven insight untuk identifikasi tren, supplier, importir, dan potensi market modernisasi")
+
+# Profiling opt-in (DASHBOARD_PROFILE=1 / =query + ?profile=1), lihat dashboard/profiling.py
+begin_run("avionics")
+
+# =========================
+# LOAD DATA
+# =========================
+# Trade register dibaca dari snapshot Arrow lewat cache bersama (lihat dashboard/data.py)
+with span("load_data") as stats:
+    df = load_avionics()
+    backend = load_avionics_backend()  # agregat chart: pandas / duckdb (dashboard/backends.py)
+    version = df.attrs["stamp"]  # stamp dataset yang disajikan (key memo figure)
+    stats["rows"] = len(df)
+
+# =========================
+# SIDEBAR FILTER
+# =========================
+st.sidebar.header("Filter Data")
+
+year_range = st.sidebar.slider(
+    "Tahun Pemesanan",
+    int(df["year_of_order"].min()),
+    int(df["year_of_order"].max()),
+    (
+        int(df["year_of_order"].min()),
+        int(df["year_of_order"].max())
+    )
+)
+
+selected_recipient = st.sidebar.multiselect(
+    "Negara Penerima",
+    sorted(df["recipient"].unique())
+)
+
+# Baris terfilter untuk chart yang butuh baris mentah (scatter, histogram, tabel)
+with span("apply_filter", rows=len(df)):
+    filtered_df = backend.rows(year_range, selected_recipient)
+
+# =========================
+# METRICS
+# =========================
+st.subheader("Ringkasan Utama")
+
+with span("metrics", rows=len(filtered_df)):
+    summary = backend.query("trade_summary", year_range, selected_recipient)
+
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("Total Transaksi", f"{summary['transactions']:,}")
+    col2.metric("Total Importir", summary["importers"])
+    col3.metric("Total Supplier", summary["suppliers"])
+    col4.metric("Total SIPRI TIV", f"{summary['total_tiv']:,.0f}")
+
+# =========================
+# SECTION CHART
+# =========================
+# Setiap section mendeklarasikan input yang dipakainya; figure di-memo per nilai
+# input (lihat dashboard/sections.py), jadi hanya chart yang terdampak yang dibangun ulang.
+inputs = dict(year_range=year_range, recipients=selected_recipient, version=version)
+
+# =========================
+# TREND TRANSAKSI INTERAKTIF
+# =========================
+@chart_section("year_range", "recipients")
+def section_trades(figure, year_range, recipients, version):
+    st.subheader("Tren Perdagangan Avionik")
+
+    def build():
+        fig = px.line(
+            backend.query("yearly_trades", year_range, recipients),
+            x="year_of_order",
+            y="transactions",
+            markers=True,
+            labels={"year_of_order": "Tahun", "transactions": "Jumlah Transaksi"}
+        )
+        fig.update_layout(hovermode="x unified", template="plotly_white")
+        return fig
+
+    plotly_chart(figure(build))
+    st.caption('''Line chart tren transaksi per tahun menunjukkan volume transaksi avionik global.
+
+Insight:
+1. Negara atau periode dengan tren naik menandakan permintaan meningkat → pasar lebih aktif → peluang masuk lebih besar.
+2. Tren turun → kemungkinan pasar jenuh atau ada hambatan regulasi.
+Strategi: fokus negara dengan pertumbuhan transaksi positif, terutama jika didukung oleh modernisasi angkatan udara.
+''')
+
+
+section_trades(**inputs)
+
+# =========================
+# TREND NILAI SIPRI TIV INTERAKTIF
+# =========================
+@chart_section("year_range", "recipients")
+def section_tiv(figure, year_range, recipients, version):
+    st.subheader("Total Nilai SIPRI TIV Avionik per Tahun")
+
+    def build():
+        fig = px.line(
+            backend.query("tiv_yearly", year_range, recipients),
+            x="year_of_order",
+            y="sipri_tiv_of_delivered_weapons",
+            markers=True,
+            labels={"year_of_order": "Tahun", "sipri_tiv_of_delivered_weapons": "Total TIV (USD, konstan)"}
+        )
+        fig.update_layout(template="plotly_white", hovermode="x unified")
+        return fig
+
+    plotly_chart(figure(build))
+    st.caption(
+        "Total nilai SIPRI TIV avionik per tahun menggambarkan dinamika volume transfer dan akuisisi sistem avionik "
+        "di tingkat global/regional. Tren yang meningkat secara konsisten mencerminkan permintaan berkelanjutan "
+        "terhadap teknologi avionik, serta peluang pasar yang relevan bagi strategi masuk dan ekspansi produk."
+    )
+
+
+section_tiv(**inputs)
+
+
+# =========================
+# TOP IMPORTER & SUPPLIER
+# =========================
+def top_bar(column, label, year_range, recipients):
+    fig = px.bar(
+        backend.query("top_counts", year_range, recipients, column=column),
+        x="transactions",
+        y=column,
+        orientation="h",
+        labels={"transactions": "Jumlah Transaksi", column: label}
+    )
+    fig.update_layout(yaxis=dict(categoryorder="total ascending"))
+    return fig
+
+
+@chart_section("year_range", "recipients")
+def section_top(figure, year_range, recipients, version):
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.subheader("🌍 Top Importir Avionik")
+        plotly_chart(figure(lambda: top_bar("recipient", "Negara", year_range, recipients), "importers"))
+
+    with col2:
+        st.subheader("🏭 Top Supplier Avionik")
+        plotly_chart(figure(lambda: top_bar("supplier", "Supplier", year_range, recipients), "suppliers"))
+
+    st.caption('''Bar chart top importir (negara) menunjukkan negara mana yang paling banyak membeli avionik.
+
+Bar chart top supplier menunjukkan kompetitor utama.
+
+Insight:
+1. Negara dengan volume pembelian tinggi tapi usia alat rata-rata tinggi → pasar potensial untuk upgrade/retrofit.
+2. Supplier dominan → perlu strategi differentiation, misal fitur unik atau harga kompetitif.
+
+Strategi: target negara top importir, tetapi perhatikan peluang jika mereka masih menggunakan sistem lama.
+''')
+
+
+section_top(**inputs)
+
+# =========================
+# ARUS SUPPLIER → PENERIMA
+# =========================
+# Dihitung dari tensor jarang supplier × penerima × tahun (lihat dashboard/flows.py)
+@chart_section("year_range", "recipients")
+def section_flows(figure, year_range, recipients, version):
+    st.subheader("🔀 Arus Perdagangan Supplier → Penerima")
+
+    col1, col2 = st.columns(2)
+    metric = col1.radio("Ukuran arus", list(FLOW_METRICS), format_func=FLOW_METRICS.get, horizontal=True)
+    top = col2.slider("Jumlah arus terbesar", 5, 50, 20, step=5)
+
+    def build_sankey():
+        flows = load_trade_flows().flows(year_range, recipients, metric, top=top)
+
+        # Node supplier (kiri) & penerima (kanan) terpisah walau negaranya sama
+        suppliers = flows["supplier"].unique().tolist()
+        receivers = flows["recipient"].unique().tolist()
+        fig = go.Figure(go.Sankey(
+            node=dict(label=[s.title() for s in suppliers] + [r.title() for r in receivers], pad=12),
+            link=dict(
+                source=flows["supplier"].map({s: i for i, s in enumerate(suppliers)}),
+                target=flows["recipient"].map({r: len(suppliers) + i for i, r in enumerate(receivers)}),
+                value=flows[metric],
+            ),
+        ))
+        fig.update_layout(height=600)
+        return fig
+
+    def build_concentration():
+        concentration = load_trade_flows().concentration(year_range, recipients, metric)
+        fig = px.line(
+            concentration,
+            x="year_of_order",
+            y="hhi",
+            markers=True,
+            hover_data=["suppliers", "top_supplier", "top_share"],
+            labels={"year_of_order": "Tahun", "hhi": "HHI Supplier"}
+        )
+        fig.add_hline(y=2500, line_dash="dash", annotation_text="Sangat terkonsentrasi")
+        fig.update_layout(template="plotly_white", hovermode="x unified")
+        return fig
+
+    def build_share():
+        return px.area(
+            load_trade_flows().market_share(year_range, recipients, metric),
+            x="year_of_order",
+            y="share",
+            color="supplier",
+            labels={"year_of_order": "Tahun", "share": "Pangsa Pasar (%)", "supplier": "Supplier"}
+        )
+
+    plotly_chart(figure(build_sankey, f"sankey:{metric}:{top}"))
+
+    col1, col2 = st.columns(2)
+    with col1:
+        plotly_chart(figure(build_concentration, f"hhi:{metric}"))
+    with col2:
+        plotly_chart(figure(build_share, f"share:{metric}"))
+
+    st.caption('''Sankey menunjukkan siapa menjual ke siapa; ketebalan arus = jumlah transaksi atau nilai SIPRI TIV.
+
+Insight:
+1. HHI di atas 2.500 → pasar dikuasai sedikit supplier; pendatang baru butuh diferensiasi kuat atau kemitraan.
+2. HHI turun dan jumlah supplier bertambah → pasar makin terbuka bagi pemain baru.
+Strategi: prioritaskan penerima yang pasokannya tersebar di banyak supplier, karena lebih terbuka terhadap alternatif.
+''')
+
+
+section_flows(**inputs)
+
+# =========================
+# SEMUA JENIS SENJATA AVIONIK
+# =========================
+@chart_section("year_range", "recipients")
+def section_weapons(figure, year_range, recipients, version):
+    st.subheader("💥 Jenis Senjata Avionik yang Diperdagangkan")
+
+    def build():
+        weapons_all = backend.query("top_counts", year_range, recipients, column="weapon_description")  # ambil semua, jangan dibatasi 10
+
+        # Plotly bar
+        fig = px.bar(
+            weapons_all,
+            x="transactions",
+            y="weapon_description",
+            orientation="h",
+            labels={"transactions": "Jumlah Transaksi", "weapon_description": "Jenis Avionik"}
+        )
+        fig.update_layout(yaxis=dict(categoryorder="total ascending"))
+        return fig
+
+    plotly_chart(figure(build))
+    st.caption(
+        "Distribusi semua jenis senjata avionik menunjukkan struktur permintaan pasar berdasarkan kategori sistem. "
+        "Dominasi kategori tertentu mengindikasikan peluang pemasaran yang lebih kuat, "
+        "khususnya untuk strategi diferensiasi produk dan fokus portofolio avionik."
+    )
+
+
+section_weapons(**inputs)
+
+
+# =========================
+# USIA PER JENIS AVIONIK
+# =========================
+@chart_section("year_range", "recipients")
+def section_age_by_weapon(figure, year_range, recipients, version):
+    st.subheader("🕒 Jenis Avionik dengan Usia Operasional")
+
+    def build():
+        # Hitung rata-rata usia per jenis avionik
+        age_by_weapon = backend.query("mean_age_by", year_range, recipients, column="weapon_description")
+
+        # Plotly bar untuk usia
+        fig = px.bar(
+            age_by_weapon,
+            x="weapon_age",
+            y="weapon_description",
+            orientation="h",
+            title="Jenis Avionik dengan Usia Operasional",
+            labels={"weapon_age": "Rata-rata Usia (Tahun)", "weapon_description": "Jenis Avionik"}
+        )
+        fig.update_layout(yaxis=dict(categoryorder="total ascending"))
+        return fig
+
+    plotly_chart(figure(build))
+    st.caption(
+        "Visualisasi jenis avionik berdasarkan usia operasional menunjukkan distribusi siklus hidup sistem yang masih aktif digunakan. "
+        "Avionik dengan usia operasional tinggi mengindikasikan potensi kebutuhan upgrade, retrofit, atau penggantian sistem, "
+        "yang relevan bagi strategi pemasaran avionik berbasis modernisasi dan sustainment."
+    )
+
+
+section_age_by_weapon(**inputs)
+
+# =========================
+# ORDER VS DELIVERY
+# =========================
+@chart_section("year_range", "recipients")
+def section_order_delivery(figure, year_range, recipients, version):
+    st.subheader("📦 Konsistensi Order vs Pengiriman")
+
+    # SVG → WebGL → density (bin 2D) otomatis sesuai jumlah titik (lihat dashboard/render.py)
+    scatter_kwargs = dict(
+        x="number_ordered",
+        y="number_delivered",
+        color="delivery_status",
+        hover_data=[
+            "recipient",
+            "supplier",
+            "weapon_description",
+            "year_of_order"
+        ],
+        labels={
+            "number_ordered": "Jumlah Dipesan",
+            "number_delivered": "Jumlah Dikirim"
+        }
+    )
+
+    def build():
+        fig = adaptive_scatter(filtered_df, **scatter_kwargs)
+
+        max_val = filtered_df["number_ordered"].max()
+        fig.add_shape(
+            type="line",
+            x0=0, y0=0,
+            x1=max_val, y1=max_val,
+            line=dict(dash="dash")
+        )
+        return fig
+
+    if scatter_mode(len(filtered_df)) != "density":
+        plotly_chart(figure(build))
+    else:
+        # Drill-down: seleksi bin (box/lasso) → titik asli di bin tsb
+        event = plotly_chart(
+            figure(build),
+            key="order_delivery_density",
+            on_select="rerun",
+            selection_mode=("box", "lasso"),
+        )
+        st.caption("Tampilan density (titik di-bin). Seleksi area dengan box/lasso untuk melihat transaksi aslinya.")
+
+        if event.selection.point_indices:
+            detail = drilldown_rows(
+                filtered_df, "number_ordered", "number_delivered", event.selection.point_indices
+            )
+            st.plotly_chart(adaptive_scatter(detail, **scatter_kwargs), use_container_width=True)
+
+    st.caption('''Scatter plot order vs delivery menunjukkan konsistensi pemenuhan kontrak.
+
+Insight:
+1. Negara dengan delivery gap besar → peluang untuk menawarkan solusi lebih andal atau layanan after-sales.
+2. Negara dengan delivery = order → pasar stabil, kompetisi tinggi, mungkin butuh diferensiasi.
+Strategi: masuk ke pasar yang memiliki gap pengiriman, bisa menekankan keandalan dan layanan cepat.
+''')
+
+
+section_order_delivery(**inputs)
+
+# =========================
+# ANALISIS ORDER VS DELIVERY
+# =========================
+with span("delivery_analysis", rows=len(filtered_df)):
+    # Hanya kolom yang ditampilkan yang disalin (bukan seluruh filtered_df)
+    delivery_gap = filtered_df["number_delivered"] - filtered_df["number_ordered"]
+
+    result_table = filtered_df[[
+        "recipient",
+        "supplier",
+        "weapon_description",
+        "year_of_order",
+        "number_ordered",
+        "number_delivered",
+    ]].assign(
+        delivery_gap=delivery_gap,
+        consistency_flag=consistency_flag(delivery_gap),
+        delivery_status=filtered_df["delivery_status"],
+    )
+
+st.caption(f"""
+🔍 **Ringkasan Cepat**  
+• Total transaksi: **{len(result_table)}**  
+• Konsisten (Order = Delivery): **{(result_table['delivery_gap'] == 0).sum()}**  
+• Kurang kirim: **{(result_table['delivery_gap'] < 0).sum()}**  
+• Over delivery: **{(result_table['delivery_gap'] > 0).sum()}**
+""")
+
+
+st.subheader("📊 Tabel Evaluasi Konsistensi Order vs Pengiriman")
+
+# Diurutkan menurut delivery_gap di server; hanya jendela halaman yang dikirim ke browser
+with span("delivery_table", rows=len(result_table)):
+    paged_table(
+        result_table,
+        key="delivery_table",
+        cache_key=(year_range, tuple(sorted(selected_recipient)), version),
+        default_sort="delivery_gap",
+        file_name="order_vs_delivery.csv",
+    )
+
+
+# =========================
+# BACKLOG PENGIRIMAN
+# =========================
+@chart_section("year_range", "recipients")
+def section_backlog(figure, year_range, recipients, version):
+    st.subheader("⏳ Backlog Pengiriman per Tahun")
+
+    unit = st.radio("Satuan backlog", list(BACKLOG_UNITS), format_func=BACKLOG_UNITS.get, horizontal=True)
+    outstanding, delivered = ("outstanding_tiv", "delivered_tiv") if unit == "tiv" else ("outstanding_units", "delivered_units")
+
+    def build():
+        timeline = load_backlog_engine().timeline(year_range, recipients)
+
+        fig = go.Figure()
+        fig.add_bar(x=timeline["year"], y=timeline[delivered], name="Dikirim", opacity=0.6)
+        fig.add_scatter(x=timeline["year"], y=timeline[outstanding], name="Belum dikirim", mode="lines+markers")
+        fig.add_scatter(
+            x=timeline["year"], y=timeline["open_orders"], name="Order terbuka",
+            mode="lines", line=dict(dash="dot"), yaxis="y2"
+        )
+        fig.update_layout(
+            template="plotly_white",
+            hovermode="x unified",
+            xaxis_title="Tahun",
+            yaxis_title=BACKLOG_UNITS[unit],
+            yaxis2=dict(title="Order Terbuka", overlaying="y", side="right", showgrid=False),
+            legend=dict(orientation="h", y=1.1),
+        )
+        return fig
+
+    plotly_chart(figure(build, unit))
+
+    st.markdown(f"**Pipeline per Penerima** (backlog akhir {year_range[1]}, order & pengiriman {year_range[0]}–{year_range[1]})")
+    paged_table(
+        load_backlog_engine().pipeline(year_range, recipients),
+        key="backlog_table",
+        cache_key=(year_range, tuple(sorted(recipients)), version),
+        default_sort="outstanding_tiv",
+        ascending=False,
+        file_name="backlog_pipeline.csv",
+    )
+
+    st.caption('''Backlog = order yang sudah dipesan tetapi belum dikirim; order lama yang masih terbuka di rentang tahun tetap dihitung.
+
+Insight:
+1. Backlog TIV naik sementara pengiriman datar → kapasitas supplier tertahan, peluang untuk pemasok alternatif.
+2. clear_years besar → penerima butuh bertahun-tahun untuk menuntaskan pesanan pada laju pengiriman saat ini.
+Strategi: dekati penerima dengan backlog besar dan lama untuk solusi interim (upgrade, leasing, MRO armada lama).
+''')
+
+
+section_backlog(**inputs)
+
+
+# =========================
+# USIA AVIONIK
+# =========================
+@chart_section("year_range", "recipients")
+def section_age_histogram(figure, year_range, recipients, version):
+    st.subheader("🕰️ Analisis Usia Operasional Avionik")
+
+    def build():
+        return px.histogram(
+            filtered_df,
+            x="weapon_age",
+            nbins=20,
+            marginal="box",
+            labels={"weapon_age": "Usia Alat (Tahun)"}
+        )
+
+    plotly_chart(figure(build))
+
+    st.caption('''Histogram usia alat menunjukkan rata-rata usia sistem avionik di berbagai negara.
+
+Insight:
+1. Usia tinggi → kemungkinan ada kebutuhan modernisasi.
+2. Usia rendah → pasar modern, tetapi bisa menawarkan upgrade teknologi terbaru.
+
+Strategi: negara dengan usia rata-rata >20 tahun → fokus untuk retrofit & modernisasi.
+''')
+
+
+section_age_histogram(**inputs)
+
+# =========================
+# MODERNIZATION MARKET
+# =========================
+@chart_section("year_range", "recipients")
+def section_modernization(figure, year_range, recipients, version):
+    st.subheader("🚀 Identifikasi Market Modernisasi")
+
+    # Hitung rata-rata usia per negara
+    age_by_country = lambda: backend.query("mean_age_by", year_range, recipients, column="recipient")
+
+    def build_youngest():
+        fig1 = px.bar(
+            age_by_country().sort_values("weapon_age", ascending=True),
+            x="weapon_age",
+            y="recipient",
+            orientation="h",
+            title="Avionik Termuda (Modern Fleet)",
+            height=600
+        )
+        fig1.update_layout(
+            yaxis=dict(categoryorder="total descending")
+        )
+        return fig1
+
+    def build_oldest():
+        fig2 = px.bar(
+            age_by_country().sort_values("weapon_age", ascending=False),
+            x="weapon_age",
+            y="recipient",
+            orientation="h",
+            title="Avionik Tertua (Upgrade Market)",
+            height=600
+        )
+        fig2.update_layout(yaxis=dict(categoryorder="total ascending"))
+        return fig2
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        plotly_chart(figure(build_youngest, "youngest"))
+
+    with col2:
+        plotly_chart(figure(build_oldest, "oldest"))
+
+    st.caption('''Bar chart “Avionik tertua / termuda” per negara.
+
+Insight:
+1. Negara dengan avionik tertua = peluang pasar modernisasi.
+2. Negara dengan avionik termuda = pasar lebih sulit ditembus, tapi bisa menawarkan teknologi canggih.
+
+Strategi:
+1. Masuk pasar upgrade/retrofit untuk negara dengan alat lama.
+2. Masuk pasar high-end untuk negara dengan armada modern (diferensiasi & fitur premium).
+''')
+
+
+section_modernization(**inputs)
+
+# =========================
+# USIA ARMADA (tertimbang unit)
+# =========================
+# Join penerima → negara yang sama dengan estimasi MRO halaman belanja militer
+# (dihitung sekali per versi register, lihat dashboard/fleet.py)
+@chart_section("year_range", "recipients")
+def section_fleet_age(figure, year_range, recipients, version):
+    st.subheader("🛩️ Usia Armada Avionik per Negara")
+
+    def build():
+        fleet = load_fleet_age()
+        fleet = fleet[(fleet["Year"] >= year_range[0]) & (fleet["Year"] <= year_range[1])]
+
+        if recipients:
+            index = load_recipient_index()
+            countries = index.loc[index["recipient"].isin(recipients), "Country_clean"].dropna()
+        else:
+            # Tanpa filter: 10 armada terbesar di tahun terakhir rentang
+            latest = fleet[fleet["Year"] == fleet["Year"].max()]
+            countries = latest.nlargest(10, "Fleet_Units")["Country_clean"]
+
+        return px.line(
+            fleet[fleet["Country_clean"].isin(countries)],
+            x="Year",
+            y="Avg_Equipment_Age",
+            color="Country_clean",
+            labels={"Avg_Equipment_Age": "Usia Armada (Tahun)", "Country_clean": "Negara"}
+        )
+
+    plotly_chart(figure(build))
+
+    st.caption(
+        "Usia armada tiap tahun = rata-rata umur seluruh unit avionik yang sudah dikirim, "
+        "tertimbang jumlah unit. Nilai yang sama dipakai sebagai Avg_Equipment_Age pada estimasi MRO."
+    )
+
+
+section_fleet_age(**inputs)
+
+end_run()
@@ -0,0 +1,435 @@
+import streamlit as st
+import pandas as pd
+import numpy as np
+import plotly.express as px
+
+from dashboard.data import load_expenditure, load_expenditure_cube, load_mro_engine, load_score_engine
+from dashboard.etl import SCORE_WEIGHTS
+from dashboard.figcache import plotly_chart
+from dashboard.mro import make_scenario
+from dashboard.profiling import begin_run, end_run, span
+from dashboard.queries import SCORE_METRIC, expenditure_kpis, heatmap, legend_order, ranking
+from dashboard.render import adaptive_scatter, scatter_mode
+from dashboard.sections import chart_section
+from dashboard.table import paged_table
+
+st.title("🪖 Military Expenditure Dashboard — Asia")
+st.caption("SIPRI & World Bank | Constant 2023 USD")
+
+# Profiling opt-in (DASHBOARD_PROFILE=1 / =query + ?profile=1), lihat dashboard/profiling.py
+begin_run("expenditure")
+
+# =========================
+# LOAD DATA
+# =========================
+# Dataset + estimasi MRO + filter cube di-cache bersama (lihat dashboard/data.py)
+with span("load_data") as stats:
+    df = load_expenditure()
+    cube = load_expenditure_cube()
+    version = df.attrs["stamp"]  # stamp dataset yang disajikan (key memo figure)
+    stats["rows"] = len(df)
+
+# =========================
+# SIDEBAR FILTER
+# =========================
+st.sidebar.header("🎛️ Filter Data")
+
+years = sorted(df["Year"].unique())
+countries = sorted(df["Country_clean"].unique())
+
+year_range = st.sidebar.slider(
+    "Rentang Tahun",
+    min_value=int(min(years)),
+    max_value=int(max(years)),
+    value=(int(min(years)), int(max(years)))
+)
+
+selected_countries = st.sidebar.multiselect(
+    "Pilih Negara (kosongkan untuk semua)",
+    options=countries,
+    default=[]
+)
+
+# Bobot Total Score (dinormalisasi ke jumlah 1, lihat dashboard/scoring.py)
+with st.sidebar.expander("⚖️ Bobot Total Score"):
+    score_labels = {
+        "Score_Expenditure": "Belanja Militer",
+        "Score_Growth": "Growth YoY",
+        "Score_pctGovt": "% Belanja Pemerintah",
+        "Score_Politics": "Political Stability",
+    }
+    score_weights = {
+        component: st.slider(label, 0.0, 1.0, float(SCORE_WEIGHTS[component]), step=0.05)
+        for component, label in score_labels.items()
+    }
+    renormalize = st.checkbox(
+        "Normalisasi ulang pada filter",
+        value=False,
+        help="Min-max dihitung ulang atas negara & rentang tahun terpilih, bukan seluruh dataset"
+    )
+
+if not sum(score_weights.values()):
+    st.sidebar.warning("Semua bobot 0 — memakai bobot default")
+    score_weights = dict(SCORE_WEIGHTS)
+
+# =========================
+# APPLY FILTER
+# =========================
+with span("apply_filter", rows=len(df)):
+    df_filtered = df[
+        (df["Year"] >= year_range[0]) &
+        (df["Year"] <= year_range[1])
+    ]
+
+    if selected_countries:
+        df_filtered = df_filtered[df_filtered["Country_clean"].isin(selected_countries)]
+
+# =========================
+# KPI METRICS
+# =========================
+with span("kpi_metrics", rows=len(df_filtered)):
+    col1, col2, col3, col4, col5 = st.columns(5)
+
+    kpis = expenditure_kpis(cube, year_range, selected_countries)
+
+    col1.metric("Jumlah Negara", kpis["country_count"])
+    col2.metric("Total Belanja Militer", f"${kpis['total_expenditure']:,.0f}")
+    col3.metric("Estimasi Total MRO", f"${kpis['total_mro']:,.0f}")
+    col4.metric("Rata-rata Growth YoY", f"{kpis['mean_yoy']:.2f}%")
+    col5.metric("Rata-rata Political Stability", f"{kpis['mean_political_stability']:.2f}")
+
+st.divider()
+
+# =========================
+# SECTION CHART
+# =========================
+# Setiap section mendeklarasikan input yang dipakainya; figure di-memo per nilai
+# input (lihat dashboard/sections.py), jadi hanya chart yang terdampak yang dibangun ulang.
+# latest_year / urutan legenda dihitung dari cube di dalam builder (murah, O(negara)).
+inputs = dict(year_range=year_range, countries=selected_countries, version=version)
+
+# =========================
+# 1️⃣ LINE — BELANJA MILITER
+# =========================
+@chart_section("year_range", "countries")
+def section_expenditure(figure, year_range, countries, version):
+    st.subheader("📈 Tren Belanja Militer (USD)")
+
+    def build():
+        # 🔑 Urutan legenda = nilai belanja per negara di tahun terbaru
+        order = legend_order(cube, "Military_Expenditure_USD", year_range, countries, by="latest")
+
+        # 🔑 Plot dengan category_orders
+        fig_exp = px.line(
+            df_filtered,
+            x="Year",
+            y="Military_Expenditure_USD",
+            color="Country_clean",
+            markers=True,
+            labels={"Military_Expenditure_USD": "USD"},
+            category_orders={"Country_clean": order}
+        )
+
+        fig_exp.update_layout(
+            height=500,
+            legend_title_text="Negara (Belanja Terbesar → Terkecil)"
+        )
+        return fig_exp
+
+    plotly_chart(figure(build))
+
+    st.caption(
+        "Urutan legenda merepresentasikan besarnya belanja militer terbaru, sehingga pengguna dapat "
+        "langsung mengidentifikasi negara dengan kapasitas pengadaan terbesar. "
+        "Pendekatan ini memperkuat analisis potensi pasar avionik dengan menonjolkan aktor utama "
+        "tanpa bergantung pada urutan alfabet."
+    )
+
+
+section_expenditure(**inputs)
+
+# =========================
+# ✈️ LINE — ESTIMATED MRO
+# =========================
+@chart_section("year_range", "countries")
+def section_mro(figure, year_range, countries, version):
+    st.subheader("🛠️ Tren Estimasi MRO Market")
+
+    def build():
+        legend_order_mro = legend_order(cube, "Estimated_MRO_USD", year_range, countries, by="latest")
+
+        fig_mro = px.line(
+            df_filtered,
+            x="Year",
+            y="Estimated_MRO_USD",
+            color="Country_clean",
+            markers=True,
+            labels={"Estimated_MRO_USD": "Estimated MRO (USD)"},
+            category_orders={"Country_clean": legend_order_mro}
+        )
+
+        fig_mro.update_layout(height=500)
+        return fig_mro
+
+    plotly_chart(figure(build))
+
+    st.caption(
+        "Estimasi MRO mencerminkan potensi pasar maintenance, repair, dan overhaul. "
+        "Negara dengan MRO tinggi menunjukkan peluang kontrak sustainment jangka panjang, "
+        "yang seringkali lebih stabil dibanding pengadaan alutsista baru."
+    )
+
+
+section_mro(**inputs)
+
+# =========================
+# URUTKAN LEGEND BERDASARKAN RATA-RATA YoY
+# =========================
+@chart_section("year_range", "countries")
+def section_yoy(figure, year_range, countries, version):
+    st.subheader("📈Tren Growth Rate Belanja Militer Negara Asia (YoY)")
+
+    def build():
+        order = legend_order(cube, "Military_Expenditure_YoY", year_range, countries, by="mean")
+
+        fig_yoy = px.line(
+            df_filtered,
+            x="Year",
+            y="Military_Expenditure_YoY",
+            color="Country_clean",
+            labels={"Military_Expenditure_YoY": "Growth (%)"},
+            category_orders={"Country_clean": order}
+        )
+
+        fig_yoy.update_layout(height=500)
+        return fig_yoy
+
+    plotly_chart(figure(build))
+
+    st.caption(
+        "Pertumbuhan YoY yang moderat dan konsisten menunjukkan sistem pengadaan yang matang dan dapat diprediksi. "
+        "Sebaliknya, fluktuasi ekstrem menandakan ketergantungan pada faktor situasional yang meningkatkan risiko pasar."
+    )
+
+
+section_yoy(**inputs)
+
+# =========================
+# 3️⃣ SCATTER — BUDGET vs GROWTH
+# =========================
+@chart_section("year_range", "countries")
+def section_scatter(figure, year_range, countries, version):
+    st.subheader("🫧 Anggaran vs Growth (Log Scale)")
+
+    def build():
+        # 🔑 Urutan negara berdasarkan nilai penting (rata-rata Military Expenditure)
+        order = legend_order(cube, "Military_Expenditure_USD", year_range, countries, by="mean")
+
+        # SVG → WebGL → density otomatis sesuai jumlah titik (lihat dashboard/render.py)
+        fig_scatter = adaptive_scatter(
+            df_filtered,
+            x="Military_Expenditure_USD",
+            y="Military_Expenditure_YoY",
+            size="Military_Expenditure_USD",
+            color="Country_clean",
+            hover_name="Country_clean",
+            log_x=True,
+            category_orders={"Country_clean": order},  # 🔥 KUNCI UTAMA
+            labels={
+                "Military_Expenditure_USD": "Military Expenditure (USD, log scale)",
+                "Military_Expenditure_YoY": "Growth YoY (%)"
+            }
+        )
+
+        # Mode density sudah mengatur ukuran marker = jumlah titik per bin
+        if scatter_mode(len(df_filtered)) != "density":
+            fig_scatter.update_traces(
+                marker=dict(
+                    sizemode="area",
+                    sizeref=df_filtered["Military_Expenditure_USD"].max() / 40**2,
+                    sizemin=6,
+                    opacity=0.65,
+                    line=dict(width=0.5, color="black")
+                )
+            )
+
+        fig_scatter.update_layout(height=600)
+        return fig_scatter
+
+    plotly_chart(figure(build))
+
+    st.caption(
+        "Negara dengan belanja besar dan pertumbuhan stabil merupakan target pasar avionik yang paling strategis. "
+        "Sementara pertumbuhan ekstrem pada anggaran kecil cenderung mencerminkan proyek temporer atau kebutuhan reaktif."
+    )
+
+
+section_scatter(**inputs)
+
+# =========================
+# 4️⃣ RANKING — TOTAL SCORE
+# =========================
+# Total Score dihitung ulang dari komponen mentah sesuai bobot sidebar (query yang
+# sama dengan API, lihat dashboard/queries.py)
+score_inputs = dict(inputs, weights=score_weights, renormalize=renormalize)
+
+
+@chart_section("year_range", "countries", "weights", "renormalize")
+def section_rank(figure, year_range, countries, weights, renormalize, version):
+    st.subheader("🏆 Ranking Negara Asia (Total Score)")
+
+    def build():
+        fig_rank = px.bar(
+            ranking(
+                cube, SCORE_METRIC, year_range, countries,
+                scores=load_score_engine(), weights=weights, renormalize=renormalize,
+            ),
+            x="Total_Score",
+            y="Country_clean",
+            orientation="h",
+            color="Total_Score",
+            color_continuous_scale="Blues"
+        )
+
+        fig_rank.update_layout(
+            height=700,
+            yaxis=dict(categoryorder="total ascending")
+        )
+        return fig_rank
+
+    plotly_chart(figure(build))
+
+    st.caption(
+        "Total Score berfungsi sebagai alat screening pasar untuk mengidentifikasi negara dengan kombinasi "
+        "kapasitas belanja, stabilitas, dan konsistensi yang relevan bagi strategi masuk pasar avionik."
+    )
+
+
+section_rank(**score_inputs)
+
+# =========================
+# 🛠️ RANKING — MRO MARKET
+# =========================
+@chart_section("year_range", "countries")
+def section_mro_rank(figure, year_range, countries, version):
+    st.subheader("🔧 Ranking Negara Berdasarkan Potensi MRO")
+
+    def build():
+        fig_mro_rank = px.bar(
+            ranking(cube, "Estimated_MRO_USD", year_range, countries),
+            x="Estimated_MRO_USD",
+            y="Country_clean",
+            orientation="h",
+            color="Estimated_MRO_USD",
+            color_continuous_scale="Oranges",
+            labels={"Estimated_MRO_USD": "Rata-rata Estimasi MRO (USD)"}
+        )
+
+        fig_mro_rank.update_layout(
+            height=700,
+            yaxis=dict(categoryorder="total ascending")
+        )
+        return fig_mro_rank
+
+    plotly_chart(figure(build))
+
+    st.caption(
+        "Ranking ini menyoroti negara dengan potensi pasar sustainment terbesar. "
+        "Berbeda dengan pembelian alutsista baru, pasar MRO cenderung berulang, "
+        "lebih stabil, dan membuka peluang kemitraan jangka panjang."
+    )
+
+
+section_mro_rank(**inputs)
+
+# =========================
+# 🎚️ SENSITIVITAS MRO (sweep skenario)
+# =========================
+@chart_section("year_range", "countries")
+def section_mro_sensitivity(figure, year_range, countries, version):
+    st.subheader("🎚️ Sensitivitas Estimasi MRO")
+
+    col1, col2, col3 = st.columns(3)
+    base_range = col1.slider("Base MRO ratio", 0.05, 0.50, (0.10, 0.30), step=0.01)
+    old_range = col2.slider("Faktor alat tua (> 20 tahun)", 1.0, 2.0, (1.0, 1.6), step=0.05)
+    source = col3.radio("Sumber usia alat", ["column", "fixed"], horizontal=True,
+                        format_func=lambda s: "Armada (trade register)" if s == "column" else "Tetap 15 tahun")
+
+    def build():
+        # Grid 20 × 20 skenario dievaluasi dalam satu broadcast (lihat dashboard/mro.py)
+        base_ratios = np.linspace(*base_range, 20)
+        old_factors = np.linspace(*old_range, 20)
+        scenarios = [
+            make_scenario(base_ratio=b, age_default=a, equipment_age=source)
+            for a in old_factors for b in base_ratios
+        ]
+        engine = load_mro_engine()
+        totals = engine.totals(scenarios, year_range, countries).reshape(len(old_factors), len(base_ratios))
+
+        fig = px.imshow(
+            totals,
+            x=np.round(base_ratios, 3),
+            y=np.round(old_factors, 3),
+            origin="lower",
+            aspect="auto",
+            color_continuous_scale="Oranges",
+            labels={"x": "Base MRO ratio", "y": "Faktor alat tua", "color": "Total MRO (USD)"}
+        )
+        fig.update_layout(height=500)
+        return fig
+
+    plotly_chart(figure(build, f"{base_range}:{old_range}:{source}"))
+
+    st.caption(
+        "Setiap sel adalah satu skenario MRO (rasio dasar × faktor usia alat tua) atas negara dan tahun "
+        "yang dipilih. Skenario di-cache per hash, sehingga menggeser slider hanya menghitung skenario baru."
+    )
+
+
+section_mro_sensitivity(**inputs)
+
+# =========================
+# 5️⃣ HEATMAP — SCORE per TAHUN
+# =========================
+@chart_section("year_range", "countries", "weights", "renormalize")
+def section_heatmap(figure, year_range, countries, weights, renormalize, version):
+    st.subheader("🔥 Heatmap Total Score per Tahun")
+
+    def build():
+        fig_heatmap = px.imshow(
+            heatmap(
+                cube, SCORE_METRIC, year_range, countries,
+                scores=load_score_engine(), weights=weights, renormalize=renormalize,
+            ),
+            color_continuous_scale="YlGnBu",
+            aspect="auto"
+        )
+
+        fig_heatmap.update_layout(height=700)
+        return fig_heatmap
+
+    plotly_chart(figure(build))
+
+    st.caption(
+        "Heatmap menyoroti konsistensi performa belanja militer antarwaktu. "
+        "Negara dengan pola warna stabil lebih menarik bagi produk avionik "
+        "karena mencerminkan kesinambungan anggaran dan potensi kontrak berulang."
+    )
+
+
+section_heatmap(**score_inputs)
+
+# =========================
+# DATA TABLE
+# =========================
+st.subheader("📋 Data Detail (Filtered)")
+# Hanya jendela halaman yang dikirim ke browser; sort/filter/export di server
+with span("data_table", rows=len(df_filtered)):
+    paged_table(
+        df_filtered,
+        key="expenditure_table",
+        cache_key=(year_range, tuple(sorted(selected_countries)), version),
+        file_name="military_expenditure_filtered.csv",
+    )
+
+end_run()
@@ -0,0 +1,143 @@
+import json
+import os
+import threading
+import urllib.error
+import urllib.request
+from http.server import ThreadingHTTPServer
+
+import pytest
+
+from dashboard.api import QueryService, make_handler
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+# =========================
+# API: VALIDASI BODY REQUEST
+# =========================
+@pytest.fixture(scope="module")
+def api():
+    cwd = os.getcwd()
+    os.chdir(ROOT)
+    server = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(QueryService()))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    def post(path, body=None):
+        # body None → GET
+        request = urllib.request.Request(
+            f"http://127.0.0.1:{server.server_address[1]}{path}",
+            data=None if body is None else json.dumps(body).encode(),
+        )
+        try:
+            with urllib.request.urlopen(request) as response:
+                return response.status, json.load(response)
+        except urllib.error.HTTPError as exc:
+            return exc.code, json.load(exc)
+
+    yield post
+    server.shutdown()
+    os.chdir(cwd)
+
+
+@pytest.mark.parametrize("entries", [[1], ["kpis"], [{"query": "trade_summary"}, None]])
+def test_batch_rejects_non_object_entries(api, entries):
+    status, payload = api("/batch", {"requests": entries})
+    assert status == 400
+    assert len(payload["results"]) == len(entries)
+    for entry, result in zip(entries, payload["results"]):
+        assert (result is None) == isinstance(entry, dict)
+
+
+@pytest.mark.parametrize("path, body", [("/batch", {"requests": "kpis"}), ("/batch", [1]), ("/query", ["kpis"])])
+def test_malformed_body(api, path, body):
+    status, payload = api(path, body)
+    assert status == 400 and "error" in payload
+
+
+@pytest.mark.parametrize("query", ["kpis", "trade_summary"])
+@pytest.mark.parametrize(
+    "params",
+    [
+        {"year_range": [1990]},
+        {"year_range": "2015-2020"},
+        {"year_range": [2015.5, 2020]},
+        {"year_range": [2020, 2015]},
+        {"countries": "China"},
+        {"recipients": "China"},
+        {"countries": [1, 2]},
+    ],
+)
+def test_invalid_filters(api, query, params):
+    status, payload = api("/query", {"query": query, "params": params})
+    assert status == 400 and "error" in payload
+
+    # Satu entri invalid tidak menjatuhkan batch
+    status, payload = api("/batch", {"requests": [{"query": query, "params": params}, {"query": query}]})
+    assert status == 200
+    assert "error" in payload["results"][0] and "result" in payload["results"][1]
+
+
+def test_country_order_shares_cache_entry(api):
+    countries = ["China", "India", "Japan"]
+    _, first = api("/query", {"query": "kpis", "params": {"countries": countries}})
+    _, before = api("/health")
+    _, second = api("/query", {"query": "kpis", "params": {"countries": countries[::-1]}})
+    _, after = api("/health")
+    assert first == second
+    assert after["cache"]["hits"] == before["cache"]["hits"] + 1
+
+
+def test_batch_runs_valid_entries(api):
+    status, payload = api("/batch", {"requests": [{"query": "trade_summary"}, {"query": "nope"}]})
+    assert status == 200
+    assert "result" in payload["results"][0] and "error" in payload["results"][1]
+
+
+# =========================
+# API: TOTAL SCORE = HALAMAN (ScoreEngine)
+# =========================
+@pytest.fixture(scope="module")
+def engine():
+    import pandas as pd
+
+    from dashboard.scoring import ScoreEngine
+
+    return ScoreEngine(pd.read_csv(os.path.join(ROOT, "df_asia_final.csv")))
+
+
+@pytest.mark.parametrize("weights", [None, {"Score_Expenditure": 1, "Score_Politics": 1}])
+@pytest.mark.parametrize("renormalize", [False, True])
+def test_total_score_matches_engine(api, engine, weights, renormalize):
+    from dashboard.etl import SCORE_WEIGHTS
+
+    params = {"metric": "Total_Score", "year_range": [2015, 2022], "renormalize": renormalize}
+    if weights is not None:
+        params["weights"] = weights
+    status, payload = api("/query", {"query": "ranking", "params": params})
+    assert status == 200
+
+    expected = engine.ranking(weights or SCORE_WEIGHTS, (2015, 2022), renormalize=renormalize)
+    columns = payload["result"]["columns"]
+    served = {row[columns.index("Country_clean")]: row[columns.index("Total_Score")] for row in payload["result"]["data"]}
+    assert list(served) == expected["Country_clean"].tolist()
+    assert served == pytest.approx(dict(zip(expected["Country_clean"], expected["Total_Score"])))
+
+
+def test_weights_rejected_for_other_metrics(api):
+    status, payload = api("/query", {"query": "ranking", "params": {"metric": "Estimated_MRO_USD", "weights": {}}})
+    assert status == 400 and "error" in payload
+
+
+# =========================
+# API: RINGKASAN SELURUH REGISTER
+# =========================
+def test_register_summary_covers_full_register(api):
+    from dashboard.trade import read_trade_register
+
+    status, payload = api("/register_summary")
+    assert status == 200 and set(payload) == {"register_by_year", "register_by_recipient"}
+
+    rows = len(read_trade_register(os.path.join(ROOT, "trade-register-edited.csv")))
+    for summary in payload.values():
+        transactions = summary["columns"].index("transactions")
+        assert sum(row[transactions] for row in summary["data"]) == rows
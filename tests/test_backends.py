@@ -0,0 +1,61 @@
+import os
+
+import pandas as pd
+import pytest
+
+from dashboard.backends import DuckDBBackend, PandasBackend
+from dashboard.queries import AVIONICS_QUERIES
+from dashboard.shared import attach
+from dashboard.data import DATASETS
+
+duckdb = pytest.importorskip("duckdb")
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# =========================
+# PARITY BACKEND AVIONIK (pandas = referensi)
+# =========================
+# Kelima query harus identik (nilai & urutan baris) di semua rentang / filter penerima.
+QUERIES = [
+    ("trade_summary", {}),
+    ("yearly_trades", {}),
+    ("tiv_yearly", {}),
+    ("top_counts", {"column": "supplier"}),
+    ("top_counts", {"column": "recipient"}),
+    ("top_counts", {"column": "weapon_description"}),
+    ("mean_age_by", {"column": "recipient"}),
+    ("mean_age_by", {"column": "weapon_description"}),
+]
+YEAR_RANGES = [(1950, 2024), (1990, 2020), (2000, 2010), (2015, 2024)]
+RECIPIENTS = [None, ["india", "china"], ["saudi arabia", "japan", "south korea", "turkiye"]]
+
+
+@pytest.fixture(scope="module")
+def backends():
+    cwd = os.getcwd()
+    os.chdir(ROOT)
+    df = attach("avionics", *DATASETS["avionics"]())
+    os.chdir(cwd)
+    return PandasBackend(df), DuckDBBackend(df)
+
+
+def _plain(frame):
+    # Kategori pandas vs VARCHAR DuckDB: bandingkan sebagai teks, dtype angka diseragamkan
+    return frame.apply(
+        lambda col: col.astype(str) if not pd.api.types.is_numeric_dtype(col) else col.astype(float)
+    ).reset_index(drop=True)
+
+
+def test_all_queries_covered():
+    assert {name for name, _ in QUERIES} == set(AVIONICS_QUERIES)
+
+
+@pytest.mark.parametrize("name, params", QUERIES)
+@pytest.mark.parametrize("year_range", YEAR_RANGES)
+@pytest.mark.parametrize("recipients", RECIPIENTS)
+def test_duckdb_matches_pandas(backends, name, params, year_range, recipients):
+    reference, candidate = (b.query(name, year_range, recipients, **params) for b in backends)
+    if isinstance(reference, dict):
+        assert candidate == reference
+    else:
+        pd.testing.assert_frame_equal(_plain(candidate), _plain(reference), check_exact=True)
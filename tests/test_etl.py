@@ -0,0 +1,55 @@
+import os
+
+import pandas as pd
+import pytest
+
+from dashboard import etl
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+# =========================
+# PARITY ETL VS df_asia_final.csv
+# =========================
+# Metode default harus mereproduksi file yang di-commit: universe baris, urutan,
+# normalisasi growth (YoY mentah), skala politics, pct_GDP, GDP, dan kolom Country.
+@pytest.fixture(scope="module")
+def outputs(tmp_path_factory):
+    tmp = tmp_path_factory.mktemp("etl")
+    cwd, cache_dir = os.getcwd(), etl.ETL_CACHE_DIR
+    os.chdir(ROOT)
+    etl.ETL_CACHE_DIR = str(tmp / "cache")
+    try:
+        shipped = str(tmp / "shipped.csv")
+        etl.run_pipeline(shipped)
+        revised, _ = etl.run_pipeline(None, "revised")
+        yield pd.read_csv(shipped), revised, pd.read_csv(etl.SHIPPED_PATH)
+    finally:
+        etl.ETL_CACHE_DIR = cache_dir
+        os.chdir(cwd)
+
+
+def test_default_reproduces_shipped_csv(outputs):
+    shipped, _, reference = outputs
+    pd.testing.assert_frame_equal(shipped, reference, rtol=1e-9)
+
+
+def test_parity_report_clean(outputs):
+    shipped, _, _ = outputs
+    report = etl.parity_report(shipped, os.path.join(ROOT, etl.SHIPPED_PATH), rtol=1e-9)
+    assert report["rows_new"] == report["rows_reference"]
+    assert not report["only_new"] and not report["only_reference"]
+    assert report["differing_values"] == {}
+
+
+def test_growth_from_unclipped_yoy(outputs):
+    shipped, _, _ = outputs
+    expected = etl.min_max(shipped["Military_Expenditure_YoY"])
+    pd.testing.assert_series_equal(shipped["Score_Growth"], expected, check_names=False, rtol=1e-12)
+
+
+def test_revised_is_opt_in(outputs):
+    _, revised, reference = outputs
+    assert {"Brunei", "Türkiye"} <= set(revised["Country_clean"]) - set(reference["Country_clean"])
+    with pytest.raises(ValueError):
+        etl.run_pipeline(None, "legacy")
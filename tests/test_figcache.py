@@ -0,0 +1,89 @@
+import pytest
+from streamlit.testing.v1 import AppTest
+
+from dashboard import figcache
+
+
+# =========================
+# RENDER FIGURE CACHE: FALLBACK KE st.plotly_chart
+# =========================
+def _app():
+    import plotly.express as px
+
+    from dashboard.figcache import plotly_chart, serialize
+
+    cached = serialize(px.bar(x=["a", "b"], y=[1, 2]))
+    plotly_chart(cached, key="first")
+    plotly_chart(cached, key="second")
+
+
+def _broken_layout(**kwargs):
+    raise TypeError("unexpected keyword argument")
+
+
+def _broken_form_id(dg):
+    raise AttributeError("'DeltaGenerator' object has no attribute '_form_data'")
+
+
+def test_fast_path_renders(monkeypatch):
+    monkeypatch.setitem(figcache._fast_path, "enabled", True)
+    at = AppTest.from_function(_app).run()
+    assert not at.exception
+    assert len(at.get("plotly_chart")) == 2
+    assert figcache._fast_path["enabled"]
+
+
+@pytest.mark.parametrize("name, broken", [("LayoutConfig", _broken_layout), ("current_form_id", _broken_form_id)])
+def test_internal_api_change_falls_back(monkeypatch, name, broken):
+    monkeypatch.setitem(figcache._fast_path, "enabled", True)
+    monkeypatch.setattr(figcache, name, broken)
+    at = AppTest.from_function(_app).run()
+    assert not at.exception
+    assert len(at.get("plotly_chart")) == 2
+    assert not figcache._fast_path["enabled"]
+
+
+
+# =========================
+# JALUR CEPAT = st.plotly_chart (Streamlit yang dipin)
+# =========================
+def _fast_app():
+    import plotly.express as px
+
+    from dashboard.figcache import plotly_chart, serialize
+
+    plotly_chart(serialize(px.bar(x=["a", "b"], y=[1, 2], height=700)), key="chart")
+
+
+def _native_app():
+    import plotly.express as px
+    import streamlit as st
+
+    st.plotly_chart(px.bar(x=["a", "b"], y=[1, 2], height=700), width="stretch", key="chart")
+
+
+def test_fast_path_mirrors_plotly_chart(monkeypatch):
+    # Argumen id elemen & LayoutConfig yang dipakai jalur cepat harus sama persis dengan
+    # yang dipakai st.plotly_chart untuk figure yang sama
+    from streamlit.elements import plotly_chart as native
+
+    calls = {}
+
+    def record(name, original):
+        def wrapper(*args, **kwargs):
+            calls.setdefault(name, []).append((args, {k: v for k, v in kwargs.items() if k != "dg"}))
+            return original(*args, **kwargs)
+        return wrapper
+
+    monkeypatch.setitem(figcache._fast_path, "enabled", True)
+    for module, prefix in ((figcache, "fast"), (native, "native")):
+        monkeypatch.setattr(module, "compute_and_register_element_id", record(f"{prefix}_id", module.compute_and_register_element_id))
+        monkeypatch.setattr(module, "LayoutConfig", record(f"{prefix}_layout", module.LayoutConfig))
+
+    for app in (_fast_app, _native_app):
+        at = AppTest.from_function(app).run()
+        assert not at.exception
+
+    assert figcache._fast_path["enabled"]
+    assert calls["fast_id"] == calls["native_id"]
+    assert calls["fast_layout"] == calls["native_layout"]
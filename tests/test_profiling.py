@@ -0,0 +1,65 @@
+import os
+import tracemalloc
+
+from streamlit.testing.v1 import AppTest
+
+from dashboard import profiling
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PAGE = os.path.join(ROOT, "pages", "expenditure.py")
+
+
+# =========================
+# PROFILING: GATING, LIFECYCLE TRACEMALLOC, PUNCAK NESTED
+# =========================
+def _run_profiled(monkeypatch, mode, tmp_path):
+    monkeypatch.chdir(ROOT)
+    monkeypatch.setattr(profiling, "PROFILE_MODE", mode)
+    monkeypatch.setattr(profiling, "PROFILE_FILE", str(tmp_path / "spans.jsonl"))
+    at = AppTest.from_file(PAGE, default_timeout=300)
+    at.query_params["profile"] = "1"
+    return at.run()
+
+
+def test_query_param_ignored_without_env(monkeypatch, tmp_path):
+    at = _run_profiled(monkeypatch, "0", tmp_path)
+    assert not at.exception
+    assert not any(e.label == "⏱️ Profiling rerun" for e in at.sidebar.expander)
+    assert not tracemalloc.is_tracing()
+
+
+def test_tracing_stops_after_profiled_run(monkeypatch, tmp_path):
+    at = _run_profiled(monkeypatch, "query", tmp_path)
+    assert not at.exception
+    assert any(e.label == "⏱️ Profiling rerun" for e in at.sidebar.expander)
+    assert (tmp_path / "spans.jsonl").exists()
+    assert not tracemalloc.is_tracing()
+    assert profiling._active_runs == 0
+
+
+def test_parent_peak_includes_children():
+    trace = {"trace_id": "t", "spans": []}
+    stack = profiling._stack()
+    stack.clear()
+    profiling._acquire_tracing()
+    try:
+        stack.append(profiling._open_span(trace, "root", {}))
+        parent = profiling._open_span(trace, "parent", {})
+        stack.append(parent)
+        for size in (8_000_000, 2_000_000):
+            child = profiling._open_span(trace, "child", {})
+            stack.append(child)
+            block = bytearray(size)
+            del block
+            profiling._close_span(trace, stack.pop())
+        profiling._close_span(trace, stack.pop())
+        profiling._close_span(trace, stack.pop())
+    finally:
+        profiling._release_tracing()
+        stack.clear()
+
+    allocated = {s["span_id"]: s["attributes"].get("memory_allocated_bytes") for s in trace["spans"]}
+    children = [s for s in trace["spans"] if s["name"] == "child"]
+    assert children[0]["attributes"]["memory_allocated_bytes"] >= 8_000_000
+    assert allocated[parent["span_id"]] >= children[0]["attributes"]["memory_allocated_bytes"]
+    assert not tracemalloc.is_tracing()
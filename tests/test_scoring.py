@@ -0,0 +1,73 @@
+import itertools
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from dashboard.etl import SCORE_WEIGHTS, min_max
+from dashboard.scoring import CLIPPED_SCORE_COMPONENTS, SCORE_COMPONENTS, ScoreEngine
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+YEAR_RANGES = [(1951, 2024), (1960, 1960), (1975, 1990), (2001, 2017), (2015, 2022), (2020, 2030), (1900, 1950)]
+COUNTRIES = [None, ["China", "India"], ["Japan", "Nepal", "Vietnam"], ["Tidak Ada"]]
+
+
+@pytest.fixture(scope="module")
+def df():
+    return pd.read_csv(os.path.join(ROOT, "df_asia_final.csv"))
+
+
+@pytest.fixture(scope="module")
+def engine(df):
+    return ScoreEngine(df)
+
+
+def _subset(df, year_range, countries):
+    mask = df["Year"].between(*year_range)
+    if countries:
+        mask &= df["Country_clean"].isin(countries)
+    return df[mask]
+
+
+# =========================
+# DEFAULT = df_asia_final.csv
+# =========================
+def test_default_weights_reproduce_total_score(df, engine):
+    rows, totals = engine.scores(SCORE_WEIGHTS)
+    assert rows.all()
+    np.testing.assert_allclose(totals[:, 0], df["Total_Score"].to_numpy(), rtol=1e-12, equal_nan=True)
+
+
+def test_clipped_growth_is_opt_in(df):
+    _, scores = ScoreEngine(df, CLIPPED_SCORE_COMPONENTS).normalized()
+    growth = list(CLIPPED_SCORE_COMPONENTS).index("Score_Growth")
+    expected = min_max(df["Military_Expenditure_YoY_Clipped"])
+    np.testing.assert_allclose(scores[:, growth], expected.to_numpy(), rtol=1e-12)
+
+
+# =========================
+# SPARSE TABLE VS GROUPBY
+# =========================
+@pytest.mark.parametrize("year_range,countries", list(itertools.product(YEAR_RANGES, COUNTRIES)))
+def test_bounds_match_brute_force(df, engine, year_range, countries):
+    lo, hi = engine.bounds(year_range, countries)
+    subset = _subset(df, year_range, countries)
+    raw = [column for column, _ in SCORE_COMPONENTS.values()]
+    if subset.empty:
+        assert np.isinf(lo).all() or np.isnan(lo).all()
+        return
+    # min/max per negara lalu per subset, seperti penggabungan sel di sparse table
+    per_country = subset.groupby("Country_clean")[raw]
+    np.testing.assert_array_equal(lo, per_country.min().min().to_numpy())
+    np.testing.assert_array_equal(hi, per_country.max().max().to_numpy())
+
+
+@pytest.mark.parametrize("year_range,countries", list(itertools.product(YEAR_RANGES[:5], COUNTRIES[:3])))
+def test_renormalize_matches_brute_force(df, engine, year_range, countries):
+    rows, scores = engine.normalized(year_range, countries, renormalize=True)
+    subset = _subset(df, year_range, countries)
+    assert rows.sum() == len(subset)
+    for c, (raw, _) in enumerate(SCORE_COMPONENTS.values()):
+        np.testing.assert_allclose(scores[:, c], min_max(subset[raw]).to_numpy(), rtol=1e-12, atol=1e-15)
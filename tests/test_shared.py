@@ -0,0 +1,73 @@
+import os
+
+import pandas as pd
+import pytest
+
+from dashboard import shared
+
+
+@pytest.fixture
+def shared_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(shared, "SHARED_DIR", str(tmp_path))
+    monkeypatch.setattr(shared, "SHARED_KEEP", 2)
+    monkeypatch.setattr(shared, "_attached", {})
+    return tmp_path
+
+
+def _publish(stamp, mtime):
+    # mtime eksplisit: urutan versi tidak bergantung resolusi jam filesystem
+    path = shared.publish("frame", pd.DataFrame({"x": [1, 2]}), stamp)
+    os.utime(path, ns=(mtime, mtime))
+    return path
+
+
+def _stamps(shared_dir):
+    return sorted(name.split("-")[1].split(".")[0] for name in os.listdir(shared_dir))
+
+
+# =========================
+# PUBLISH: HANYA VERSI LEBIH LAMA YANG DIHAPUS
+# =========================
+def test_publish_keeps_latest_versions(shared_dir):
+    _publish("a", 1_000)
+    _publish("b", 2_000)
+    assert _stamps(shared_dir) == ["a", "b"]
+    shared.publish("frame", pd.DataFrame({"x": [3]}), "c")
+    assert _stamps(shared_dir) == ["b", "c"]
+
+
+def test_publish_keeps_newer_versions(shared_dir):
+    # Publish stamp lama yang selesai belakangan tidak menghapus versi yang lebih baru
+    future = 2**62
+    _publish("new", future)
+    _publish("newer", future + 1)
+    shared.publish("frame", pd.DataFrame({"x": [3]}), "old")
+    assert _stamps(shared_dir) == ["new", "newer", "old"]
+
+
+# =========================
+# LOAD: FILE HILANG DI ANTARA PUBLISH & MAP
+# =========================
+def test_load_retries_missing_file(shared_dir, monkeypatch):
+    real_map, misses = shared._map, []
+
+    def flaky_map(path):
+        if len(misses) < 2:
+            misses.append(path)
+            raise FileNotFoundError(path)
+        return real_map(path)
+
+    builds = []
+    monkeypatch.setattr(shared, "_map", flaky_map)
+    df = shared._load("frame", "s1", lambda: builds.append(1) or pd.DataFrame({"x": [1]}))
+    assert len(builds) == 1 and df["x"].tolist() == [1] and df.attrs["stamp"] == "s1"
+
+
+def test_load_serves_built_frame_when_file_keeps_disappearing(shared_dir, monkeypatch):
+    def gone(path):
+        raise FileNotFoundError(path)
+
+    monkeypatch.setattr(shared, "_map", gone)
+    df = shared._load("frame", "s1", lambda: pd.DataFrame({"x": [7]}))
+    assert df["x"].tolist() == [7] and df.attrs["stamp"] == "s1"
+    assert shared.attached_stamps() == {"frame": "s1"}
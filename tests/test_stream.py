@@ -0,0 +1,33 @@
+import os
+
+import pandas as pd
+import pytest
+
+from dashboard.stream import stream_avionics, summarize_register
+from dashboard.trade import AVIONICS_REF_PATH, TRADE_REGISTER_PATH, build_avionics_frame, read_avionics_reference, read_trade_register
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+# =========================
+# STREAMING = BACA PENUH
+# =========================
+# Batch kecil memaksa duplikat lintas batch; index (posisi baris mentah register) harus
+# sama dengan jalur non-streaming.
+@pytest.fixture(scope="module")
+def full():
+    register = read_trade_register(os.path.join(ROOT, TRADE_REGISTER_PATH))
+    return register, build_avionics_frame(register, read_avionics_reference(os.path.join(ROOT, AVIONICS_REF_PATH)))
+
+
+@pytest.mark.parametrize("chunk_rows", [500, 7919])
+def test_streamed_matches_full_read(full, chunk_rows):
+    register, df_av = full
+    streamed, summaries, stats = stream_avionics(
+        os.path.join(ROOT, TRADE_REGISTER_PATH), os.path.join(ROOT, AVIONICS_REF_PATH), chunk_rows
+    )
+    pd.testing.assert_frame_equal(streamed, df_av)
+    assert stats["rows"] == len(register)
+
+    for name, expected in summarize_register(register).items():
+        pd.testing.assert_frame_equal(summaries[name], expected)
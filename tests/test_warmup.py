@@ -0,0 +1,32 @@
+import threading
+
+from dashboard import warmup
+
+
+# =========================
+# THREAD REFRESH TAHAN ERROR
+# =========================
+def test_run_survives_failing_iterations(monkeypatch, caplog):
+    stop = threading.Event()
+    calls = []
+
+    def prewarm():
+        calls.append("prewarm")
+        if calls.count("prewarm") == 1:
+            raise OSError("sumber sedang ditulis")
+
+    def refresh_once():
+        calls.append("refresh")
+        if calls.count("refresh") == 3:
+            stop.set()
+        raise ValueError("stamp rusak")
+
+    monkeypatch.setattr(warmup, "REFRESH_SECONDS", 0)
+    monkeypatch.setattr(warmup, "prewarm", prewarm)
+    monkeypatch.setattr(warmup, "refresh_once", refresh_once)
+
+    warmup._run(stop)
+
+    # prewarm diulang sampai berhasil, lalu refresh tetap berjalan meski gagal
+    assert calls == ["prewarm", "prewarm", "refresh", "refresh", "refresh"]
+    assert sum("gagal" in record.getMessage() for record in caplog.records) == 4